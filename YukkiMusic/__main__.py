@@ -17,7 +17,16 @@ from config import BANNED_USERS
 from YukkiMusic import HELPABLE, LOGGER, app, userbot
 from YukkiMusic.core.call import Yukki
 from YukkiMusic.misc import sudo
-from YukkiMusic.utils.database import get_banned_users, get_gbanned
+from YukkiMusic.utils.database import (
+    assistant_members,
+    get_banned_users,
+    get_gbanned,
+    settings,
+    stats_writer,
+)
+from YukkiMusic.utils.extractor import extractor
+from YukkiMusic.utils.httpclient import http
+from YukkiMusic.utils.mediacache import mediacache
 
 logger = LOGGER("YukkiMusic")
 loop = asyncio.get_event_loop()
@@ -40,6 +49,10 @@ async def init():
             BANNED_USERS.add(user_id)
     except Exception:
         pass
+    try:
+        await settings.load()
+    except Exception as e:
+        logger.warning(f"Could not preload chat settings: {e}")
     await sudo()
     await app.start()
     for mod in app.load_plugins_from("YukkiMusic/plugins"):
@@ -78,6 +91,11 @@ async def init():
 
     LOGGER("YukkiMusic.plugins").info("Successfully Imported All Modules ")
     await userbot.start()
+    try:
+        await assistant_members.load()
+    except Exception as e:
+        logger.warning(f"Could not load assistant chat index: {e}")
+    refresh = asyncio.create_task(assistant_members.refresh())
     await Yukki.start()
     LOGGER("YukkiMusic").info("Assistant Started Sucessfully")
     try:
@@ -93,6 +111,14 @@ async def init():
     await Yukki.decorators()
     LOGGER("YukkiMusic").info("YukkiMusic Started Successfully")
     await idle()
+    refresh.cancel()
+    try:
+        await stats_writer.close()
+    except Exception as e:
+        logger.warning(f"Failed to save play stats: {e}")
+    await http.close()
+    await extractor.close()
+    mediacache.close()
     await app.stop()
     await userbot.stop()
     await Yukki.stop()
@@ -34,13 +34,17 @@ from pytgcalls.types import (
 import config
 from strings import get_string
 from YukkiMusic import app, userbot
+from YukkiMusic.core.callmembers import CallMembersCache
 from YukkiMusic.core.userbot import assistants
 from YukkiMusic.misc import db
 from YukkiMusic.platforms import saavn, youtube
 from YukkiMusic.utils import fallback
+from YukkiMusic.utils.cache import TTLCache
 from YukkiMusic.utils.database import (
     add_active_chat,
     add_active_video_chat,
+    assistant_members,
+    assistant_scheduler,
     get_active_chats,
     get_assistant,
     get_audio_bitrate,
@@ -49,17 +53,25 @@ from YukkiMusic.utils.database import (
     get_video_bitrate,
     group_assistant,
     music_on,
+    pause_clock,
+    rebalance_assistant,
     remove_active_chat,
     remove_active_video_chat,
+    resume_clock,
     set_assistant,
     set_loop,
+    start_clock,
+    stop_clock,
 )
 from YukkiMusic.utils.exceptions import AssistantErr
 from YukkiMusic.utils.inline.play import stream_markup, telegram_markup
 from YukkiMusic.utils.stream.autoclear import auto_clean
+from YukkiMusic.utils.stream.models import ChatQueue, Source
+from YukkiMusic.utils.stream.prefetch import prefetcher
+from YukkiMusic.utils.stream.progress import progress
 from YukkiMusic.utils.thumbnails import gen_thumb
 
-links = {}
+links = TTLCache(1024, 3600)
 logger = logging.getLogger(__name__)
 
 
@@ -67,15 +79,20 @@ async def _clear_(chat_id):
     popped = db.pop(chat_id, None)
     if popped:
         await auto_clean(popped)
-    db[chat_id] = []
+    db[chat_id] = ChatQueue()
     await remove_active_video_chat(chat_id)
     await remove_active_chat(chat_id)
+    await stop_clock(chat_id)
+    progress.discard(chat_id)
+    prefetcher.cancel(chat_id)
+    Yukki.members.invalidate(chat_id)
     await set_loop(chat_id, 0)
 
 
 class Call:
     def __init__(self):
         self.calls = []
+        self.members = CallMembersCache()
 
         for client in userbot.clients:
             pycall = PyTgCalls(
@@ -87,10 +104,12 @@ class Call:
     async def pause_stream(self, chat_id: int):
         assistant = await group_assistant(self, chat_id)
         await assistant.pause(chat_id)
+        await pause_clock(chat_id)
 
     async def resume_stream(self, chat_id: int):
         assistant = await group_assistant(self, chat_id)
         await assistant.resume(chat_id)
+        await resume_clock(chat_id)
 
     async def mute_stream(self, chat_id: int):
         assistant = await group_assistant(self, chat_id)
@@ -120,6 +139,9 @@ class Call:
             pass
         await remove_active_video_chat(chat_id)
         await remove_active_chat(chat_id)
+        await stop_clock(chat_id)
+        progress.discard(chat_id)
+        prefetcher.cancel(chat_id)
         try:
             await assistant.leave_call(chat_id)
         except Exception:
@@ -157,6 +179,8 @@ class Call:
             )
 
         await assistant.play(chat_id, stream, config=call_config)
+        await start_clock(chat_id)
+        prefetcher.schedule(chat_id)
 
     async def seek_stream(self, chat_id, file_path, to_seek, duration, mode):
         assistant = await group_assistant(self, chat_id)
@@ -191,9 +215,12 @@ class Call:
         await asyncio.sleep(0.5)
         await assistant.leave_call(config.LOG_GROUP_ID)
 
-    async def join_chat(self, chat_id, attempts=1):
+    async def join_chat(self, chat_id, attempts=1, checked=False):
         max_attempts = len(assistants) - 1
         userbot = await get_assistant(chat_id)
+        number = assistant_scheduler.number(userbot)
+        if not checked and assistant_members.is_member(number, chat_id):
+            return
         try:
             language = await get_lang(chat_id)
             _ = get_string(language)
@@ -209,6 +236,8 @@ class Call:
                     await app.unban_chat_member(chat_id, userbot.id)
                 except Exception:
                     raise AssistantErr(_["call_2"].format(userbot.username, userbot.id))
+            elif get.status != ChatMemberStatus.LEFT:
+                return await assistant_members.add(number, chat_id)
         except UserNotParticipant:
             pass
         try:
@@ -217,9 +246,8 @@ class Call:
             raise AssistantErr(_["call_1"])
         except Exception as e:
             raise AssistantErr(_["call_3"].format(app.mention, type(e).__name__))
-        if chat_id in links:
-            invitelink = links[chat_id]
-        else:
+        invitelink = links.get(chat_id)
+        if invitelink is None:
             if chat.username:
                 invitelink = chat.username
                 try:
@@ -240,21 +268,24 @@ class Call:
                 invitelink = invitelink.replace(
                     "https://t.me/+", "https://t.me/joinchat/"
                 )
-            links[chat_id] = invitelink
+            links.set(chat_id, invitelink)
 
         try:
             await asyncio.sleep(1)
             await userbot.join_chat(invitelink)
+            await assistant_members.add(number, chat_id)
         except InviteRequestSent:
             try:
                 await app.approve_chat_join_request(chat_id, userbot.id)
             except Exception as e:
                 raise AssistantErr(_["call_3"].format(type(e).__name__))
+            await assistant_members.add(number, chat_id)
             await asyncio.sleep(1)
             # raise AssistantErr(_["call_6"].format(app.mention))
         except UserAlreadyParticipant:
-            pass
+            await assistant_members.add(number, chat_id)
         except ChannelsTooMuch:
+            assistant_scheduler.penalize(number, assistant_scheduler.full_penalty)
             if attempts <= max_attempts:
                 attempts += 1
                 userbot = await set_assistant(chat_id)
@@ -263,10 +294,11 @@ class Call:
                 raise AssistantErr(_["call_9"].format(config.SUPPORT_GROUP))
         except FloodWait as e:
             time = e.value
+            assistant_scheduler.penalize(number, time)
             if time < 20:
                 await asyncio.sleep(time)
                 attempts += 1
-                return await self.join_chat(chat_id, attempts)
+                return await self.join_chat(chat_id, attempts, checked=True)
             else:
                 if attempts <= max_attempts:
                     attempts += 1
@@ -275,6 +307,7 @@ class Call:
 
                 raise AssistantErr(_["call_10"].format(time))
         except Exception as e:
+            links.pop(chat_id)
             raise AssistantErr(_["call_3"].format(type(e).__name__))
 
     async def join_call(
@@ -285,7 +318,15 @@ class Call:
         video: bool | str = None,
         image: bool | str = None,
     ):
+        await group_assistant(self, chat_id)
+        await rebalance_assistant(chat_id)
         assistant = await group_assistant(self, chat_id)
+        number = self.calls.index(assistant) + 1
+        indexed = assistant_members.is_member(number, chat_id)
+        if not indexed:
+            await self.join_chat(chat_id, checked=True)
+            # Joining may have moved the chat to another assistant.
+            assistant = await group_assistant(self, chat_id)
         audio_stream_quality = await get_audio_bitrate(chat_id)
         video_stream_quality = await get_video_bitrate(chat_id)
         call_config = GroupCallConfig(auto_start=False)
@@ -317,7 +358,14 @@ class Call:
             )
         except Exception:
             traceback.print_exc()
-            await self.join_chat(chat_id)
+            if not indexed:
+                raise AssistantErr(
+                    "**No Active Voice Chat Found**\n\nPlease make sure group's voice chat is enabled. If already enabled, please end it and start fresh voice chat again and if the problem continues, try /restart"
+                )
+            # The index may be stale; check membership the slow way.
+            await assistant_members.remove(number, chat_id)
+            await self.join_chat(chat_id, checked=True)
+            assistant = await group_assistant(self, chat_id)
             try:
                 await assistant.play(
                     chat_id,
@@ -340,6 +388,9 @@ class Call:
             )
         await add_active_chat(chat_id)
         await music_on(chat_id)
+        await start_clock(chat_id)
+        prefetcher.schedule(chat_id)
+        progress.schedule(chat_id, progress.interval)
         if video:
             await add_active_video_chat(chat_id)
 
@@ -355,9 +406,9 @@ class Call:
                 await set_loop(chat_id, loop)
             if popped:
                 await auto_clean(popped)
-                if popped.get("mystic"):
+                if popped.mystic:
                     try:
-                        await popped.get("mystic").delete()
+                        await popped.mystic.delete()
                     except Exception:
                         pass
             if not check:
@@ -370,21 +421,20 @@ class Call:
             except Exception:
                 return
         else:
-            queued = check[0]["file"]
+            queued = check[0].file
             language = await get_lang(chat_id)
             _ = get_string(language)
-            title = (check[0]["title"]).title()
-            user = check[0]["by"]
-            original_chat_id = check[0]["chat_id"]
-            streamtype = check[0]["streamtype"]
+            title = (check[0].title).title()
+            user = check[0].by
+            original_chat_id = check[0].chat_id
+            streamtype = check[0].streamtype
             audio_stream_quality = await get_audio_bitrate(chat_id)
             video_stream_quality = await get_video_bitrate(chat_id)
-            videoid = check[0]["vidid"]
-            check[0].get("user_id")
-            check[0]["played"] = 0
-            video = True if str(streamtype) == "video" else False
+            videoid = check[0].vidid
+            source = check[0].source
+            video = check[0].video
             call_config = GroupCallConfig(auto_start=False)
-            if "live_" in queued:
+            if source is Source.LIVE:
                 n, link = await youtube.video(videoid, True)
                 if n == 0:
                     return await app.send_message(
@@ -418,10 +468,14 @@ class Call:
                 try:
                     await client.play(chat_id, stream, config=call_config)
                 except Exception:
+                    # The cached link may have been rejected, fetch a new one next time.
+                    youtube.invalidate_url(videoid, True)
                     return await app.send_message(
                         original_chat_id,
                         text=_["call_7"],
                     )
+                await start_clock(chat_id)
+                prefetcher.schedule(chat_id)
                 img = await gen_thumb(videoid)
                 button = telegram_markup(_, chat_id)
                 run = await app.send_photo(
@@ -430,14 +484,14 @@ class Call:
                     caption=_["stream_1"].format(
                         title[:27],
                         f"https://t.me/{app.username}?start=info_{videoid}",
-                        check[0]["dur"],
+                        check[0].dur,
                         user,
                     ),
                     reply_markup=InlineKeyboardMarkup(button),
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "tg"
-            elif "vid_" in queued:
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "tg"
+            elif source is Source.YOUTUBE:
                 mystic = await app.send_message(original_chat_id, _["call_8"])
                 flink = f"https://t.me/{app.username}?start=info_{videoid}"
                 thumbnail = None
@@ -451,7 +505,7 @@ class Call:
                         title = _data.get("title", title)
                         thumbnail = _data.get("thumb")
                         flink = _data.get("url", flink)
-                        check[0]["dur"] = _data.get("duration_min", check[0]["dur"])
+                        check[0].dur = _data.get("duration_min", check[0].dur)
                     else:
                         try:
                             file_path, direct = await youtube.download(
@@ -464,12 +518,13 @@ class Call:
                             youtube.use_fallback = True
                             file_path, _data, video = await fallback.download(
                                 title[:12],
-                                video=(True if str(streamtype) == "video" else False),
+                                video=check[0].video,
                             )
+                            direct = None
                             title = _data.get("title", title)
                             thumbnail = _data.get("thumb")
                             flink = _data.get("url", flink)
-                            check[0]["dur"] = _data.get("duration_min", check[0]["dur"])
+                            check[0].dur = _data.get("duration_min", check[0].dur)
                 except Exception:
                     return await mystic.edit_text(
                         _["call_7"], disable_web_page_preview=True
@@ -502,10 +557,15 @@ class Call:
                 try:
                     await client.play(chat_id, stream, config=call_config)
                 except Exception:
+                    if not direct:
+                        # The direct link may have been rejected.
+                        youtube.invalidate_url(videoid, True)
                     return await app.send_message(
                         original_chat_id,
                         text=_["call_7"],
                     )
+                await start_clock(chat_id)
+                prefetcher.schedule(chat_id)
                 img = await gen_thumb(videoid, thumbnail)
                 button = stream_markup(_, videoid, chat_id)
                 await mystic.delete()
@@ -515,14 +575,14 @@ class Call:
                     caption=_["stream_1"].format(
                         title[:27],
                         flink,
-                        check[0]["dur"],
+                        check[0].dur,
                         user,
                     ),
                     reply_markup=InlineKeyboardMarkup(button),
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "stream"
-            elif "index_" in queued:
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "stream"
+            elif source is Source.INDEX:
                 stream = (
                     MediaStream(
                         videoid,
@@ -543,6 +603,8 @@ class Call:
                         original_chat_id,
                         text=_["call_7"],
                     )
+                await start_clock(chat_id)
+                prefetcher.schedule(chat_id)
                 button = telegram_markup(_, chat_id)
                 run = await app.send_photo(
                     original_chat_id,
@@ -550,17 +612,14 @@ class Call:
                     caption=_["stream_2"].format(user),
                     reply_markup=InlineKeyboardMarkup(button),
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "tg"
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "tg"
             else:
-                url = check[0].get("url")
-                if videoid == "telegram":
-                    image = None
-                elif videoid == "soundcloud":
+                url = check[0].url
+                if source in (Source.TELEGRAM, Source.SOUNDCLOUD):
                     image = None
-
-                elif "saavn" in videoid:
-                    url = check[0].get("url")
+                elif source is Source.SAAVN:
+                    url = check[0].url
                     details = await saavn.info(url)
                     image = details["thumb"]
                 else:
@@ -595,7 +654,9 @@ class Call:
                         original_chat_id,
                         text=_["call_7"],
                     )
-                if videoid == "telegram":
+                await start_clock(chat_id)
+                prefetcher.schedule(chat_id)
+                if source is Source.TELEGRAM:
                     button = telegram_markup(_, chat_id)
                     run = await app.send_photo(
                         original_chat_id,
@@ -605,34 +666,34 @@ class Call:
                             else config.TELEGRAM_VIDEO_URL
                         ),
                         caption=_["stream_1"].format(
-                            title, config.SUPPORT_GROUP, check[0]["dur"], user
+                            title, config.SUPPORT_GROUP, check[0].dur, user
                         ),
                         reply_markup=InlineKeyboardMarkup(button),
                     )
-                    db[chat_id][0]["mystic"] = run
-                    db[chat_id][0]["markup"] = "tg"
-                elif videoid == "soundcloud":
+                    db[chat_id][0].mystic = run
+                    db[chat_id][0].markup = "tg"
+                elif source is Source.SOUNDCLOUD:
                     button = telegram_markup(_, chat_id)
                     run = await app.send_photo(
                         original_chat_id,
                         photo=config.SOUNCLOUD_IMG_URL,
                         caption=_["stream_1"].format(
-                            title, config.SUPPORT_GROUP, check[0]["dur"], user
+                            title, config.SUPPORT_GROUP, check[0].dur, user
                         ),
                         reply_markup=InlineKeyboardMarkup(button),
                     )
-                    db[chat_id][0]["mystic"] = run
-                    db[chat_id][0]["markup"] = "tg"
-                elif "saavn" in videoid:
+                    db[chat_id][0].mystic = run
+                    db[chat_id][0].markup = "tg"
+                elif source is Source.SAAVN:
                     button = telegram_markup(_, chat_id)
                     run = await app.send_photo(
                         original_chat_id,
                         photo=image,
-                        caption=_["stream_1"].format(title, url, check[0]["dur"], user),
+                        caption=_["stream_1"].format(title, url, check[0].dur, user),
                         reply_markup=InlineKeyboardMarkup(button),
                     )
-                    db[chat_id][0]["mystic"] = run
-                    db[chat_id][0]["markup"] = "tg"
+                    db[chat_id][0].mystic = run
+                    db[chat_id][0].markup = "tg"
 
                 else:
                     img = await gen_thumb(videoid)
@@ -643,13 +704,13 @@ class Call:
                         caption=_["stream_1"].format(
                             title[:27],
                             f"https://t.me/{app.username}?start=info_{videoid}",
-                            check[0]["dur"],
+                            check[0].dur,
                             user,
                         ),
                         reply_markup=InlineKeyboardMarkup(button),
                     )
-                    db[chat_id][0]["mystic"] = run
-                    db[chat_id][0]["markup"] = "stream"
+                    db[chat_id][0].mystic = run
+                    db[chat_id][0].markup = "stream"
 
     async def ping(self):
         pings = []
@@ -679,6 +740,8 @@ class Call:
             async def stream_services_handler(client, update: ChatUpdate):
                 await self.stop_stream(update.chat_id)
 
+            call.on_update(filters.call_participant())(self.members.on_participant)
+
             @call.on_update(filters.stream_end())
             async def stream_end_handler(client, update: StreamEnded):
                 if not update.stream_type == StreamEnded.Type.AUDIO:
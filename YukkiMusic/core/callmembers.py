@@ -0,0 +1,103 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import time
+from types import SimpleNamespace
+
+from pytgcalls.types import GroupCallParticipant, UpdatedGroupCallParticipant
+
+
+class _EventMember:
+    """Call member known only from a participant update."""
+
+    __slots__ = ("chat", "is_muted", "can_self_unmute")
+
+    def __init__(self, participant):
+        self.chat = SimpleNamespace(id=participant.user_id)
+        self.is_muted = participant.muted
+        self.can_self_unmute = not participant.muted_by_admin
+
+
+class CallMembersCache:
+    """
+    Snapshots of voice chat members, shared by every consumer.
+
+    Concurrent lookups for the same chat wait on a single in-flight fetch.
+    Participant updates from PyTgCalls are applied to the cached snapshot
+    by user id, so a busy call does not have to be fetched again; a
+    snapshot that saw no update for ``ttl`` seconds is fetched again. Each
+    update or invalidation bumps the chat's generation, and a fetch that
+    started in an older generation is not cached.
+
+    Bot modules are imported where they are used, so this module only
+    needs PyTgCalls to load.
+    """
+
+    def __init__(self, ttl: float = 5):
+        self.ttl = ttl
+        self._members = {}
+        self._inflight = {}
+        self._generation = {}
+
+    async def _fetch(self, chat_id: int) -> list:
+        from YukkiMusic.utils.database import get_assistant
+
+        generation = self._generation.get(chat_id, 0)
+        userbot = await get_assistant(chat_id)
+        members = []
+        async for member in userbot.get_call_members(chat_id):
+            if member is None:
+                continue
+            members.append(member)
+        if self._generation.get(chat_id, 0) == generation:
+            self._members[chat_id] = (time.monotonic(), members)
+
+    async def on_participant(self, client, update: UpdatedGroupCallParticipant):
+        """PyTgCalls handler for ``filters.call_participant()`` updates."""
+        self.update(update.chat_id, update.participant, update.action)
+        return members
+
+    async def get(self, chat_id: int) -> list:
+        cached = self._members.get(chat_id)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+        task = self._inflight.get(chat_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(chat_id))
+            self._inflight[chat_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(chat_id, None))
+        return await asyncio.shield(task)
+
+    def invalidate(self, chat_id: int):
+        self._generation[chat_id] = self._generation.get(chat_id, 0) + 1
+        self._members.pop(chat_id, None)
+
+    def update(self, chat_id: int, participant, action):
+        self._generation[chat_id] = self._generation.get(chat_id, 0) + 1
+        cached = self._members.get(chat_id)
+        if cached is None:
+            return
+        user_id = participant.user_id
+        members = [m for m in cached[1] if m.chat.id != user_id]
+        if action == GroupCallParticipant.Action.JOINED:
+            members.append(_EventMember(participant))
+        elif action == GroupCallParticipant.Action.UPDATED:
+            old = next((m for m in cached[1] if m.chat.id == user_id), None)
+            if old is None:
+                old = _EventMember(participant)
+            else:
+                old.is_muted = participant.muted
+                old.can_self_unmute = not participant.muted_by_admin
+            members.append(old)
+        self._members[chat_id] = (time.monotonic(), members)
+
+    async def on_participant(self, client, update: UpdatedGroupCallParticipant):
+        """PyTgCalls handler for ``filters.call_participant()`` updates."""
+        self.update(update.chat_id, update.participant, update.action)
@@ -10,10 +10,11 @@
 
 import re
 
-import aiohttp
 from bs4 import BeautifulSoup
 from py_yt import VideosSearch
 
+from YukkiMusic.utils.httpclient import http
+
 
 class Apple:
     def __init__(self):
@@ -29,11 +30,10 @@ class Apple:
     async def track(self, url, playid: bool | str = None):
         if playid:
             url = self.base + url
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    return False
-                html = await response.text()
+        async with http.get(url) as response:
+            if response.status != 200:
+                return False
+            html = await response.text()
         soup = BeautifulSoup(html, "html.parser")
         search = None
         for tag in soup.find_all("meta"):
@@ -61,11 +61,10 @@ class Apple:
         if playid:
             url = self.base + url
         playlist_id = url.split("playlist/")[1]
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    return False
-                html = await response.text()
+        async with http.get(url) as response:
+            if response.status != 200:
+                return False
+            html = await response.text()
         soup = BeautifulSoup(html, "html.parser")
         applelinks = soup.find_all("meta", attrs={"property": "music:song"})
         results = []
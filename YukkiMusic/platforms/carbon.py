@@ -11,10 +11,10 @@ import os
 import random
 
 import aiofiles
-import aiohttp
 from aiohttp import client_exceptions
 
 from YukkiMusic.utils.exceptions import UnableToFetchCarbon
+from YukkiMusic.utils.httpclient import http
 
 themes = [
     "3024-night",
@@ -85,31 +85,29 @@ class Carbon:
         self.watermark = False
 
     async def generate(self, text: str, user_id):
-        async with aiohttp.ClientSession(
-            headers={"Content-Type": "application/json"},
-        ) as ses:
-            params = {
-                "code": text,
-            }
-            params["backgroundColor"] = random.choice(colour)
-            params["theme"] = random.choice(themes)
-            params["dropShadow"] = self.drop_shadow
-            params["dropShadowOffsetY"] = self.drop_shadow_offset
-            params["dropShadowBlurRadius"] = self.drop_shadow_blur
-            params["fontFamily"] = self.font_family
-            params["language"] = self.language
-            params["watermark"] = self.watermark
-            params["widthAdjustment"] = self.width_adjustment
-            try:
-                request = await ses.post(
-                    "https://carbonara.solopov.dev/api/cook",
-                    json=params,
-                )
-            except client_exceptions.ClientConnectorError:
-                raise UnableToFetchCarbon("Can not reach the Host!")
-            resp = await request.read()
-            os.makedirs("cache", exist_ok=True)
+        params = {
+            "code": text,
+        }
+        params["backgroundColor"] = random.choice(colour)
+        params["theme"] = random.choice(themes)
+        params["dropShadow"] = self.drop_shadow
+        params["dropShadowOffsetY"] = self.drop_shadow_offset
+        params["dropShadowBlurRadius"] = self.drop_shadow_blur
+        params["fontFamily"] = self.font_family
+        params["language"] = self.language
+        params["watermark"] = self.watermark
+        params["widthAdjustment"] = self.width_adjustment
+        try:
+            async with http.post(
+                "https://carbonara.solopov.dev/api/cook",
+                json=params,
+                retries=http.retries,
+            ) as request:
+                resp = await request.read()
+        except client_exceptions.ClientConnectorError:
+            raise UnableToFetchCarbon("Can not reach the Host!")
+        os.makedirs("cache", exist_ok=True)
 
-            async with aiofiles.open(f"cache/carbon{user_id}.jpg", "wb") as f:
-                await f.write(resp)
-            return os.path.realpath(f.name)
+        async with aiofiles.open(f"cache/carbon{user_id}.jpg", "wb") as f:
+            await f.write(resp)
+        return os.path.realpath(f.name)
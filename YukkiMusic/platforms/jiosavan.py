@@ -12,12 +12,12 @@ import os
 from io import BytesIO
 
 import aiofiles
-import aiohttp
 import yt_dlp
 from PIL import Image
 
 from config import seconds_to_time
 from YukkiMusic.utils.decorators import asyncify
+from YukkiMusic.utils.httpclient import http
 
 
 class Saavn:
@@ -71,51 +71,49 @@ class Saavn:
     async def info(self, url):
         url = self.clean_url(url)
 
-        async with aiohttp.ClientSession() as session:
-            if "jiosaavn.com" in url:
-                api_url = "https://saavn.dev/api/songs"
-                params = {"link": url, "limit": 1}
-            else:
-                api_url = "https://saavn.dev/api/search/songs"
-                params = {"query": url, "limit": 1}
-
-            async with session.get(api_url, params=params) as response:
-                data = await response.json()
-
-                if "jiosaavn.com" in url:
-                    info = data["data"][0]  # For Saavn URLs
-                else:
-                    info = data["data"]["results"][0]  # For search queries
-
-                thumb_url = info["image"][-1]["url"]
-                thumb_path = await self._resize_thumb(thumb_url, info["id"])
-
-                return {
-                    "title": info["name"],
-                    "duration_sec": info.get("duration", 0),
-                    "duration_min": seconds_to_time(info.get("duration", 0)),
-                    "thumb": thumb_path,
-                    "url": self.clean_url(info["url"]),
-                    "_download_url": info["downloadUrl"][-1]["url"],
-                    "_id": info["id"],
-                }
+        if "jiosaavn.com" in url:
+            api_url = "https://saavn.dev/api/songs"
+            params = {"link": url, "limit": 1}
+        else:
+            api_url = "https://saavn.dev/api/search/songs"
+            params = {"query": url, "limit": 1}
+
+        async with http.get(api_url, params=params) as response:
+            data = await response.json()
+
+        if "jiosaavn.com" in url:
+            info = data["data"][0]  # For Saavn URLs
+        else:
+            info = data["data"]["results"][0]  # For search queries
+
+        thumb_url = info["image"][-1]["url"]
+        thumb_path = await self._resize_thumb(thumb_url, info["id"])
+
+        return {
+            "title": info["name"],
+            "duration_sec": info.get("duration", 0),
+            "duration_min": seconds_to_time(info.get("duration", 0)),
+            "thumb": thumb_path,
+            "url": self.clean_url(info["url"]),
+            "_download_url": info["downloadUrl"][-1]["url"],
+            "_id": info["id"],
+        }
 
     async def download(self, url):
         details = await self.info(url)
         file_path = os.path.join("downloads", f"Saavn_{details['_id']}.mp3")
 
         if not os.path.exists(file_path):
-            async with aiohttp.ClientSession() as session:
-                async with session.get(details["_download_url"]) as resp:
-                    if resp.status == 200:
-                        async with aiofiles.open(file_path, "wb") as f:
-                            while chunk := await resp.content.read(1024):
-                                await f.write(chunk)
-                        print(f"Downloaded: {file_path}")
-                    else:
-                        raise ValueError(
-                            f"Failed to download {details['_download_url']}. HTTP Status: {resp.status}"
-                        )
+            async with http.get(details["_download_url"]) as resp:
+                if resp.status == 200:
+                    async with aiofiles.open(file_path, "wb") as f:
+                        while chunk := await resp.content.read(1024):
+                            await f.write(chunk)
+                    print(f"Downloaded: {file_path}")
+                else:
+                    raise ValueError(
+                        f"Failed to download {details['_download_url']}. HTTP Status: {resp.status}"
+                    )
 
         details["filepath"] = file_path
         return file_path, details
@@ -126,9 +124,8 @@ class Saavn:
         if os.path.exists(thumb_path):
             return thumb_path
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(thumb_url) as response:
-                img_data = await response.read()
+        async with http.get(thumb_url) as response:
+            img_data = await response.read()
 
         img = Image.open(BytesIO(img_data))
         scale_factor = size[1] / img.height
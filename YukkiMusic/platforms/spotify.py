@@ -8,6 +8,7 @@
 # All rights reserved.
 #
 
+import asyncio
 import re
 
 import spotipy
@@ -15,7 +16,13 @@ from py_yt import VideosSearch
 from spotipy.oauth2 import SpotifyClientCredentials
 
 import config
+from YukkiMusic.utils.database.spotifymap import spotifymap
 from YukkiMusic.utils.decorators import asyncify
+from YukkiMusic.utils.formatters import time_to_seconds
+
+# Minimum duration match for a search result to be remembered.
+MIN_CONFIDENCE = 0.9
+RESOLVE_WORKERS = 8
 
 
 class Spotify:
@@ -32,6 +39,7 @@ class Spotify:
             )
         else:
             self.spotify = None
+        self._learning = set()
 
     async def valid(self, link: str):
         if re.search(self.regex, link):
@@ -39,69 +47,168 @@ class Spotify:
         else:
             return False
 
-    async def track(self, link: str):
-        track = self.spotify.track(link)
+    @staticmethod
+    def _entry(track: dict) -> dict | None:
+        if not track or not track.get("name"):
+            return None
         info = track["name"]
         for artist in track["artists"]:
             fetched = f" {artist['name']}"
             if "Various Artists" not in fetched:
                 info += fetched
-        results = VideosSearch(info, limit=1)
-        for result in (await results.next())["result"]:
-            ytlink = result["link"]
-            title = result["title"]
-            vidid = result["id"]
-            duration_min = result["duration"]
-            thumbnail = result["thumbnails"][0]["url"].split("?")[0]
+        return {
+            "id": track.get("id"),
+            "isrc": (track.get("external_ids") or {}).get("isrc"),
+            "query": info,
+            "duration": track.get("duration_ms", 0) // 1000,
+        }
+
+    def _items(self, page: dict) -> list:
+        items = list(page["items"])
+        while page.get("next"):
+            page = self.spotify.next(page)
+            items.extend(page["items"])
+        return items
+
+    @staticmethod
+    def _score(entry: dict, result: dict) -> float:
+        if not entry["duration"] or not result["duration"]:
+            return 0.0
+        diff = abs(int(time_to_seconds(result["duration"])) - entry["duration"])
+        return max(0.0, 1 - diff / entry["duration"])
+
+    async def _search(self, entry: dict) -> tuple[dict, float]:
+        """Best YouTube result for a track, scored by how well durations match."""
+        results = (await VideosSearch(entry["query"], limit=5).next())["result"]
+        if not results:
+            raise ValueError(f"No results found for {entry['query']}")
+        # Earlier results win ties, so a missing duration keeps the old pick.
+        confidence, _, result = max(
+            (self._score(entry, result), -index, result)
+            for index, result in enumerate(results)
+        )
+        info = {
+            "title": result["title"],
+            "link": result["link"],
+            "vidid": result["id"],
+            "duration_min": result["duration"],
+            "duration_sec": (
+                int(time_to_seconds(result["duration"])) if result["duration"] else 0
+            ),
+            "thumb": result["thumbnails"][0]["url"].split("?")[0],
+        }
+        return info, confidence
+
+    async def resolve(
+        self, entries: list[dict], known: dict = None, search: bool = True
+    ) -> list[dict | None]:
+        """
+        Map tracks to ``youtube.info`` style dicts, None where nothing was
+        found. Stored matches are fetched in one query unless ``known`` is
+        given; with ``search`` the rest are searched ``RESOLVE_WORKERS`` at
+        a time and confident matches are stored.
+        """
+        from YukkiMusic.platforms import youtube
+
+        if known is None:
+            known = await spotifymap.lookup(entries)
+        semaphore = asyncio.Semaphore(RESOLVE_WORKERS)
+        found = []
+
+        async def resolve(entry):
+            info = known.get(entry["id"]) or known.get(entry["isrc"])
+            if info is None:
+                if not search:
+                    return None
+                async with semaphore:
+                    try:
+                        info, confidence = await self._search(entry)
+                    except Exception:
+                        return None
+                if confidence >= MIN_CONFIDENCE:
+                    found.append((entry, info, confidence))
+            youtube.metadata.set(info["vidid"], info)
+            return info
+
+        infos = await asyncio.gather(*map(resolve, entries))
+        if found:
+            await spotifymap.save(found)
+        return infos
+
+    async def _queries(self, entries: list) -> list[str]:
+        """
+        Playlist items for ``stream``: YouTube links for stored matches and
+        for the first track, search text for the rest. Only the first track
+        is searched before playback starts; the other unmatched tracks that
+        will be played are matched in the background for next time.
+        """
+        entries = [entry for entry in entries if entry]
+        head = entries[: config.PLAYLIST_FETCH_LIMIT]
+        if not head:
+            return []
+        known = await spotifymap.lookup(head)
+        infos = await self.resolve(head, known, search=False)
+        if infos[0] is None:
+            infos[0] = (await self.resolve(head[:1], known))[0]
+        missing = [entry for entry, info in zip(head, infos) if info is None]
+        # A first track that is still missing was just searched already.
+        rest = missing[1:] if infos[0] is None else missing
+        if rest:
+            task = asyncio.create_task(self.resolve(rest, known))
+            self._learning.add(task)
+            task.add_done_callback(self._learning.discard)
+        results = [
+            info["link"] if info else entry["query"] for entry, info in zip(head, infos)
+        ]
+        results.extend(entry["query"] for entry in entries[len(head) :])
+        return results
+
+    async def track(self, link: str):
+        track = await asyncio.to_thread(self.spotify.track, link)
+        entry = self._entry(track)
+        if entry is None:
+            raise ValueError(f"No track found for {link}")
+        info = (await self.resolve([entry]))[0]
+        if info is None:
+            raise ValueError(f"No results found for {link}")
         track_details = {
-            "title": title,
-            "link": ytlink,
-            "vidid": vidid,
-            "duration_min": duration_min,
-            "thumb": thumbnail,
+            "title": info["title"],
+            "link": info["link"],
+            "vidid": info["vidid"],
+            "duration_min": info["duration_min"],
+            "thumb": info["thumb"],
         }
-        return track_details, vidid
+        return track_details, info["vidid"]
 
     @asyncify
-    def playlist(self, url: str) -> tuple:
+    def _playlist(self, url: str) -> tuple:
         playlist = self.spotify.playlist(url)
-        playlist_id = playlist["id"]
-        results = []
-        for item in playlist["tracks"]["items"]:
-            music_track = item["track"]
-            info = music_track["name"]
-            for artist in music_track["artists"]:
-                fetched = f" {artist['name']}"
-                if "Various Artists" not in fetched:
-                    info += fetched
-            results.append(info)
-        return results, playlist_id
+        entries = [
+            self._entry(item["track"]) for item in self._items(playlist["tracks"])
+        ]
+        return entries, playlist["id"]
+
+    async def playlist(self, url: str) -> tuple:
+        entries, playlist_id = await self._playlist(url)
+        return await self._queries(entries), playlist_id
 
     @asyncify
-    def album(self, url: str) -> tuple:
+    def _album(self, url: str) -> tuple:
         album = self.spotify.album(url)
-        album_id = album["id"]
-        results = []
-        for item in album["tracks"]["items"]:
-            info = item["name"]
-            for artist in item["artists"]:
-                fetched = f" {artist['name']}"
-                if "Various Artists" not in fetched:
-                    info += fetched
-            results.append(info)
-        return results, album_id
+        entries = [self._entry(item) for item in self._items(album["tracks"])]
+        return entries, album["id"]
+
+    async def album(self, url: str) -> tuple:
+        entries, album_id = await self._album(url)
+        return await self._queries(entries), album_id
 
     @asyncify
-    def artist(self, url: str) -> tuple:
+    def _artist(self, url: str) -> tuple:
         artist_info = self.spotify.artist(url)
-        artist_id = artist_info["id"]
-        results = []
         artist_top_tracks = self.spotify.artist_top_tracks(url)
-        for item in artist_top_tracks["tracks"]:
-            info = item["name"]
-            for artist in item["artists"]:
-                fetched = f" {artist['name']}"
-                if "Various Artists" not in fetched:
-                    info += fetched
-            results.append(info)
-        return results, artist_id
+        entries = [self._entry(item) for item in artist_top_tracks["tracks"]]
+        return entries, artist_info["id"]
+
+    async def artist(self, url: str) -> tuple:
+        entries, artist_id = await self._artist(url)
+        return await self._queries(entries), artist_id
@@ -6,8 +6,13 @@
 #
 
 import asyncio
+import hashlib
 import os
 import re
+import subprocess
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
 
 from async_lru import alru_cache
 from py_yt import VideosSearch
@@ -16,33 +21,27 @@ from pyrogram.types import Message
 from yt_dlp import YoutubeDL
 
 import config
+from YukkiMusic.utils.cache import NEGATIVE, TTLCache
 from YukkiMusic.utils.database import is_on_off
 from YukkiMusic.utils.decorators import asyncify
+from YukkiMusic.utils.downloader import downloader
+from YukkiMusic.utils.extractor import extractor
 from YukkiMusic.utils.formatters import seconds_to_min, time_to_seconds
+from YukkiMusic.utils.mediacache import mediacache
 
 
 NOTHING = {"cookies_dead": None}
 
-
-# -------------------------------------------------------------------- #
-# SHELL UTILS
-# -------------------------------------------------------------------- #
-
-async def shell_cmd(cmd):
-    proc = await asyncio.create_subprocess_shell(
-        cmd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    out, err = await proc.communicate()
-
-    if err:
-        err = err.decode()
-        if "unavailable videos are hidden" in err.lower():
-            return out.decode()
-        return err
-
-    return out.decode()
+VIDEO_FORMAT = "best[height<=?720][width<=?1280]"
+AUDIO_FORMAT = "ba[abr>=180][abr<=360]/ba"
+# Containers and codecs ntgcalls' ffmpeg plays directly, kept without re-encoding
+PLAYABLE_EXTS = ("webm", "m4a", "opus", "ogg", "mp3")
+PLAYABLE_CODECS = ("opus", "mp4a", "vorbis", "mp3")
+DIRECT_FORMAT = "best"
+# Stream links are refreshed in the background once they have less than
+# this many seconds left, and dropped from the cache a minute before expiry.
+URL_REFRESH_AHEAD = 1800
+URL_EXPIRY_MARGIN = 60
 
 
 # -------------------------------------------------------------------- #
@@ -55,6 +54,21 @@ class YouTube:
         self.listbase = "https://youtube.com/playlist?list="
         self.regex = r"(?:youtube\.com|youtu\.be)"
         self.reg = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+        self.idregex = r"(?:v=|youtu\.be/|shorts/|embed/|live/)([\w-]{11})"
+        self.metadata = TTLCache(maxsize=4096, ttl=6 * 3600, negative_ttl=300)
+        self.urls = TTLCache(maxsize=1024, ttl=3600)
+        self._resolving = {}
+        self._downloads = set()
+        self.audio_ready = [0, 0.0]
+        self.audio = {
+            "native": 0,
+            "native_seconds": 0,
+            "transcoded": 0,
+            "transcoded_seconds": 0,
+            "transcode_cpu": 0.0,
+        }
+        # Downloads update ``audio`` from worker threads.
+        self._audio_lock = threading.Lock()
 
     # ------------------------------------------------------------ #
 
@@ -97,57 +111,73 @@ class YouTube:
 
     # ------------------------------------------------------------ #
 
-    @alru_cache(maxsize=None)
-    async def details(self, link: str, videoid=None):
+    def _key(self, link: str) -> str:
+        match = re.search(self.idregex, link)
+        if match:
+            return match.group(1)
+        return link.strip().lower()
+
+    async def info(self, link: str, videoid=None) -> dict:
         if videoid:
             link = self.base + link
         link = link.split("&")[0]
 
-        search = VideosSearch(link, limit=1)
-        result = (await search.next())["result"][0]
+        key = self._key(link)
+        info = self.metadata.get(key)
+        if info is NEGATIVE:
+            raise ValueError(f"No results found for {link}")
+        if info:
+            return info
 
-        duration_sec = (
-            0 if not result["duration"]
-            else int(time_to_seconds(result["duration"]))
-        )
+        try:
+            search = VideosSearch(link, limit=1)
+            result = (await search.next())["result"][0]
+        except Exception:
+            self.metadata.set(key, NEGATIVE)
+            raise
+
+        info = {
+            "title": result["title"],
+            "link": result["link"],
+            "vidid": result["id"],
+            "duration_min": result["duration"],
+            "duration_sec": (
+                0 if not result["duration"]
+                else int(time_to_seconds(result["duration"]))
+            ),
+            "thumb": result["thumbnails"][0]["url"].split("?")[0],
+        }
+        self.metadata.set(info["vidid"], info)
+        if key != info["vidid"]:
+            self.metadata.set(key, info)
+        return info
+
+    # ------------------------------------------------------------ #
 
+    async def details(self, link: str, videoid=None):
+        info = await self.info(link, videoid)
         return (
-            result["title"],
-            result["duration"],
-            duration_sec,
-            result["thumbnails"][0]["url"].split("?")[0],
-            result["id"],
+            info["title"],
+            info["duration_min"],
+            info["duration_sec"],
+            info["thumb"],
+            info["vidid"],
         )
 
     # ------------------------------------------------------------ #
 
-    @alru_cache(maxsize=None)
     async def title(self, link: str, videoid=None):
-        if videoid:
-            link = self.base + link
-        link = link.split("&")[0]
-        search = VideosSearch(link, limit=1)
-        return (await search.next())["result"][0]["title"]
+        return (await self.info(link, videoid))["title"]
 
     # ------------------------------------------------------------ #
 
-    @alru_cache(maxsize=None)
     async def duration(self, link: str, videoid=None):
-        if videoid:
-            link = self.base + link
-        link = link.split("&")[0]
-        search = VideosSearch(link, limit=1)
-        return (await search.next())["result"][0]["duration"]
+        return (await self.info(link, videoid))["duration_min"]
 
     # ------------------------------------------------------------ #
 
-    @alru_cache(maxsize=None)
     async def thumbnail(self, link: str, videoid=None):
-        if videoid:
-            link = self.base + link
-        link = link.split("&")[0]
-        search = VideosSearch(link, limit=1)
-        return (await search.next())["result"][0]["thumbnails"][0]["url"].split("?")[0]
+        return (await self.info(link, videoid))["thumb"]
 
     # ------------------------------------------------------------ #
 
@@ -156,67 +186,93 @@ class YouTube:
             link = self.base + link
         link = link.split("&")[0]
 
-        cmd = [
-            "yt-dlp",
-            "--cookies-from-browser",
-            "firefox",
-            "-g",
-            "-f",
-            "best[height<=?720][width<=?1280]",
-            link,
-        ]
-
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        try:
+            return 1, await self.stream_url(link, VIDEO_FORMAT)
+        except Exception as e:
+            return 0, str(e)
 
-        out, err = await proc.communicate()
+    # ------------------------------------------------------------ #
 
-        if out:
-            return 1, out.decode().split("\n")[0]
-        return 0, err.decode()
+    @staticmethod
+    def _expiry(url: str) -> float | None:
+        expire = parse_qs(urlsplit(url).query).get("expire")
+        if not expire:
+            # hls and dash manifests carry it as a path segment
+            expire = re.findall(r"/expire/(\d+)", url)
+        return float(expire[0]) if expire else None
+
+    async def _resolve_url(self, key: tuple, link: str, format: str) -> str:
+        url = await extractor.stream_url(link, format)
+        expires = self._expiry(url) or time.time() + self.urls.ttl
+        ttl = expires - time.time() - URL_EXPIRY_MARGIN
+        if ttl > 0:
+            self.urls.set(key, (url, expires), ttl=ttl)
+        return url
+
+    def _resolve_task(self, key: tuple, link: str, format: str) -> asyncio.Task:
+        task = self._resolving.get(key)
+        if task is None:
+            task = asyncio.create_task(self._resolve_url(key, link, format))
+            self._resolving[key] = task
+
+            def done(task):
+                self._resolving.pop(key, None)
+                if not task.cancelled():
+                    task.exception()
+
+            task.add_done_callback(done)
+        return task
+
+    async def stream_url(self, link: str, format: str = DIRECT_FORMAT) -> str:
+        """
+        Direct googlevideo link for ``link``, cached until shortly before the
+        ``expire`` time it carries and refreshed in the background ahead of
+        that, so replays and loops need no extractor call.
+        """
+        key = (self._key(link), format)
+        cached = self.urls.get(key)
+        if cached:
+            url, expires = cached
+            if expires - time.time() < URL_REFRESH_AHEAD:
+                self._resolve_task(key, link, format)
+            return url
+        return await asyncio.shield(self._resolve_task(key, link, format))
+
+    def invalidate_url(self, link: str, videoid=None):
+        """Forget cached stream links of a video, e.g. after a 403."""
+        if videoid:
+            link = self.base + link
+        vidid = self._key(link)
+        for format in (VIDEO_FORMAT, DIRECT_FORMAT, AUDIO_FORMAT):
+            self.urls.pop((vidid, format))
 
     # ------------------------------------------------------------ #
 
-    @alru_cache(maxsize=None)
+    @alru_cache(maxsize=256, ttl=3600)
     async def playlist(self, link, limit, videoid=None):
         if videoid:
             link = self.listbase + link
         link = link.split("&")[0]
 
-        cmd = (
-            f"yt-dlp -i --compat-options no-youtube-unavailable-videos "
-            f"--get-id --flat-playlist --playlist-end {limit} "
-            f'--skip-download "{link}" 2>/dev/null'
-        )
-
-        data = await shell_cmd(cmd)
-        return [x for x in data.split("\n") if x]
+        return await extractor.playlist(link, limit)
 
     # ------------------------------------------------------------ #
 
-    @alru_cache(maxsize=None)
     async def track(self, link: str, videoid=None):
-        if videoid:
-            link = self.base + link
-        link = link.split("&")[0]
-
         try:
-            search = VideosSearch(link, limit=1)
-            res = (await search.next())["result"][0]
-
+            info = await self.info(link, videoid)
             return {
-                "title": res["title"],
-                "link": res["link"],
-                "vidid": res["id"],
-                "duration_min": res["duration"],
-                "thumb": res["thumbnails"][0]["url"].split("?")[0],
-            }, res["id"]
+                "title": info["title"],
+                "link": info["link"],
+                "vidid": info["vidid"],
+                "duration_min": info["duration_min"],
+                "thumb": info["thumb"],
+            }, info["vidid"]
 
         except Exception:
-            return await self._track(link)
+            if videoid:
+                link = self.base + link
+            return await self._track(link.split("&")[0])
 
     # ------------------------------------------------------------ #
 
@@ -247,7 +303,7 @@ class YouTube:
 
     # ------------------------------------------------------------ #
 
-    @alru_cache(maxsize=None)
+    @alru_cache(maxsize=256, ttl=3600)
     @asyncify
     def formats(self, link: str, videoid=None):
         if videoid:
@@ -293,26 +349,31 @@ class YouTube:
         songvideo=None,
         format_id=None,
         title=None,
+        progressive: bool = None,
     ):
-
+        """
+        Returns ``(path, True)`` for a downloaded file or ``(url, None)`` for
+        a direct link. With ``progressive`` (default ``PROGRESSIVE_AUDIO``),
+        audio that is not cached yet is returned as a direct link while the
+        download continues in the background into the media cache.
+        """
+        started = time.monotonic()
+        if progressive is None:
+            progressive = config.PROGRESSIVE_AUDIO
         if videoid:
             link = self.base + link
 
-        os.makedirs("downloads", exist_ok=True)
+        match = re.search(self.idregex, link)
+        vidid = match.group(1) if match else hashlib.md5(link.encode()).hexdigest()
+        chat_id = mystic.chat.id if getattr(mystic, "chat", None) else None
 
         # ---------------- AUDIO ---------------- #
 
-        @asyncify
-        def audio_dl():
+        def audio_dl(tmp):
             opts = {
-                "format": "ba[abr>=180][abr<=360]/ba",
-                "postprocessors": [{
-                    "key": "FFmpegExtractAudio",
-                    "preferredcodec": "m4a",
-                    "preferredquality": "0",
-                }],
+                "format": AUDIO_FORMAT,
                 "concurrent_fragment_downloads": 4,
-                "outtmpl": "downloads/%(id)s.%(ext)s",
+                "outtmpl": f"{tmp}.%(ext)s",
                 "quiet": True,
                 "noplaylist": True,
                 "geo_bypass": True,
@@ -323,17 +384,21 @@ class YouTube:
 
             with YoutubeDL(opts) as ydl:
                 info = ydl.extract_info(link, download=True)
-                return os.path.join("downloads", f"{info['id']}.m4a")
+            path = info["requested_downloads"][0]["filepath"]
+            duration = int(info.get("duration") or 0)
+            if self._playable(info):
+                self._count_audio(native=1, native_seconds=duration)
+                return path
+            return self._transcode(path, tmp, duration)
 
         # ---------------- VIDEO ---------------- #
 
-        @asyncify
-        def video_dl():
+        def video_dl(tmp):
             opts = {
                 "format": "(b[height>=360][height<=1080]/bv*[height>=360][height<=1080]/bv*)+(ba[abr>=128]/ba)/b",
                 "merge_output_format": "mp4",
                 "concurrent_fragment_downloads": 4,
-                "outtmpl": "downloads/%(id)s.%(ext)s",
+                "outtmpl": f"{tmp}.%(ext)s",
                 "quiet": True,
                 "noplaylist": True,
                 "geo_bypass": True,
@@ -343,35 +408,112 @@ class YouTube:
             }
 
             with YoutubeDL(opts) as ydl:
-                info = ydl.extract_info(link, download=True)
-                return os.path.join("downloads", f"{info['id']}.mp4")
+                ydl.extract_info(link, download=True)
+                return f"{tmp}.mp4"
 
         # ---------------- ROUTER ---------------- #
 
         if video:
             if await is_on_off(config.YTDOWNLOADER):
-                return await video_dl(), True
-
-            cmd = [
-                "yt-dlp",
-                "--cookies-from-browser",
-                "firefox",
-                "-g",
-                "-f",
-                "best",
-                link,
-            ]
-
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                return (
+                    await downloader.fetch(vidid, "video", "mp4", video_dl, chat_id),
+                    True,
+                )
+
+            try:
+                return await self.stream_url(link), None
+            except Exception:
+                pass
+
+            return (
+                await downloader.fetch(vidid, "video", "mp4", video_dl, chat_id),
+                True,
             )
 
-            out, _ = await proc.communicate()
-            if out:
-                return out.decode().split("\n")[0], None
+        if not progressive or songaudio or songvideo:
+            return (
+                await downloader.fetch(vidid, "audio", "m4a", audio_dl, chat_id),
+                True,
+            )
 
-            return await video_dl(), True
+        result = await self._progressive(link, vidid, chat_id, audio_dl)
+        self.audio_ready[0] += 1
+        self.audio_ready[1] += time.monotonic() - started
+        return result
+
+    async def _progressive(self, link: str, vidid: str, chat_id, audio_dl):
+        cached = await asyncio.to_thread(mediacache.get, "youtube", vidid, "audio")
+        if cached:
+            return cached, True
+        # Keep the download going after the stream starts so the finished
+        # file ends up in the media cache for replays.
+        job = asyncio.create_task(
+            downloader.fetch(vidid, "audio", "m4a", audio_dl, chat_id)
+        )
+        self._downloads.add(job)
 
-        return await audio_dl(), True
+        def done(task):
+            self._downloads.discard(task)
+            if not task.cancelled():
+                task.exception()
+
+        job.add_done_callback(done)
+        try:
+            return await self.stream_url(link, AUDIO_FORMAT), None
+        except Exception:
+            return await asyncio.shield(job), True
+
+    @staticmethod
+    def _playable(info: dict) -> bool:
+        codec = str(info.get("acodec") or "").split(".")[0]
+        vcodec = info.get("vcodec")
+        return (
+            info.get("ext") in PLAYABLE_EXTS
+            and codec in PLAYABLE_CODECS
+            and vcodec in (None, "none")
+        )
+
+    def _transcode(self, path: str, tmp: str, duration: int) -> str:
+        """Re-encode to m4a, recording the CPU time ffmpeg used."""
+        output = f"{tmp}.m4a"
+        cmd = ["ffmpeg", "-y", "-i", path, "-vn", "-c:a", "aac", "-b:a", "192k", output]
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        _, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        os.remove(path)
+        if proc.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with code {proc.returncode}")
+        self._count_audio(
+            transcoded=1,
+            transcoded_seconds=duration,
+            transcode_cpu=usage.ru_utime + usage.ru_stime,
+        )
+        return output
+
+    def _count_audio(self, **amounts):
+        with self._audio_lock:
+            for key, amount in amounts.items():
+                self.audio[key] += amount
+
+    def audio_stats(self) -> dict:
+        """
+        Downloads kept in their native format and those re-encoded. The CPU
+        saved is estimated from the measured cost per second of audio of the
+        downloads that did need ffmpeg, so it is None until one has run.
+        """
+        with self._audio_lock:
+            stats = dict(self.audio)
+        stats["cpu_saved"] = None
+        if stats["transcoded_seconds"]:
+            rate = stats["transcode_cpu"] / stats["transcoded_seconds"]
+            stats["cpu_saved"] = round(stats["native_seconds"] * rate, 1)
+        return stats
+
+    def audio_ready_avg(self) -> float:
+        """Average seconds until ``download`` returned a playable source."""
+        count, total = self.audio_ready
+        return round(total / count, 2) if count else 0
@@ -11,9 +11,10 @@
 from pyrogram import filters
 from pyrogram.types import Message
 
-from config import BANNED_USERS, adminlist
+from config import BANNED_USERS
 from strings import command
 from YukkiMusic import app
+from YukkiMusic.utils.admincache import admincache
 from YukkiMusic.utils.database import (
     delete_authuser,
     get_authuser,
@@ -49,10 +50,7 @@ async def auth(client, message: Message, _):
                 "admin_id": from_user_id,
                 "admin_name": from_user_name,
             }
-            get = adminlist.get(message.chat.id)
-            if get:
-                if user.id not in get:
-                    get.append(user.id)
+            admincache.add_auth(message.chat.id, user.id)
             await save_authuser(message.chat.id, token, assis)
             return await message.reply_text(_["auth_2"])
         else:
@@ -76,10 +74,7 @@ async def auth(client, message: Message, _):
             "admin_id": from_user_id,
             "admin_name": from_user_name,
         }
-        get = adminlist.get(message.chat.id)
-        if get:
-            if user_id not in get:
-                get.append(user_id)
+        admincache.add_auth(message.chat.id, user_id)
         await save_authuser(message.chat.id, token, assis)
         return await message.reply_text(_["auth_2"])
     else:
@@ -98,10 +93,7 @@ async def unauthusers(client, message: Message, _):
         user = await app.get_users(user)
         token = await int_to_alpha(user.id)
         deleted = await delete_authuser(message.chat.id, token)
-        get = adminlist.get(message.chat.id)
-        if get:
-            if user.id in get:
-                get.remove(user.id)
+        admincache.remove_auth(message.chat.id, user.id)
         if deleted:
             return await message.reply_text(_["auth_4"])
         else:
@@ -109,10 +101,7 @@ async def unauthusers(client, message: Message, _):
     user_id = message.reply_to_message.from_user.id
     token = await int_to_alpha(user_id)
     deleted = await delete_authuser(message.chat.id, token)
-    get = adminlist.get(message.chat.id)
-    if get:
-        if user_id in get:
-            get.remove(user_id)
+    admincache.remove_auth(message.chat.id, user_id)
     if deleted:
         return await message.reply_text(_["auth_4"])
     else:
@@ -7,7 +7,6 @@
 #
 # All rights reserved.
 #
-import random
 
 from pyrogram import filters
 from pyrogram.types import InlineKeyboardMarkup, InputMediaPhoto
@@ -20,7 +19,6 @@ from config import (
     SUPPORT_GROUP,
     TELEGRAM_AUDIO_URL,
     TELEGRAM_VIDEO_URL,
-    adminlist,
     lyrical,
 )
 from YukkiMusic import app
@@ -30,8 +28,10 @@ from YukkiMusic.platforms import apple, saavn
 from YukkiMusic.platforms import spotify as spotifyapi
 from YukkiMusic.platforms import youtube
 from YukkiMusic.utils import fallback, seconds_to_min, time_to_seconds
+from YukkiMusic.utils.admincache import admincache
 from YukkiMusic.utils.channelplay import get_channeplayCB
 from YukkiMusic.utils.database import (
+    get_played,
     is_active_chat,
     is_music_playing,
     is_muted,
@@ -41,6 +41,7 @@ from YukkiMusic.utils.database import (
     mute_off,
     mute_on,
     set_loop,
+    start_clock,
 )
 from YukkiMusic.utils.decorators import ActualAdminCB
 from YukkiMusic.utils.decorators.language import languageCB
@@ -54,6 +55,8 @@ from YukkiMusic.utils.inline.play import (
     telegram_markup,
 )
 from YukkiMusic.utils.stream.autoclear import auto_clean
+from YukkiMusic.utils.stream.models import Source
+from YukkiMusic.utils.stream.prefetch import prefetcher
 from YukkiMusic.utils.stream.stream import stream
 from YukkiMusic.utils.thumbnails import gen_thumb
 
@@ -147,12 +150,11 @@ async def admin_callback(client, query, _):
     is_non_admin = await is_nonadmin_chat(query.message.chat.id)
     if not is_non_admin:
         if query.from_user.id not in SUDOERS:
-            admins = adminlist.get(query.message.chat.id)
-            if not admins:
+            allowed = await admincache.check(query.message.chat.id, query.from_user.id)
+            if allowed is None:
                 return await query.answer(_["admin_18"], show_alert=True)
-            else:
-                if query.from_user.id not in admins:
-                    return await query.answer(_["admin_19"], show_alert=True)
+            if not allowed:
+                return await query.answer(_["admin_19"], show_alert=True)
     if command == "Pause":
         if not await is_music_playing(chat_id):
             return await query.answer(_["admin_1"], show_alert=True)
@@ -174,8 +176,8 @@ async def admin_callback(client, query, _):
     elif command == "Stop" or command == "End":
         try:
             check = db.get(chat_id)
-            if check[0].get("mystic"):
-                await check[0].get("mystic").delete()
+            if check[0].mystic:
+                await check[0].mystic.delete()
         except Exception:
             pass
         await query.answer()
@@ -211,17 +213,11 @@ async def admin_callback(client, query, _):
         check = db.get(chat_id)
         if not check:
             return await query.answer(_["admin_21"], show_alert=True)
-        try:
-            popped = check.pop(0)
-        except Exception:
-            return await query.answer(_["admin_22"], show_alert=True)
-        check = db.get(chat_id)
-        if not check:
-            check.insert(0, popped)
+        if len(check) < 2:
             return await query.answer(_["admin_22"], show_alert=True)
         await query.answer()
-        random.shuffle(check)
-        check.insert(0, popped)
+        check.shuffle()
+        prefetcher.schedule(chat_id)
         await query.message.reply_text(
             _["admin_23"].format(mention), disable_web_page_preview=True
         )
@@ -249,25 +245,23 @@ async def admin_callback(client, query, _):
                     _["admin_10"].format(mention), disable_web_page_preview=True
                 )
                 return await Yukki.stop_stream(chat_id)
-        elif command == "Replay":
-            db[chat_id][0]["played"] = 0
 
         await query.answer()
-        queued = check[0]["file"]
-        title = (check[0]["title"]).title()
-        user = check[0]["by"]
-        streamtype = check[0]["streamtype"]
-        videoid = check[0]["vidid"]
-        duration_min = check[0]["dur"]
+        queued = check[0].file
+        title = (check[0].title).title()
+        user = check[0].by
+        streamtype = check[0].streamtype
+        videoid = check[0].vidid
+        duration_min = check[0].dur
         status = True if str(streamtype) == "video" else None
-        db[chat_id][0]["played"] = 0
-        if "live_" in queued:
+        if check[0].source is Source.LIVE:
             n, link = await youtube.video(videoid, True)
             if n == 0:
                 return await query.message.reply_text(_["admin_11"].format(title))
             try:
                 await Yukki.skip_stream(chat_id, link, video=status)
             except Exception:
+                youtube.invalidate_url(videoid, True)
                 return await query.message.reply_text(_["call_7"])
             button = telegram_markup(_, chat_id)
             img = await gen_thumb(videoid)
@@ -279,10 +273,10 @@ async def admin_callback(client, query, _):
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
             await query.edit_message_text(txt)
-        elif "vid_" in queued:
+        elif check[0].source is Source.YOUTUBE:
             flink = f"https://t.me/{app.username}?start=info_{videoid}"
             thumbnail = None
             mystic = await query.message.reply_text(
@@ -320,7 +314,7 @@ async def admin_callback(client, query, _):
                 await Yukki.skip_stream(chat_id, file_path, video=status)
             except Exception:
                 return await mystic.edit_text(_["call_7"])
-            check[0]["dur"] = duration_min
+            check[0].dur = duration_min
             button = stream_markup(_, videoid, chat_id)
             img = await gen_thumb(videoid, thumbnail)
             run = await query.message.reply_photo(
@@ -333,11 +327,11 @@ async def admin_callback(client, query, _):
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "stream"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "stream"
             await query.edit_message_text(txt)
             await mystic.delete()
-        elif "index_" in queued:
+        elif check[0].source is Source.INDEX:
             try:
                 await Yukki.skip_stream(chat_id, videoid, video=status)
             except Exception:
@@ -348,15 +342,15 @@ async def admin_callback(client, query, _):
                 caption=_["stream_2"].format(user),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
             await query.edit_message_text(txt)
         else:
             try:
                 await Yukki.skip_stream(chat_id, queued, video=status)
             except Exception:
                 return await query.message.reply_text(_["call_7"])
-            if videoid == "telegram":
+            if check[0].source is Source.TELEGRAM:
                 button = telegram_markup(_, chat_id)
                 run = await query.message.reply_photo(
                     photo=(
@@ -365,13 +359,13 @@ async def admin_callback(client, query, _):
                         else TELEGRAM_VIDEO_URL
                     ),
                     caption=_["stream_1"].format(
-                        title, SUPPORT_GROUP, check[0]["dur"], user
+                        title, SUPPORT_GROUP, check[0].dur, user
                     ),
                     reply_markup=InlineKeyboardMarkup(button),
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "tg"
-            elif videoid == "soundcloud":
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "tg"
+            elif check[0].source is Source.SOUNDCLOUD:
                 button = telegram_markup(_, chat_id)
                 run = await query.message.reply_photo(
                     photo=(
@@ -380,23 +374,23 @@ async def admin_callback(client, query, _):
                         else TELEGRAM_VIDEO_URL
                     ),
                     caption=_["stream_1"].format(
-                        title, SUPPORT_GROUP, check[0]["dur"], user
+                        title, SUPPORT_GROUP, check[0].dur, user
                     ),
                     reply_markup=InlineKeyboardMarkup(button),
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "tg"
-            elif "saavn" in videoid:
-                url = check[0]["url"]
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "tg"
+            elif check[0].source is Source.SAAVN:
+                url = check[0].url
                 details = await saavn.info(url)
                 button = telegram_markup(_, chat_id)
                 run = await query.message.reply_photo(
                     photo=details["thumb"],
-                    caption=_["stream_1"].format(title, url, check[0]["dur"], user),
+                    caption=_["stream_1"].format(title, url, check[0].dur, user),
                     reply_markup=InlineKeyboardMarkup(button),
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "tg"
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "tg"
             else:
                 button = stream_markup(_, videoid, chat_id)
                 img = await gen_thumb(videoid)
@@ -410,25 +404,23 @@ async def admin_callback(client, query, _):
                     ),
                     reply_markup=InlineKeyboardMarkup(button),
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "stream"
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "stream"
             await query.edit_message_text(txt)
     else:
         playing = db.get(chat_id)
         if not playing:
             return await query.answer(_["queue_2"], show_alert=True)
-        duration_seconds = int(playing[0]["seconds"])
-        if duration_seconds == 0:
-            return await query.answer(_["admin_30"], show_alert=True)
-        file_path = playing[0]["file"]
-        if "index_" in file_path or "live_" in file_path:
+        if not playing[0].seekable:
             return await query.answer(_["admin_30"], show_alert=True)
-        duration_played = int(playing[0]["played"])
+        duration_seconds = int(playing[0].seconds)
+        file_path = playing[0].file
+        duration_played = await get_played(chat_id)
         if int(command) in [1, 2]:
             duration_to_skip = 10
         else:
             duration_to_skip = 30
-        duration = playing[0]["dur"]
+        duration = playing[0].dur
         if int(command) in [1, 3]:
             if (duration_played - duration_to_skip) <= 10:
                 bet = seconds_to_min(duration_played)
@@ -447,8 +439,8 @@ async def admin_callback(client, query, _):
             to_seek = duration_played + duration_to_skip + 1
         await query.answer()
         mystic = await query.message.reply_text(_["admin_32"])
-        if "vid_" in file_path:
-            n, file_path = await youtube.video(playing[0]["vidid"], True)
+        if playing[0].source is Source.YOUTUBE:
+            n, file_path = await youtube.video(playing[0].vidid, True)
             if n == 0:
                 return await mystic.edit_text(_["admin_30"])
         try:
@@ -457,14 +449,13 @@ async def admin_callback(client, query, _):
                 file_path,
                 seconds_to_min(to_seek),
                 duration,
-                playing[0]["streamtype"],
+                playing[0].streamtype,
             )
         except Exception:
+            if playing[0].source is Source.YOUTUBE:
+                youtube.invalidate_url(playing[0].vidid, True)
             return await mystic.edit_text(_["admin_34"])
-        if int(command) in [1, 3]:
-            db[chat_id][0]["played"] -= duration_to_skip
-        else:
-            db[chat_id][0]["played"] += duration_to_skip
+        await start_clock(chat_id, to_seek)
         string = _["admin_33"].format(seconds_to_min(to_seek))
         await mystic.edit_text(f"{string}\n\nChanges Done by: {mention} !")
 
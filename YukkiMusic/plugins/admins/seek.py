@@ -17,6 +17,8 @@ from YukkiMusic.core.call import Yukki
 from YukkiMusic.misc import db
 from YukkiMusic.platforms import youtube
 from YukkiMusic.utils import AdminRightsCheck, seconds_to_min
+from YukkiMusic.utils.database import get_played, start_clock
+from YukkiMusic.utils.stream.models import Source
 
 
 @app.on_message(
@@ -32,15 +34,13 @@ async def seek_comm(cli, message: Message, _, chat_id):
     playing = db.get(chat_id)
     if not playing:
         return await message.reply_text(_["queue_2"])
-    duration_seconds = int(playing[0]["seconds"])
-    if duration_seconds == 0:
+    if not playing[0].seekable:
         return await message.reply_text(_["admin_30"])
-    file_path = playing[0]["file"]
-    if "index_" in file_path or "live_" in file_path:
-        return await message.reply_text(_["admin_30"])
-    duration_played = int(playing[0]["played"])
+    duration_seconds = int(playing[0].seconds)
+    file_path = playing[0].file
+    duration_played = await get_played(chat_id)
     duration_to_skip = int(query)
-    duration = playing[0]["dur"]
+    duration = playing[0].dur
     if message.command[0][-2] == "c":
         if (duration_played - duration_to_skip) <= 10:
             return await message.reply_text(
@@ -54,8 +54,8 @@ async def seek_comm(cli, message: Message, _, chat_id):
             )
         to_seek = duration_played + duration_to_skip + 1
     mystic = await message.reply_text(_["admin_32"])
-    if "vid_" in file_path:
-        n, file_path = await youtube.video(playing[0]["vidid"], True)
+    if playing[0].source is Source.YOUTUBE:
+        n, file_path = await youtube.video(playing[0].vidid, True)
         if n == 0:
             return await message.reply_text(_["admin_30"])
     try:
@@ -64,12 +64,11 @@ async def seek_comm(cli, message: Message, _, chat_id):
             file_path,
             seconds_to_min(to_seek),
             duration,
-            playing[0]["streamtype"],
+            playing[0].streamtype,
         )
     except Exception:
+        if playing[0].source is Source.YOUTUBE:
+            youtube.invalidate_url(playing[0].vidid, True)
         return await mystic.edit_text(_["admin_34"])
-    if message.command[0][-2] == "c":
-        db[chat_id][0]["played"] -= duration_to_skip
-    else:
-        db[chat_id][0]["played"] += duration_to_skip
+    await start_clock(chat_id, to_seek)
     await mystic.edit_text(_["admin_33"].format(seconds_to_min(to_seek)))
@@ -24,6 +24,7 @@ from YukkiMusic.utils.database import get_loop
 from YukkiMusic.utils.decorators import AdminRightsCheck
 from YukkiMusic.utils.inline.play import stream_markup, telegram_markup
 from YukkiMusic.utils.stream.autoclear import auto_clean
+from YukkiMusic.utils.stream.models import Source
 from YukkiMusic.utils.thumbnails import gen_thumb
 
 
@@ -47,9 +48,9 @@ async def skip(cli, message: Message, _, chat_id):
                             popped = None
                             try:
                                 popped = check.pop(0)
-                                if popped.get("mystic"):
+                                if popped.mystic:
                                     try:
-                                        await popped.get("mystic").delete()
+                                        await popped.mystic.delete()
                                     except Exception:
                                         pass
                             except Exception:
@@ -83,9 +84,9 @@ async def skip(cli, message: Message, _, chat_id):
             popped = check.pop(0)
             if popped:
                 await auto_clean(popped)
-                if popped.get("mystic"):
+                if popped.mystic:
                     try:
-                        await popped.get("mystic").delete()
+                        await popped.mystic.delete()
                     except Exception:
                         pass
             if not check:
@@ -106,21 +107,22 @@ async def skip(cli, message: Message, _, chat_id):
                 return await Yukki.stop_stream(chat_id)
             except Exception:
                 return
-    queued = check[0]["file"]
-    title = (check[0]["title"]).title()
-    user = check[0]["by"]
+    queued = check[0].file
+    title = (check[0].title).title()
+    user = check[0].by
     message.from_user.id
-    streamtype = check[0]["streamtype"]
-    videoid = check[0]["vidid"]
-    duration_min = check[0]["dur"]
+    streamtype = check[0].streamtype
+    videoid = check[0].vidid
+    duration_min = check[0].dur
     status = True if str(streamtype) == "video" else None
-    if "live_" in queued:
+    if check[0].source is Source.LIVE:
         n, link = await youtube.video(videoid, True)
         if n == 0:
             return await message.reply_text(_["admin_11"].format(title))
         try:
             await Yukki.skip_stream(chat_id, link, video=status)
         except Exception:
+            youtube.invalidate_url(videoid, True)
             return await message.reply_text(_["call_7"])
         button = telegram_markup(_, chat_id)
         img = await gen_thumb(videoid)
@@ -132,9 +134,9 @@ async def skip(cli, message: Message, _, chat_id):
             ),
             reply_markup=InlineKeyboardMarkup(button),
         )
-        db[chat_id][0]["mystic"] = run
-        db[chat_id][0]["markup"] = "tg"
-    elif "vid_" in queued:
+        db[chat_id][0].mystic = run
+        db[chat_id][0].markup = "tg"
+    elif check[0].source is Source.YOUTUBE:
         flink = (f"https://t.me/{app.username}?start=info_{videoid}",)
         thumbnail = None
         mystic = await message.reply_text(_["call_8"], disable_web_page_preview=True)
@@ -168,7 +170,7 @@ async def skip(cli, message: Message, _, chat_id):
             await Yukki.skip_stream(chat_id, file_path, video=status)
         except Exception:
             return await mystic.edit_text(_["call_7"])
-        check[0]["dur"] = duration_min
+        check[0].dur = duration_min
         button = stream_markup(_, videoid, chat_id)
         img = await gen_thumb(videoid, thumbnail)
         run = await message.reply_photo(
@@ -181,10 +183,10 @@ async def skip(cli, message: Message, _, chat_id):
             ),
             reply_markup=InlineKeyboardMarkup(button),
         )
-        db[chat_id][0]["mystic"] = run
-        db[chat_id][0]["markup"] = "stream"
+        db[chat_id][0].mystic = run
+        db[chat_id][0].markup = "stream"
         await mystic.delete()
-    elif "index_" in queued:
+    elif check[0].source is Source.INDEX:
         try:
             await Yukki.skip_stream(chat_id, videoid, video=status)
         except Exception:
@@ -195,14 +197,14 @@ async def skip(cli, message: Message, _, chat_id):
             caption=_["stream_2"].format(user),
             reply_markup=InlineKeyboardMarkup(button),
         )
-        db[chat_id][0]["mystic"] = run
-        db[chat_id][0]["markup"] = "tg"
+        db[chat_id][0].mystic = run
+        db[chat_id][0].markup = "tg"
     else:
         try:
             await Yukki.skip_stream(chat_id, queued, video=status)
         except Exception:
             return await message.reply_text(_["call_7"])
-        if videoid == "telegram":
+        if check[0].source is Source.TELEGRAM:
             button = telegram_markup(_, chat_id)
             run = await message.reply_photo(
                 photo=(
@@ -211,13 +213,13 @@ async def skip(cli, message: Message, _, chat_id):
                     else config.TELEGRAM_VIDEO_URL
                 ),
                 caption=_["stream_1"].format(
-                    title, config.SUPPORT_GROUP, check[0]["dur"], user
+                    title, config.SUPPORT_GROUP, check[0].dur, user
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
-        elif videoid == "soundcloud":
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
+        elif check[0].source is Source.SOUNDCLOUD:
             button = telegram_markup(_, chat_id)
             run = await message.reply_photo(
                 photo=(
@@ -226,23 +228,23 @@ async def skip(cli, message: Message, _, chat_id):
                     else config.TELEGRAM_VIDEO_URL
                 ),
                 caption=_["stream_1"].format(
-                    title, config.SUPPORT_GROUP, check[0]["dur"], user
+                    title, config.SUPPORT_GROUP, check[0].dur, user
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
-        elif "saavn" in videoid:
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
+        elif check[0].source is Source.SAAVN:
             button = telegram_markup(_, chat_id)
-            url = check[0]["url"]
+            url = check[0].url
             details = await saavn.info(url)
             run = await message.reply_photo(
                 photo=details["thumb"] or config.TELEGRAM_AUDIO_URL,
-                caption=_["stream_1"].format(title, url, check[0]["dur"], user),
+                caption=_["stream_1"].format(title, url, check[0].dur, user),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
         else:
             button = stream_markup(_, videoid, chat_id)
             img = await gen_thumb(videoid)
@@ -256,5 +258,5 @@ async def skip(cli, message: Message, _, chat_id):
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "stream"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "stream"
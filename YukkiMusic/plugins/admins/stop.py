@@ -10,11 +10,12 @@
 from pyrogram import filters
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup, Message
 
-from config import BANNED_USERS, EXTRA_PLUGINS, adminlist
+from config import BANNED_USERS, EXTRA_PLUGINS
 from strings import command, get_string
 from YukkiMusic import app
 from YukkiMusic.core.call import Yukki
 from YukkiMusic.misc import SUDOERS
+from YukkiMusic.utils.admincache import admincache
 from YukkiMusic.utils.database import (
     delete_filter,
     get_cmode,
@@ -81,16 +82,15 @@ async def stop_music(cli, message: Message):
     is_non_admin = await is_nonadmin_chat(message.chat.id)
     if not is_non_admin:
         if message.from_user.id not in SUDOERS:
-            admins = adminlist.get(message.chat.id)
-            if not admins:
+            allowed = await admincache.check(message.chat.id, message.from_user.id)
+            if allowed is None:
                 return await message.reply_text(_["admin_18"])
-            else:
-                if message.from_user.id not in admins:
-                    return await message.reply_text(_["admin_19"])
+            if not allowed:
+                return await message.reply_text(_["admin_19"])
     try:
         check = db.get(chat_id)
-        if check[0].get("mystic"):
-            await check[0].get("mystic").delete()
+        if check[0].mystic:
+            await check[0].mystic.delete()
     except Exception:
         pass
     await Yukki.stop_stream(chat_id)
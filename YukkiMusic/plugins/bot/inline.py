@@ -8,6 +8,8 @@
 # All rights reserved.
 #
 
+import asyncio
+
 from py_yt import VideosSearch
 from pyrogram.types import (
     InlineKeyboardButton,
@@ -17,42 +19,40 @@ from pyrogram.types import (
 
 from config import BANNED_USERS
 from YukkiMusic import app
+from YukkiMusic.utils.cache import TTLCache
 from YukkiMusic.utils.inlinequery import answer
 
+CACHE_TIME = 300
+DEBOUNCE = 0.4
+MIN_PREFIX = 3
 
-@app.on_inline_query(~BANNED_USERS)
-async def inline_query_handler(client, query):
-    text = query.query.strip().lower()
-    answers = []
-    if text.strip() == "":
-        try:
-            await client.answer_inline_query(query.id, results=answer, cache_time=10)
-        except Exception:
-            return
-    else:
-        a = VideosSearch(text, limit=20)
-        result = (await a.next()).get("result")
-        for x in range(15):
-            title = (result[x]["title"]).title()
-            duration = result[x]["duration"]
-            views = result[x]["viewCount"]["short"]
-            thumbnail = result[x]["thumbnails"][0]["url"].split("?")[0]
-            channellink = result[x]["channel"]["link"]
-            channel = result[x]["channel"]["name"]
-            link = result[x]["link"]
-            published = result[x]["publishedTime"]
-            description = f"{views} | {duration} Mins | {channel}  | {published}"
-            buttons = InlineKeyboardMarkup(
-                [
-                    [
-                        InlineKeyboardButton(
-                            text="🎥 ᴡᴀᴛᴄʜ ᴏɴ ʏᴏᴜᴛᴜʙᴇ",
-                            url=link,
-                        )
-                    ],
-                ]
-            )
-            searched_text = f"""
+# normalized query -> list of (searchable text, result)
+searches = TTLCache(maxsize=512, ttl=600)
+inflight = {}
+latest = {}
+
+
+def build_result(result: dict) -> InlineQueryResultPhoto:
+    title = (result["title"]).title()
+    duration = result["duration"]
+    views = result["viewCount"]["short"]
+    thumbnail = result["thumbnails"][0]["url"].split("?")[0]
+    channellink = result["channel"]["link"]
+    channel = result["channel"]["name"]
+    link = result["link"]
+    published = result["publishedTime"]
+    description = f"{views} | {duration} Mins | {channel}  | {published}"
+    buttons = InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(
+                    text="🎥 ᴡᴀᴛᴄʜ ᴏɴ ʏᴏᴜᴛᴜʙᴇ",
+                    url=link,
+                )
+            ],
+        ]
+    )
+    searched_text = f"""
 ❇️**ᴛɪᴛʟᴇ:** [{title}]({link})
 
 ⏳**ᴅᴜʀᴀᴛɪᴏɴ:** {duration} Mins
@@ -64,17 +64,80 @@ async def inline_query_handler(client, query):
 __ʀᴇᴘʟʏ ᴡɪᴛʜ /play ᴏɴ ᴛʜɪs sᴇᴀʀᴄʜᴇᴅ ᴍᴇssᴀɢᴇ ᴛᴏ sᴛʀᴇᴀᴍ ɪᴛ ᴏɴ ᴠᴏɪᴄᴇᴄʜᴀᴛ.__
 
 ⚡️ ** ɪɴʟɪɴᴇ sᴇᴀʀᴄʜ ʙʏ {app.mention} **"""
-            answers.append(
-                InlineQueryResultPhoto(
-                    photo_url=thumbnail,
-                    title=title,
-                    thumb_url=thumbnail,
-                    description=description,
-                    caption=searched_text,
-                    reply_markup=buttons,
-                )
-            )
+    return InlineQueryResultPhoto(
+        photo_url=thumbnail,
+        title=title,
+        thumb_url=thumbnail,
+        description=description,
+        caption=searched_text,
+        reply_markup=buttons,
+    )
+
+
+async def _search(text: str) -> list:
+    result = (await VideosSearch(text, limit=20).next()).get("result") or []
+    rows = []
+    for item in result[:15]:
+        haystack = f"{item['title']} {item['channel']['name']}".lower()
+        rows.append((haystack, build_result(item)))
+    searches.set(text, rows)
+    return rows
+
+
+async def search(text: str) -> list:
+    """Cached YouTube search; concurrent calls for one query share a request."""
+    rows = searches.get(text)
+    if rows is not None:
+        return rows
+    task = inflight.get(text)
+    if task is None:
+        task = asyncio.ensure_future(_search(text))
+        inflight[text] = task
+        task.add_done_callback(lambda _: inflight.pop(text, None))
+    return await asyncio.shield(task)
+
+
+def from_prefix(text: str) -> list | None:
+    """Results of the longest cached prefix that still match every word."""
+    words = text.split()
+    for end in range(len(text) - 1, MIN_PREFIX - 1, -1):
+        rows = searches.get(text[:end], count=False)
+        if rows is None:
+            continue
+        matched = [row for row in rows if all(word in row[0] for word in words)]
+        return matched if len(matched) >= 5 else None
+    return None
+
+
+@app.on_inline_query(~BANNED_USERS)
+async def inline_query_handler(client, query):
+    text = " ".join(query.query.lower().split())
+    if text == "":
         try:
-            return await client.answer_inline_query(query.id, results=answers)
+            await client.answer_inline_query(query.id, results=answer, cache_time=10)
+        except Exception:
+            return
+    else:
+        rows = searches.get(text)
+        if rows is None:
+            rows = from_prefix(text)
+        if rows is None:
+            user_id = query.from_user.id
+            latest[user_id] = query.id
+            await asyncio.sleep(DEBOUNCE)
+            if latest.get(user_id) != query.id:
+                # A newer query from this user replaced this one.
+                return
+            latest.pop(user_id, None)
+            try:
+                rows = await search(text)
+            except Exception:
+                return
+        try:
+            return await client.answer_inline_query(
+                query.id,
+                results=[result for _, result in rows],
+                cache_time=CACHE_TIME,
+            )
         except Exception:
             return
@@ -18,7 +18,7 @@ from strings import get_string
 from YukkiMusic import app
 from YukkiMusic.core.call import Yukki
 from YukkiMusic.utils.database import (
-    get_assistant,
+    assistant_members,
     get_client,
     get_lang,
     is_active_chat,
@@ -32,7 +32,7 @@ async def auto_leave():
     if config.AUTO_LEAVING_ASSISTANT:
         from YukkiMusic.core.userbot import assistants
 
-        async def leave_inactive_chats(client):
+        async def leave_inactive_chats(num, client):
             left = 0
             try:
                 async for i in client.get_dialogs():
@@ -53,6 +53,7 @@ async def auto_leave():
                             if not await is_active_chat(chat_id):
                                 try:
                                     await client.leave_chat(chat_id)
+                                    await assistant_members.remove(num, chat_id)
                                     left += 1
                                 except Exception:
                                     continue
@@ -64,7 +65,7 @@ async def auto_leave():
             tasks = []
             for num in assistants:
                 client = await get_client(num)
-                tasks.append(leave_inactive_chats(client))
+                tasks.append(leave_inactive_chats(num, client))
             await asyncio.gather(*tasks)
 
 
@@ -77,14 +78,8 @@ async def auto_end():
                     del autoend[chat_id]
                     continue
 
-                userbot = await get_assistant(chat_id)
-                members = []
-
                 try:
-                    async for member in userbot.get_call_members(chat_id):
-                        if member is None:
-                            continue
-                        members.append(member)
+                    members = await Yukki.members.get(chat_id)
                 except ValueError:
                     try:
                         await Yukki.stop_stream(chat_id)
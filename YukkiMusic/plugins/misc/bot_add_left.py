@@ -14,11 +14,29 @@ from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup, Message
 from config import LOG, LOG_GROUP_ID
 from YukkiMusic import app
 from YukkiMusic.utils.database import (
+    assistant_members,
     delete_served_chat,
     get_assistant,
     is_on_off,
 )
 
+assistant_members_group = 17
+
+
+@app.on_message(
+    (filters.new_chat_members | filters.left_chat_member),
+    group=assistant_members_group,
+)
+async def on_assistant_moved(_, message: Message):
+    for user in message.new_chat_members or [message.left_chat_member]:
+        number = assistant_members.number(user.id)
+        if number is None:
+            continue
+        if message.new_chat_members:
+            await assistant_members.add(number, message.chat.id)
+        else:
+            await assistant_members.remove(number, message.chat.id)
+
 
 @app.on_message(filters.new_chat_members)
 async def on_bot_added(_, message):
@@ -102,5 +120,8 @@ async def on_bot_kicked(_, message: Message):
             )
             await delete_served_chat(chat_id)
             await userbot.leave_chat(chat_id)
+            await assistant_members.remove(
+                assistant_members.number(userbot.id), chat_id
+            )
     except Exception:
         pass
@@ -11,8 +11,6 @@ import asyncio
 import time
 from datetime import datetime, timedelta
 
-from pyrogram.types import InlineKeyboardMarkup
-
 from strings import get_string
 from YukkiMusic.core.call import Yukki
 from YukkiMusic.misc import db
@@ -22,34 +20,18 @@ from YukkiMusic.utils.database import (
     get_active_chats,
     get_assistant,
     get_lang,
+    get_played,
     is_music_playing,
     set_loop,
 )
 from YukkiMusic.utils.formatters import seconds_to_min
 from YukkiMusic.utils.inline import stream_markup_timer, telegram_markup_timer
+from YukkiMusic.utils.stream.progress import progress
 
 checker = {}
 muted = {}
 
 
-async def timer():
-    while not await asyncio.sleep(1):
-        active_chats = await get_active_chats()
-        for chat_id in active_chats:
-            if not await is_music_playing(chat_id):
-                continue
-            playing = db.get(chat_id)
-            if not playing:
-                continue
-            file_path = playing[0]["file"]
-            if "index_" in file_path or "live_" in file_path:
-                continue
-            duration = int(playing[0]["seconds"])
-            if duration == 0:
-                continue
-            db[chat_id][0]["played"] += 1
-
-
 async def leave_if_muted():
     while True:
         await asyncio.sleep(2)
@@ -58,12 +40,8 @@ async def leave_if_muted():
                 _ = details["_"]
                 try:
                     userbot = await get_assistant(chat_id)
-                    members = []
                     try:
-                        async for member in userbot.get_call_members(chat_id):
-                            if member is None:
-                                continue
-                            members.append(member)
+                        members = await Yukki.members.get(chat_id)
                     except ValueError:
                         try:
                             await Yukki.stop_stream(chat_id)
@@ -85,107 +63,109 @@ async def leave_if_muted():
                     del muted[chat_id]
 
 
-async def markup_timer():
-    while True:
-        await asyncio.sleep(2)
-        active_chats = await get_active_chats()
-        for chat_id in active_chats:
-            if not await is_music_playing(chat_id):
-                continue
-
-            playing = db.get(chat_id)
-            if not playing:
-                continue
+async def check_members(chat_id):
+    if not await is_music_playing(chat_id):
+        return
 
-            duration_seconds = int(playing[0]["seconds"])
+    try:
+        language = await get_lang(chat_id)
+        _ = get_string(language)
+    except Exception:
+        _ = get_string("en")
 
+    try:
+        userbot = await get_assistant(chat_id)
+        try:
+            members = await Yukki.members.get(chat_id)
+        except ValueError:
             try:
-                language = await get_lang(chat_id)
-                _ = get_string(language)
+                await Yukki.stop_stream(chat_id)
             except Exception:
-                _ = get_string("en")
+                pass
+            return
 
-            is_muted = False
-            try:
-                userbot = await get_assistant(chat_id)
-                members = []
-                try:
-                    async for member in userbot.get_call_members(chat_id):
-                        if member is None:
-                            continue
-                        members.append(member)
-                except ValueError:
-                    try:
-                        await Yukki.stop_stream(chat_id)
-                    except Exception:
-                        pass
-                    continue
-
-                if not members:
-                    await Yukki.stop_stream(chat_id)
-                    await set_loop(chat_id, 0)
-                    continue
-
-                if len(members) <= 1 and chat_id not in autoend:
-                    autoend[chat_id] = datetime.now() + timedelta(seconds=30)
-
-                m = next((m for m in members if m.chat.id == userbot.id), None)
-                if m is None:
-                    continue
-
-                is_muted = bool(m.is_muted and not m.can_self_unmute)
-                if is_muted:
-                    if chat_id not in muted:
-                        muted[chat_id] = {
-                            "timestamp": time.time(),
-                            "_": _,
-                        }
+        if not members:
+            await Yukki.stop_stream(chat_id)
+            await set_loop(chat_id, 0)
+            return
 
-            except Exception:
-                pass
+        if len(members) <= 1 and chat_id not in autoend:
+            autoend[chat_id] = datetime.now() + timedelta(seconds=30)
 
-            if duration_seconds == 0:
-                continue
+        m = next((m for m in members if m.chat.id == userbot.id), None)
+        if m is None:
+            return
 
-            try:
-                mystic = playing[0]["mystic"]
-                markup = playing[0]["markup"]
-            except Exception:
-                continue
+        is_muted = bool(m.is_muted and not m.can_self_unmute)
+        if is_muted:
+            if chat_id not in muted:
+                muted[chat_id] = {
+                    "timestamp": time.time(),
+                    "_": _,
+                }
 
-            try:
-                check = wrong[chat_id][mystic.id]
-                if check is False:
-                    continue
-            except Exception:
-                pass
+    except Exception:
+        pass
 
-            try:
-                buttons = (
-                    stream_markup_timer(
-                        _,
-                        playing[0]["vidid"],
-                        chat_id,
-                        seconds_to_min(playing[0]["played"]),
-                        playing[0]["dur"],
-                    )
-                    if markup == "stream"
-                    else telegram_markup_timer(
-                        _,
-                        chat_id,
-                        seconds_to_min(playing[0]["played"]),
-                        playing[0]["dur"],
-                    )
-                )
-
-                await mystic.edit_reply_markup(
-                    reply_markup=InlineKeyboardMarkup(buttons)
-                )
 
-            except Exception:
-                continue
+async def members_timer():
+    semaphore = asyncio.Semaphore(10)
 
+    async def limited(chat_id):
+        async with semaphore:
+            await check_members(chat_id)
 
-asyncio.create_task(timer(), name="timer")
-asyncio.create_task(markup_timer(), name="markup_timer")
+    while True:
+        await asyncio.sleep(2)
+        active_chats = list(await get_active_chats())
+        await asyncio.gather(*[limited(chat_id) for chat_id in active_chats])
+
+
+async def render_timer(chat_id):
+    if not await is_music_playing(chat_id):
+        return
+
+    playing = db.get(chat_id)
+    if not playing:
+        return
+
+    if int(playing[0].seconds) == 0:
+        return
+
+    mystic = playing[0].mystic
+    markup = playing[0].markup
+    if not mystic:
+        return
+
+    if wrong.get(chat_id, {}).get(mystic.id) is False:
+        return
+
+    try:
+        language = await get_lang(chat_id)
+        _ = get_string(language)
+    except Exception:
+        _ = get_string("en")
+
+    played = seconds_to_min(await get_played(chat_id))
+    buttons = (
+        stream_markup_timer(
+            _,
+            playing[0].vidid,
+            chat_id,
+            played,
+            playing[0].dur,
+        )
+        if markup == "stream"
+        else telegram_markup_timer(
+            _,
+            chat_id,
+            played,
+            playing[0].dur,
+        )
+    )
+    return mystic, buttons
+
+
+asyncio.create_task(progress.run(render_timer), name="markup_timer")
+asyncio.create_task(members_timer(), name="members_timer")
 asyncio.create_task(leave_if_muted(), name="leave_if_muted")
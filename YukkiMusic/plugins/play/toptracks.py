@@ -14,12 +14,8 @@ from pyrogram.types import InlineKeyboardMarkup
 
 from config import BANNED_USERS
 from YukkiMusic import app
-from YukkiMusic.utils.database import (
-    get_global_tops,
-    get_particulars,
-    get_userss,
-)
-from YukkiMusic.utils.decorators import asyncify, languageCB
+from YukkiMusic.utils.database import get_particulars, get_userss, leaderboard
+from YukkiMusic.utils.decorators import languageCB
 from YukkiMusic.utils.inline.playlist import (
     botplaylist_markup,
     failed_top_markup,
@@ -75,47 +71,14 @@ async def server_to_play(client, query, _):
     )
     upl = failed_top_markup(_)
     if what == "Global":
-        stats = await get_global_tops()
+        stats = await leaderboard.top("tracks")
     elif what == "Group":
-        stats = await get_particulars(chat_id)
+        stats = leaderboard.rank(await get_particulars(chat_id), 11)
     elif what == "Personal":
-        stats = await get_userss(query.from_user.id)
-    if not stats:
+        stats = leaderboard.rank(await get_userss(query.from_user.id), 11)
+    details = [vidid for vidid, _count, _title in stats if vidid != "telegram"][:10]
+    if not details:
         return await mystic.edit(_["tracks_2"].format(what), reply_markup=upl)
-
-    @asyncify
-    def get_stats():
-        results = {}
-        for i in stats:
-            top_list = stats[i]["spot"]
-            results[str(i)] = top_list
-            list_arranged = dict(
-                sorted(
-                    results.items(),
-                    key=lambda item: item[1],
-                    reverse=True,
-                )
-            )
-        if not results:
-            return mystic.edit(_["tracks_2"].format(what), reply_markup=upl)
-        details = []
-        limit = 0
-        for vidid, count in list_arranged.items():
-            if vidid == "telegram":
-                continue
-            if limit == 10:
-                break
-            limit += 1
-            details.append(vidid)
-        if not details:
-            return mystic.edit(_["tracks_2"].format(what), reply_markup=upl)
-        return details
-
-    try:
-        details = await get_stats()
-    except Exception as e:
-        print(e)
-        return
     try:
         await stream(
             _,
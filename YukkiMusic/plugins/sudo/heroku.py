@@ -15,7 +15,6 @@ import socket
 from datetime import datetime
 
 import aiofiles
-import aiohttp
 import dotenv
 import heroku3
 from git import Repo
@@ -39,6 +38,8 @@ from YukkiMusic.utils.database import (
 )
 from YukkiMusic.utils.decorators import AdminActual, asyncify, language
 from YukkiMusic.utils.decorators.language import language
+from YukkiMusic.utils.httpclient import http
+from YukkiMusic.utils.stream.models import ChatQueue
 
 
 @asyncify
@@ -191,11 +192,10 @@ async def usage_dynos(client, message, _):
     }
     path = "/accounts/" + account_id + "/actions/get-quota"
     url = "https://api.heroku.com" + path
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as r:
-            if r.status != 200:
-                return await dyno.edit("Unable to fetch.")
-            result = await r.json()
+    async with http.get(url, headers=headers) as r:
+        if r.status != 200:
+            return await dyno.edit("Unable to fetch.")
+        result = await r.json()
     quota = result["account_quota"]
     quota_used = result["quota_used"]
     remaining_quota = quota - quota_used
@@ -324,7 +324,7 @@ async def reboot(client, message: Message, _):
     )
     await asyncio.sleep(1)
     try:
-        db[message.chat.id] = []
+        db[message.chat.id] = ChatQueue()
         await Yukki.stop_stream(message.chat.id)
     except Exception:
         pass
@@ -335,7 +335,7 @@ async def reboot(client, message: Message, _):
         except Exception:
             pass
         try:
-            db[chat_id] = []
+            db[chat_id] = ChatQueue()
             await Yukki.stop_stream(chat_id)
         except Exception:
             pass
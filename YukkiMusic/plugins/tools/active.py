@@ -19,11 +19,12 @@ from YukkiMusic.utils.database.memorydatabase import (
     remove_active_chat,
     remove_active_video_chat,
 )
+from YukkiMusic.utils.stream.models import ChatQueue
 
 
 # Function for removing the Active voice and video chat also clear the db dictionary for the chat
 async def _clear_(chat_id):
-    db[chat_id] = []
+    db[chat_id] = ChatQueue()
     await remove_active_video_chat(chat_id)
     await remove_active_chat(chat_id)
 
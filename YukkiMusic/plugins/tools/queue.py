@@ -23,11 +23,13 @@ from YukkiMusic.platforms import saavn
 from YukkiMusic.utils import Yukkibin, get_channeplayCB, seconds_to_min
 from YukkiMusic.utils.database import (
     get_cmode,
+    get_played,
     is_active_chat,
     is_music_playing,
 )
 from YukkiMusic.utils.decorators.language import language, languageCB
 from YukkiMusic.utils.inline.queue import queue_back_markup, queue_markup
+from YukkiMusic.utils.stream.models import Source
 
 basic = {}
 
@@ -40,12 +42,21 @@ def get_image(videoid):
         return config.YOUTUBE_IMG_URL
 
 
+async def get_queue_image(item):
+    if item.source is Source.INDEX:
+        return config.STREAM_IMG_URL
+    if item.source is Source.TELEGRAM:
+        return config.TELEGRAM_VIDEO_URL if item.video else config.TELEGRAM_AUDIO_URL
+    if item.source is Source.SOUNDCLOUD:
+        return config.SOUNCLOUD_IMG_URL
+    if item.source is Source.SAAVN:
+        details = await saavn.info(item.url)
+        return details["thumb"]
+    return get_image(item.vidid)
+
+
 def get_duration(playing):
-    file_path = playing[0]["file"]
-    if "index_" in file_path or "live_" in file_path:
-        return "Unknown"
-    duration_seconds = int(playing[0]["seconds"])
-    if duration_seconds == 0:
+    if not playing[0].seekable:
         return "Unknown"
     else:
         return "Inline"
@@ -71,32 +82,12 @@ async def ping_com(client, message: Message, _):
     got = db.get(chat_id)
     if not got:
         return await message.reply_text(_["queue_2"])
-    file = got[0]["file"]
-    videoid = got[0]["vidid"]
-    user = got[0]["by"]
-    title = (got[0]["title"]).title()
-    type = (got[0]["streamtype"]).title()
+    videoid = got[0].vidid
+    user = got[0].by
+    title = (got[0].title).title()
+    type = (got[0].streamtype).title()
     DUR = get_duration(got)
-    if "live_" in file:
-        IMAGE = get_image(videoid)
-    elif "vid_" in file:
-        IMAGE = get_image(videoid)
-    elif "index_" in file:
-        IMAGE = config.STREAM_IMG_URL
-    else:
-        if videoid == "telegram":
-            IMAGE = (
-                config.TELEGRAM_AUDIO_URL
-                if type == "Audio"
-                else config.TELEGRAM_VIDEO_URL
-            )
-        elif videoid == "soundcloud":
-            IMAGE = config.SOUNCLOUD_IMG_URL
-        elif "saavn" in videoid:
-            details = await saavn.info(got[0]["url"])
-            IMAGE = details["thumb"]
-        else:
-            IMAGE = get_image(videoid)
+    IMAGE = await get_queue_image(got[0])
     send = (
         "**⌛️ Duration:** Unknown duration limit\n\nClick on below button to get whole queued list"
         if DUR == "Unknown"
@@ -117,15 +108,15 @@ async def ping_com(client, message: Message, _):
             DUR,
             "c" if cplay else "g",
             videoid,
-            seconds_to_min(got[0]["played"]),
-            got[0]["dur"],
+            seconds_to_min(await get_played(chat_id)),
+            got[0].dur,
         )
     )
     basic[videoid] = True
     mystic = await message.reply_photo(IMAGE, caption=cap, reply_markup=upl)
     if DUR != "Unknown":
         try:
-            while db[chat_id][0]["vidid"] == videoid:
+            while db[chat_id][0].vidid == videoid:
                 await asyncio.sleep(5)
                 if await is_active_chat(chat_id):
                     if basic[videoid]:
@@ -136,8 +127,8 @@ async def ping_com(client, message: Message, _):
                                     DUR,
                                     "c" if cplay else "g",
                                     videoid,
-                                    seconds_to_min(db[chat_id][0]["played"]),
-                                    db[chat_id][0]["dur"],
+                                    seconds_to_min(await get_played(chat_id)),
+                                    db[chat_id][0].dur,
                                 )
                                 await mystic.edit_reply_markup(reply_markup=buttons)
                             except FloodWait:
@@ -190,11 +181,11 @@ async def queued_tracks(client, query, _):
     for x in got:
         j += 1
         if j == 1:
-            msg += f"Current playing:\n\n🏷Title: {x['title']}\nDuration: {x['dur']}\nBy: {x['by']}\n\n"
+            msg += f"Current playing:\n\n🏷Title: {x.title}\nDuration: {x.dur}\nBy: {x.by}\n\n"
         elif j == 2:
-            msg += f"Queued:\n\n🏷Title: {x['title']}\nDuratiom: {x['dur']}\nby: {x['by']}\n\n"
+            msg += f"Queued:\n\n🏷Title: {x.title}\nDuratiom: {x.dur}\nby: {x.by}\n\n"
         else:
-            msg += f"🏷Title: {x['title']}\nDuration: {x['dur']}\nBy: {x['by']}\n\n"
+            msg += f"🏷Title: {x.title}\nDuration: {x.dur}\nBy: {x.by}\n\n"
     if "Queued" in msg:
         if len(msg) < 700:
             await asyncio.sleep(1)
@@ -233,32 +224,12 @@ async def queue_back(client, query, _):
     if not got:
         return await query.answer(_["queue_2"], show_alert=True)
     await query.answer(_["set_cb_8"], show_alert=True)
-    file = got[0]["file"]
-    videoid = got[0]["vidid"]
-    user = got[0]["by"]
-    title = (got[0]["title"]).title()
-    type = (got[0]["streamtype"]).title()
+    videoid = got[0].vidid
+    user = got[0].by
+    title = (got[0].title).title()
+    type = (got[0].streamtype).title()
     DUR = get_duration(got)
-    if "live_" in file:
-        IMAGE = get_image(videoid)
-    elif "vid_" in file:
-        IMAGE = get_image(videoid)
-    elif "index_" in file:
-        IMAGE = config.STREAM_IMG_URL
-    else:
-        if videoid == "telegram":
-            IMAGE = (
-                config.TELEGRAM_AUDIO_URL
-                if type == "Audio"
-                else config.TELEGRAM_VIDEO_URL
-            )
-        elif videoid == "soundcloud":
-            IMAGE = config.SOUNCLOUD_IMG_URL
-        elif "saavn" in videoid:
-            details = await saavn.info(got[0]["url"])
-            IMAGE = details["thumb"]
-        else:
-            IMAGE = get_image(videoid)
+    IMAGE = await get_queue_image(got[0])
     send = (
         "**⌛️ Duration:** Unknown duration limit\n\nClick on below button to get whole queued list"
         if DUR == "Unknown"
@@ -279,8 +250,8 @@ async def queue_back(client, query, _):
             DUR,
             cplay,
             videoid,
-            seconds_to_min(got[0]["played"]),
-            got[0]["dur"],
+            seconds_to_min(await get_played(chat_id)),
+            got[0].dur,
         )
     )
     basic[videoid] = True
@@ -289,7 +260,7 @@ async def queue_back(client, query, _):
     mystic = await query.edit_message_media(media=med, reply_markup=upl)
     if DUR != "Unknown":
         try:
-            while db[chat_id][0]["vidid"] == videoid:
+            while db[chat_id][0].vidid == videoid:
                 await asyncio.sleep(5)
                 if await is_active_chat(chat_id):
                     if basic[videoid]:
@@ -300,8 +271,8 @@ async def queue_back(client, query, _):
                                     DUR,
                                     cplay,
                                     videoid,
-                                    seconds_to_min(db[chat_id][0]["played"]),
-                                    db[chat_id][0]["dur"],
+                                    seconds_to_min(await get_played(chat_id)),
+                                    db[chat_id][0].dur,
                                 )
                                 await mystic.edit_reply_markup(reply_markup=buttons)
                             except FloodWait:
@@ -10,33 +10,31 @@
 
 
 from pyrogram import filters
-from pyrogram.enums import ChatMembersFilter
-from pyrogram.types import Message
+from pyrogram.types import ChatMemberUpdated, Message
 
-from config import BANNED_USERS, adminlist
+from config import BANNED_USERS
 from strings import command
 from YukkiMusic import app
-from YukkiMusic.utils.database import get_authuser_names
+from YukkiMusic.utils.admincache import admincache
 from YukkiMusic.utils.decorators import language
-from YukkiMusic.utils.formatters import alpha_to_int
+
+admincache_group = 16
 
 
 @app.on_message(command("RELOAD_COMMAND") & filters.group & ~BANNED_USERS)
 @language
 async def reload_admin_cache(client, message: Message, _):
-    try:
-        chat_id = message.chat.id
-        admins = app.get_chat_members(chat_id, filter=ChatMembersFilter.ADMINISTRATORS)
-        authusers = await get_authuser_names(chat_id)
-        adminlist[chat_id] = []
-        async for user in admins:
-            if user.privileges.can_manage_video_chats:
-                adminlist[chat_id].append(user.user.id)
-        for user in authusers:
-            user_id = await alpha_to_int(user)
-            adminlist[chat_id].append(user_id)
-        await message.reply_text(_["admin_20"])
-    except Exception:
-        await message.reply_text(
+    if await admincache.load(message.chat.id) is None:
+        return await message.reply_text(
             "Failed to reload admincache make sure bot is an admin in your chat"
         )
+    await message.reply_text(_["admin_20"])
+
+
+@app.on_chat_member_updated(filters.group, group=admincache_group)
+async def admin_cache_update(client, update: ChatMemberUpdated):
+    member = update.new_chat_member or update.old_chat_member
+    if member and member.user:
+        admincache.member_updated(
+            update.chat.id, member.user.id, update.new_chat_member
+        )
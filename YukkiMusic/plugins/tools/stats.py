@@ -26,17 +26,23 @@ from YukkiMusic.core.mongo import mongodb
 from YukkiMusic.core.userbot import assistants
 from YukkiMusic.misc import SUDOERS
 from YukkiMusic.platforms import youtube
+from YukkiMusic.utils.admincache import admincache
 from YukkiMusic.utils.database import (
-    get_global_tops,
+    assistant_members,
+    assistant_scheduler,
     get_particulars,
     get_queries,
     get_served_chats,
     get_served_users,
     get_sudoers,
-    get_top_chats,
-    get_topp_users,
+    leaderboard,
+    spotifymap,
 )
-from YukkiMusic.utils.decorators import asyncify, language, languageCB
+from YukkiMusic.utils.decorators import context_load_avg, language, languageCB
+from YukkiMusic.utils.downloader import downloader
+from YukkiMusic.utils.extractor import extractor
+from YukkiMusic.utils.httpclient import http
+from YukkiMusic.utils.inline.playlist import close_markup
 from YukkiMusic.utils.inline.stats import (
     back_stats_buttons,
     back_stats_markup,
@@ -45,6 +51,9 @@ from YukkiMusic.utils.inline.stats import (
     stats_buttons,
     top_ten_stats_markup,
 )
+from YukkiMusic.utils.mediacache import mediacache
+from YukkiMusic.utils.stream.prefetch import prefetcher
+from YukkiMusic.utils.stream.progress import progress
 
 
 @app.on_message(command("STATS_COMMAND") & ~BANNED_USERS)
@@ -62,42 +71,15 @@ async def stats_global(client, message: Message, _):
 @language
 async def gstats_global(client, message: Message, _):
     mystic = await message.reply_text(_["gstats_1"])
-    stats = await get_global_tops()
+    stats = [
+        (vidid, count)
+        for vidid, count, _title in await leaderboard.top("tracks")
+        if vidid != "telegram"
+    ]
     if not stats:
         await asyncio.sleep(1)
         return await mystic.edit(_["gstats_2"])
-
-    @asyncify
-    def get_stats():
-        results = {}
-        for i in stats:
-            top_list = stats[i]["spot"]
-            results[str(i)] = top_list
-            list_arranged = dict(
-                sorted(
-                    results.items(),
-                    key=lambda item: item[1],
-                    reverse=True,
-                )
-            )
-        if not results:
-            return mystic.edit(_["gstats_2"])
-        videoid = None
-        co = None
-        for vidid, count in list_arranged.items():
-            if vidid == "telegram":
-                continue
-            else:
-                videoid = vidid
-                co = count
-            break
-        return videoid, co
-
-    try:
-        videoid, co = await get_stats()
-    except Exception as e:
-        print(e)
-        return
+    videoid, co = stats[0]
     (
         title,
         duration_min,
@@ -134,71 +116,44 @@ async def top_users_ten(client, query, _):
         )
     )
     if what == "Tracks":
-        stats = await get_global_tops()
+        stats = await leaderboard.top("tracks")
+        tracks, total_count = await leaderboard.totals()
     elif what == "Chats":
-        stats = await get_top_chats()
+        stats = await leaderboard.top("chats")
     elif what == "Users":
-        stats = await get_topp_users()
+        stats = await leaderboard.top("users")
     elif what == "Here":
-        stats = await get_particulars(chat_id)
+        particulars = await get_particulars(chat_id)
+        stats = leaderboard.rank(particulars)
+        tracks = len(particulars)
+        total_count = sum(data["spot"] for data in particulars.values())
     if not stats:
         await asyncio.sleep(1)
         return await mystic.edit(_["gstats_2"], reply_markup=upl)
-    queries = await get_queries()
-
-    @asyncify
-    def get_stats():
-        results = {}
-        for i in stats:
-            top_list = stats[i] if what in ["Chats", "Users"] else stats[i]["spot"]
-            results[str(i)] = top_list
-            list_arranged = dict(
-                sorted(
-                    results.items(),
-                    key=lambda item: item[1],
-                    reverse=True,
-                )
-            )
-        if not results:
-            return mystic.edit(_["gstats_2"], reply_markup=upl)
-        msg = ""
-        limit = 0
-        total_count = 0
-        if what in ["Tracks", "Here"]:
-            for items, count in list_arranged.items():
-                total_count += count
-                if limit == 10:
-                    continue
-                limit += 1
-                details = stats.get(items)
-                title = (details["title"][:35]).title()
-                if items == "telegram":
-                    msg += f"🔗[TelegramVideos and media's](https://t.me/telegram) ** Played {count} Times**\n\n"
-                else:
-                    msg += f"🔗 [{title}](https://www.youtube.com/watch?v={items}) ** Played {count} Times**\n\n"
-
-            temp = (
-                _["gstats_4"].format(
-                    queries,
-                    app.mention,
-                    len(stats),
-                    total_count,
-                    limit,
-                )
-                if what == "Tracks"
-                else _["gstats_7"].format(len(stats), total_count, limit)
-            )
-            msg = temp + msg
-        return msg, list_arranged
-
-    try:
-        msg, list_arranged = await get_stats()
-    except Exception as e:
-        print(e)
-        return
+    msg = ""
     limit = 0
+    if what in ["Tracks", "Here"]:
+        for items, count, title in stats[:10]:
+            limit += 1
+            title = (title[:35]).title()
+            if items == "telegram":
+                msg += f"🔗[TelegramVideos and media's](https://t.me/telegram) ** Played {count} Times**\n\n"
+            else:
+                msg += f"🔗 [{title}](https://www.youtube.com/watch?v={items}) ** Played {count} Times**\n\n"
+        temp = (
+            _["gstats_4"].format(
+                await get_queries(),
+                app.mention,
+                tracks,
+                total_count,
+                limit,
+            )
+            if what == "Tracks"
+            else _["gstats_7"].format(tracks, total_count, limit)
+        )
+        msg = temp + msg
     if what in ["Users", "Chats"]:
-        for items, count in list_arranged.items():
+        for items, count, _title in stats:
             if limit == 10:
                 break
             try:
@@ -331,6 +286,27 @@ async def bot_stats(client, query, _):
     total_queries = await get_queries()
     blocked = len(BANNED_USERS)
     sudoers = len(await get_sudoers())
+    edits = progress.stats()
+    ytcache = youtube.metadata.stats()
+    urlcache = youtube.urls.stats()
+    audio = youtube.audio_stats()
+    downloads = downloader.stats()
+    media = mediacache.stats()
+    prefetch = prefetcher.stats()
+    spotify = spotifymap.stats()
+    extract = extractor.stats()
+    admins = admincache.stats()
+    members = assistant_members.stats()
+    hosts = "\n".join(
+        f"**{host}:** {x['avg']}ms avg, {x['max']}ms max "
+        f"({x['requests']} requests, {x['failed']} failed)"
+        for host, x in http.stats(limit=5).items()
+    )
+    loads = "\n".join(
+        f"**Assistant {number}:** {x['calls']} calls, {x['joined']} chats"
+        + (f", resting {x['penalty']}s" if x["penalty"] else "")
+        for number, x in assistant_scheduler.stats().items()
+    )
     text = f""" **Bot Stats and information:**
 
 **Imported modules:** {mod}
@@ -355,7 +331,37 @@ async def bot_stats(client, query, _):
 **Total DB Storage:** {storage} ᴍʙ
 **Total DB Collection:** {collections}
 **Total DB Keys:** {objects}
-**Total Bot Queries:** `{total_queries} `
+**Total Bot Queries:** `{total_queries} `"""
+    # Kept out of the photo caption, which Telegram limits to 1024 characters.
+    counters = f"""**Progress Edits Sent:** {edits['sent']}
+**Progress Edits Skipped:** {edits['skipped']}
+**Progress Edits Flood Delayed:** {edits['flood_delayed']}
+
+**YouTube Cache Size:** {ytcache['size']}
+**YouTube Cache Hits:** {ytcache['hits']}
+**YouTube Cache Misses:** {ytcache['misses']}
+**Stream Link Cache Hits:** {urlcache['hits']} (misses {urlcache['misses']})
+**Avg Time To Audio Source:** {youtube.audio_ready_avg()}s
+**Audio Kept Native:** {audio['native']} (cpu saved {audio['cpu_saved'] if audio['cpu_saved'] is not None else 'n/a'}s)
+**Audio Transcoded:** {audio['transcoded']} (cpu used {round(audio['transcode_cpu'], 1)}s)
+**Avg Chat Settings Load:** {context_load_avg()}ms
+**Admin Cache Chats:** {admins['chats']} (scans {admins['scans']}, member events {admins['events']})
+
+**Audio Downloads Queued:** {downloads['audio_queued']} (avg wait {downloads['audio_wait']}s)
+**Video Downloads Queued:** {downloads['video_queued']} (avg wait {downloads['video_wait']}s)
+
+**Media Cache Files:** {media['files']} ({media['size'] // 1024 // 1024} ᴍʙ)
+**Media Cache Hits:** {media['hits']}
+**Media Cache Evictions:** {media['evictions']}
+**Prefetches Done:** {prefetch['done']} (cancelled {prefetch['cancelled']})
+**Extractor Workers:** {extract['alive']} (restarted {extract['restarts']} times)
+**Extractor Requests:** {extract['requests']} (failed {extract['failed']})
+**Spotify Matches Reused:** {spotify['hits']} (searched {spotify['misses']})
+
+{loads}
+**Assistant Membership Index:** {members['hits']} hits, {members['misses']} misses
+
+{hosts}
     """
     med = InputMediaPhoto(media=config.STATS_IMG_URL, caption=text)
     try:
@@ -364,6 +370,7 @@ async def bot_stats(client, query, _):
         await query.message.reply_photo(
             photo=config.STATS_IMG_URL, caption=text, reply_markup=upl
         )
+    await query.message.reply_text(counters[:4096], reply_markup=close_markup(_))
 
 
 @app.on_callback_query(
@@ -0,0 +1,143 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import logging
+import time
+
+from pyrogram.enums import ChatMembersFilter, ChatMemberStatus
+
+from YukkiMusic import app
+from YukkiMusic.utils.database import get_authuser_names
+from YukkiMusic.utils.formatters import alpha_to_int
+
+logger = logging.getLogger(__name__)
+
+ADMIN_STATUSES = (ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER)
+
+
+class _Chat:
+    __slots__ = ("admins", "auth", "loaded")
+
+    def __init__(self, admins: set, auth: set):
+        self.admins = admins
+        self.auth = auth
+        self.loaded = time.monotonic()
+
+
+class PermissionCache:
+    """
+    Per-chat sets of admins who can manage video chats and of auth users.
+
+    A chat is scanned on its first check. After that it is kept current by
+    ``ChatMemberUpdated`` events and the auth commands. Entries older than
+    ``ttl`` seconds are still served while a rescan runs in the background,
+    which covers events the bot never received. A chat whose scan failed,
+    usually because the bot is not an admin there, is not scanned again
+    for ``retry`` seconds.
+    """
+
+    def __init__(self, ttl: float = 3600, retry: float = 60):
+        self.ttl = ttl
+        self.retry = retry
+        self.chats = {}
+        self._failed = {}
+        self._loading = {}
+        self.scans = 0
+        self.events = 0
+
+    async def _scan(self, chat_id: int):
+        self.scans += 1
+        try:
+            admins = set()
+            async for member in app.get_chat_members(
+                chat_id, filter=ChatMembersFilter.ADMINISTRATORS
+            ):
+                if member.privileges and member.privileges.can_manage_video_chats:
+                    admins.add(member.user.id)
+            auth = set()
+            for name in await get_authuser_names(chat_id):
+                auth.add(await alpha_to_int(name))
+        except Exception as e:
+            logger.info(f"Could not load admins of {chat_id}: {e}")
+            self._failed[chat_id] = time.monotonic()
+            return None
+        self._failed.pop(chat_id, None)
+        self.chats[chat_id] = chat = _Chat(admins, auth)
+        return chat
+
+    def _refresh(self, chat_id: int) -> asyncio.Task:
+        task = self._loading.get(chat_id)
+        if task is None:
+            task = asyncio.create_task(self._scan(chat_id))
+            self._loading[chat_id] = task
+            task.add_done_callback(lambda _: self._loading.pop(chat_id, None))
+        return task
+
+    async def load(self, chat_id: int):
+        """Scan ``chat_id`` now; used by ``/reload``."""
+        return await self._refresh(chat_id)
+
+    async def ensure(self, chat_id: int):
+        chat = self.chats.get(chat_id)
+        if chat is not None:
+            if time.monotonic() - chat.loaded > self.ttl:
+                self._refresh(chat_id)
+            return chat
+        failed = self._failed.get(chat_id)
+        if failed is not None and time.monotonic() - failed < self.retry:
+            return None
+        return await asyncio.shield(self._refresh(chat_id))
+
+    def is_allowed(self, chat_id: int, user_id: int):
+        """True or False, or None while the chat has not been scanned."""
+        chat = self.chats.get(chat_id)
+        if chat is None:
+            return None
+        return user_id in chat.admins or user_id in chat.auth
+
+    async def check(self, chat_id: int, user_id: int):
+        """``is_allowed`` after making sure the chat was scanned."""
+        await self.ensure(chat_id)
+        return self.is_allowed(chat_id, user_id)
+
+    def member_updated(self, chat_id: int, user_id: int, member):
+        chat = self.chats.get(chat_id)
+        if chat is None:
+            return
+        self.events += 1
+        if (
+            member is not None
+            and member.status in ADMIN_STATUSES
+            and member.privileges
+            and member.privileges.can_manage_video_chats
+        ):
+            chat.admins.add(user_id)
+        else:
+            chat.admins.discard(user_id)
+
+    def add_auth(self, chat_id: int, user_id: int):
+        chat = self.chats.get(chat_id)
+        if chat is not None:
+            chat.auth.add(user_id)
+
+    def remove_auth(self, chat_id: int, user_id: int):
+        chat = self.chats.get(chat_id)
+        if chat is not None:
+            chat.auth.discard(user_id)
+
+    def forget(self, chat_id: int):
+        self.chats.pop(chat_id, None)
+        self._failed.pop(chat_id, None)
+
+    def stats(self) -> dict:
+        return {"chats": len(self.chats), "scans": self.scans, "events": self.events}
+
+
+admincache = PermissionCache()
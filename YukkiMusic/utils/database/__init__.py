@@ -10,5 +10,9 @@
 
 
 from .assistantdatabase import *
+from .assistantmembers import *
+from .leaderboard import *
 from .memorydatabase import *
 from .mongodatabase import *
+from .spotifymap import *
+from .statswriter import *
@@ -8,17 +8,132 @@
 # All rights reserved.
 #
 
-import random
+import time
 
 from pytgcalls import PyTgCalls
 
 from YukkiMusic import userbot
 from YukkiMusic.core.mongo import mongodb
 
+from .assistantmembers import assistant_members
+from .memorydatabase import active
+
 db = mongodb.assistants
 
 assistantdict = {}
 
+# Live calls an idle chat's assistant may have above the least loaded one
+# before the chat is moved on its next call.
+REBALANCE_MARGIN = 5
+
+
+class AssistantScheduler:
+    """
+    Places chats on the least loaded assistant.
+
+    Load is the number of live calls an assistant holds plus the chats
+    placed on it in the last minute that have not started yet, then the
+    number of chats it has joined. An assistant that recently got a
+    FloodWait or ChannelsTooMuch is skipped until the penalty runs out,
+    unless no other assistant is left. When a call starts in a chat whose
+    assistant is well above the least loaded one, the chat is moved to the
+    least loaded assistant that is already a member there.
+    """
+
+    # Seconds an assistant that hit ChannelsTooMuch is skipped.
+    full_penalty = 3600
+
+    def __init__(self):
+        self.penalties = {}
+        self.placed = []
+        self.moved = 0
+
+    @staticmethod
+    def number(client) -> int:
+        return userbot.clients.index(client) + 1
+
+    def calls(self) -> dict:
+        counts = {}
+        for chat_id in active.snapshot():
+            number = assistantdict.get(chat_id)
+            if number is not None:
+                counts[number] = counts.get(number, 0) + 1
+        return counts
+
+    def _load(self) -> dict:
+        now = time.monotonic()
+        self.placed = [
+            (at, chat_id, number)
+            for at, chat_id, number in self.placed
+            if now - at < 60 and chat_id not in active
+        ]
+        load = self.calls()
+        for _, _, number in self.placed:
+            load[number] = load.get(number, 0) + 1
+        return load
+
+    def penalize(self, number: int, seconds: float):
+        until = time.monotonic() + seconds
+        self.penalties[number] = max(self.penalties.get(number, 0), until)
+
+    def _eligible(self, exclude=()) -> list:
+        from YukkiMusic.core.userbot import assistants
+
+        now = time.monotonic()
+        candidates = [number for number in assistants if number not in exclude]
+        ready = [n for n in candidates if self.penalties.get(n, 0) <= now]
+        return ready or candidates or list(assistants)
+
+    def pick(self, exclude=(), chat_id: int = None) -> int:
+        load = self._load()
+        number = min(
+            self._eligible(exclude),
+            key=lambda n: (load.get(n, 0), assistant_members.count(n)),
+        )
+        if chat_id is not None:
+            self.placed.append((time.monotonic(), chat_id, number))
+        return number
+
+    def rebalance(self, chat_id: int, number: int) -> int:
+        """
+        Assistant ``chat_id`` should use for a call it is about to start.
+        Only assistants indexed as members of the chat are candidates, so
+        a move never needs a join or leaves one more assistant behind.
+        """
+        if chat_id in active:
+            return number
+        joined = [
+            n
+            for n in self._eligible(exclude={number})
+            if assistant_members.is_member(n, chat_id, count=False)
+        ]
+        if not joined:
+            return number
+        load = self._load()
+        best = min(joined, key=lambda n: (load.get(n, 0), assistant_members.count(n)))
+        penalized = self.penalties.get(number, 0) > time.monotonic()
+        if penalized or load.get(number, 0) - load.get(best, 0) > REBALANCE_MARGIN:
+            self.placed.append((time.monotonic(), chat_id, best))
+            return best
+        return number
+
+    def stats(self) -> dict:
+        from YukkiMusic.core.userbot import assistants
+
+        now = time.monotonic()
+        calls = self.calls()
+        return {
+            number: {
+                "calls": calls.get(number, 0),
+                "joined": assistant_members.count(number),
+                "penalty": max(0, int(self.penalties.get(number, 0) - now)),
+            }
+            for number in assistants
+        }
+
+
+assistant_scheduler = AssistantScheduler()
+
 
 async def get_client(assistant: int):
     clients = userbot.clients
@@ -38,27 +153,35 @@ async def save_assistant(chat_id, number):
     return await get_assistant(chat_id)
 
 
+async def rebalance_assistant(chat_id: int) -> int:
+    """Move ``chat_id`` to a less loaded assistant if it should be."""
+    number = assistantdict.get(chat_id)
+    if number is None:
+        return None
+    moved = assistant_scheduler.rebalance(chat_id, number)
+    if moved != number:
+        assistant_scheduler.moved += 1
+        await save_assistant(chat_id, moved)
+    return moved
+
+
 async def set_assistant(chat_id):
     from YukkiMusic.core.userbot import assistants
 
     dbassistant = await db.find_one({"chat_id": chat_id})
     current_assistant = dbassistant["assistant"] if dbassistant else None
 
-    available_assistants = [assi for assi in assistants if assi != current_assistant]
-
-    if len(available_assistants) <= 1:
-        ran_assistant = random.choice(assistants)
-    else:
-        ran_assistant = random.choice(available_assistants)
+    exclude = {current_assistant} if len(assistants) > 1 else ()
+    number = assistant_scheduler.pick(exclude, chat_id)
 
-    assistantdict[chat_id] = ran_assistant
+    assistantdict[chat_id] = number
     await db.update_one(
         {"chat_id": chat_id},
-        {"$set": {"assistant": ran_assistant}},
+        {"$set": {"assistant": number}},
         upsert=True,
     )
 
-    userbot = await get_client(ran_assistant)
+    userbot = await get_client(number)
     return userbot
 
 
@@ -90,16 +213,14 @@ async def get_assistant(chat_id: int) -> str:
 
 
 async def set_calls_assistant(chat_id):
-    from YukkiMusic.core.userbot import assistants
-
-    ran_assistant = random.choice(assistants)
-    assistantdict[chat_id] = ran_assistant
+    number = assistant_scheduler.pick(chat_id=chat_id)
+    assistantdict[chat_id] = number
     await db.update_one(
         {"chat_id": chat_id},
-        {"$set": {"assistant": ran_assistant}},
+        {"$set": {"assistant": number}},
         upsert=True,
     )
-    return ran_assistant
+    return number
 
 
 async def group_assistant(self, chat_id: int) -> PyTgCalls:
@@ -0,0 +1,125 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import logging
+
+from pyrogram.enums import ChatType
+
+from YukkiMusic import userbot
+from YukkiMusic.core.mongo import mongodb
+
+logger = logging.getLogger(__name__)
+
+membersdb = mongodb.assistantmembers
+
+GROUP_TYPES = (ChatType.GROUP, ChatType.SUPERGROUP, ChatType.CHANNEL)
+
+
+class AssistantMembers:
+    """
+    Chats each assistant has joined, keyed by assistant number.
+
+    The index is stored in Mongo so it is usable right after a restart,
+    and is rebuilt from every assistant's dialogs in the background at
+    startup. Joins and leaves seen by the bot or made by the bot keep it
+    current; a chat that turns out not to be joined is removed on the
+    failed call. Changes made while an assistant is being scanned are
+    applied on top of the scan result.
+    """
+
+    def __init__(self):
+        self.chats = {}
+        self._scanning = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def load(self):
+        async for doc in membersdb.find({}):
+            self.chats[doc["_id"]] = set(doc["chats"])
+
+    async def scan(self, number: int):
+        client = userbot.clients[number - 1]
+        added, removed = self._scanning[number] = set(), set()
+        chats = set()
+        try:
+            async for dialog in client.get_dialogs():
+                if dialog.chat.type in GROUP_TYPES:
+                    chats.add(dialog.chat.id)
+        finally:
+            del self._scanning[number]
+        chats = (chats | added) - removed
+        self.chats[number] = chats
+        written = None
+        # Joins and leaves during the write change ``chats`` in place.
+        while written != chats:
+            written = set(chats)
+            await membersdb.update_one(
+                {"_id": number}, {"$set": {"chats": list(written)}}, upsert=True
+            )
+
+    async def refresh(self):
+        from YukkiMusic.core.userbot import assistants
+
+        async def scan(number):
+            try:
+                await self.scan(number)
+            except Exception as e:
+                logger.warning(f"Could not index chats of assistant {number}: {e}")
+
+        await asyncio.gather(*(scan(number) for number in assistants))
+
+    @staticmethod
+    def number(user_id: int):
+        """Assistant number of the account ``user_id``, if it is one."""
+        for number, client in enumerate(userbot.clients, start=1):
+            if getattr(client, "id", None) == user_id:
+                return number
+        return None
+
+    def is_member(self, number: int, chat_id: int, count: bool = True) -> bool:
+        found = chat_id in self.chats.get(number, ())
+        if not count:
+            return found
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return found
+
+    def count(self, number: int) -> int:
+        return len(self.chats.get(number, ()))
+
+    async def add(self, number: int, chat_id: int):
+        if number in self._scanning:
+            added, removed = self._scanning[number]
+            added.add(chat_id)
+            removed.discard(chat_id)
+        chats = self.chats.setdefault(number, set())
+        if chat_id not in chats:
+            chats.add(chat_id)
+            await membersdb.update_one(
+                {"_id": number}, {"$addToSet": {"chats": chat_id}}, upsert=True
+            )
+
+    async def remove(self, number: int, chat_id: int):
+        if number in self._scanning:
+            added, removed = self._scanning[number]
+            removed.add(chat_id)
+            added.discard(chat_id)
+        chats = self.chats.get(number)
+        if chats and chat_id in chats:
+            chats.discard(chat_id)
+            await membersdb.update_one({"_id": number}, {"$pull": {"chats": chat_id}})
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+assistant_members = AssistantMembers()
@@ -0,0 +1,209 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import heapq
+import logging
+
+from pymongo import DESCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from YukkiMusic.core.mongo import mongodb
+from YukkiMusic.utils.cache import TTLCache
+from YukkiMusic.utils.database.mongodatabase import chattopdb, userdb
+
+logger = logging.getLogger(__name__)
+
+tracktopdb = mongodb.tracktops
+chattotaldb = mongodb.chattotals
+usertotaldb = mongodb.usertotals
+leaderboarddb = mongodb.leaderboard
+
+
+async def write_unordered(collection, items: dict, op) -> tuple[dict, int]:
+    """
+    Write ``op(key, value)`` for every item in one unordered ``bulk_write``.
+    Returns the items that were not applied and the number of upserts.
+    """
+    keys = list(items)
+    try:
+        result = await collection.bulk_write(
+            [op(key, items[key]) for key in keys], ordered=False
+        )
+    except BulkWriteError as e:
+        failed = {keys[error["index"]] for error in e.details["writeErrors"]}
+        logger.warning(
+            f"{len(failed)} of {len(keys)} writes to {collection.name} failed"
+        )
+        return {key: items[key] for key in failed}, e.details.get("nUpserted", 0)
+    except Exception as e:
+        logger.warning(f"Writes to {collection.name} failed: {e}")
+        return dict(items), 0
+    return {}, result.upserted_count
+
+
+class Leaderboard:
+    """
+    Play counters for the global, per-chat and per-user top lists.
+
+    Every play is applied as ``$inc`` on one document per track, chat and
+    user, indexed by count, so a top list is a sorted ``limit`` query whose
+    cost does not depend on how much history exists. The resulting top
+    views are kept in memory for ``ttl`` seconds. On first use the
+    counters are built once from the existing per-chat and per-user stats.
+    """
+
+    scopes = {
+        "tracks": tracktopdb,
+        "chats": chattotaldb,
+        "users": usertotaldb,
+    }
+
+    def __init__(self, size: int = 15, ttl: float = 30):
+        self.size = size
+        self.views = TTLCache(maxsize=8, ttl=ttl)
+        self._ready = False
+        self._lock = asyncio.Lock()
+
+    async def load(self):
+        if self._ready:
+            return
+        async with self._lock:
+            if self._ready:
+                return
+            for collection in self.scopes.values():
+                await collection.create_index([("spot", DESCENDING)])
+            if not await leaderboarddb.find_one({"_id": "totals"}):
+                await self._rebuild()
+            self._ready = True
+
+    async def _rebuild(self):
+        tracks, chats, users = {}, {}, {}
+        async for chat in chattopdb.find({"chat_id": {"$lt": 0}}):
+            for vidid, data in chat["vidid"].items():
+                if data["spot"] <= 0:
+                    continue
+                track = tracks.setdefault(vidid, {"spot": 0, "title": data["title"]})
+                track["spot"] += data["spot"]
+                chats[chat["chat_id"]] = chats.get(chat["chat_id"], 0) + data["spot"]
+        async for user in userdb.find({"chat_id": {"$gt": 0}}):
+            total = sum(data["spot"] for data in user["vidid"].values())
+            if total > 0:
+                users[user["chat_id"]] = total
+        for collection, rows in (
+            (tracktopdb, tracks),
+            (chattotaldb, {k: {"spot": v} for k, v in chats.items()}),
+            (usertotaldb, {k: {"spot": v} for k, v in users.items()}),
+        ):
+            ops = [
+                UpdateOne({"_id": key}, {"$set": value}, upsert=True)
+                for key, value in rows.items()
+            ]
+            if ops:
+                await collection.bulk_write(ops, ordered=False)
+        await leaderboarddb.update_one(
+            {"_id": "totals"},
+            {
+                "$set": {
+                    "tracks": len(tracks),
+                    "plays": sum(track["spot"] for track in tracks.values()),
+                }
+            },
+            upsert=True,
+        )
+        logger.info(f"Built leaderboard from {len(tracks)} tracks")
+
+    async def add(
+        self, tracks: dict = None, chats: dict = None, users: dict = None
+    ) -> tuple[dict, dict, dict]:
+        """
+        Apply merged play increments. ``tracks`` maps a video id to
+        ``(count, title)``, ``chats`` and ``users`` map an id to a count.
+        Returns the increments that could not be written, in the same form.
+        """
+        await self.load()
+        left_tracks = {}
+        if tracks:
+            left_tracks, upserted = await write_unordered(
+                tracktopdb,
+                tracks,
+                lambda vidid, value: UpdateOne(
+                    {"_id": vidid},
+                    {"$inc": {"spot": value[0]}, "$set": {"title": value[1]}},
+                    upsert=True,
+                ),
+            )
+            plays = sum(
+                count
+                for vidid, (count, _) in tracks.items()
+                if vidid not in left_tracks
+            )
+            if plays:
+                try:
+                    await leaderboarddb.update_one(
+                        {"_id": "totals"},
+                        {"$inc": {"tracks": upserted, "plays": plays}},
+                        upsert=True,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to update leaderboard totals: {e}")
+        left = [left_tracks]
+        for collection, counts in ((chattotaldb, chats), (usertotaldb, users)):
+            failed = {}
+            if counts:
+                failed, _ = await write_unordered(
+                    collection,
+                    counts,
+                    lambda key, count: UpdateOne(
+                        {"_id": key}, {"$inc": {"spot": count}}, upsert=True
+                    ),
+                )
+            left.append(failed)
+        return tuple(left)
+
+    async def top(self, scope: str) -> list[tuple]:
+        """Top ``size`` entries of a scope as ``(id, spot, title)``."""
+        view = self.views.get(scope)
+        if view is not None:
+            return view
+        await self.load()
+        cursor = self.scopes[scope].find().sort("spot", DESCENDING).limit(self.size)
+        view = [
+            (doc["_id"], doc["spot"], doc.get("title"))
+            async for doc in cursor
+            if doc["spot"] > 0
+        ]
+        self.views.set(scope, view)
+        return view
+
+    async def totals(self) -> tuple[int, int]:
+        """Number of distinct tracks and total plays across all chats."""
+        totals = self.views.get("totals")
+        if totals is None:
+            await self.load()
+            doc = await leaderboarddb.find_one({"_id": "totals"}) or {}
+            totals = (doc.get("tracks", 0), doc.get("plays", 0))
+            self.views.set("totals", totals)
+        return totals
+
+    @staticmethod
+    def rank(stats: dict, limit: int = 10) -> list[tuple]:
+        """Top ``limit`` of a ``{vidid: {"spot", "title"}}`` map."""
+        return heapq.nlargest(
+            limit,
+            (
+                (vidid, data["spot"], data["title"])
+                for vidid, data in stats.items()
+                if data["spot"] > 0
+            ),
+            key=lambda item: item[1],
+        )
+
+
+leaderboard = Leaderboard()
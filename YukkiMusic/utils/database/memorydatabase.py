@@ -8,6 +8,7 @@
 # All rights reserved.
 #
 
+import time
 
 from pytgcalls import types as _types
 
@@ -27,24 +28,128 @@ autoenddb = mongodb.autoend
 notesdb = mongodb.notes
 filtersdb = mongodb.filters
 
+
+class ChatRegistry:
+    """
+    Insertion-ordered set of chat ids with O(1) membership updates.
+
+    Iterating yields a snapshot, so callers may add or remove chats while
+    looping over it.
+    """
+
+    __slots__ = ("_chats",)
+
+    def __init__(self):
+        self._chats = {}
+
+    def __contains__(self, chat_id) -> bool:
+        return chat_id in self._chats
+
+    def __len__(self) -> int:
+        return len(self._chats)
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def add(self, chat_id: int):
+        self._chats[chat_id] = None
+
+    def discard(self, chat_id: int):
+        self._chats.pop(chat_id, None)
+
+    def snapshot(self) -> list:
+        return list(self._chats)
+
+
+class ChatSettings:
+    """Settings of one chat; the defaults stand for a missing document."""
+
+    __slots__ = ("playmode", "playtype", "lang", "cmode", "nonadmin")
+
+    def __init__(self):
+        self.playmode = "Direct"
+        self.playtype = "Everyone"
+        self.lang = "en"
+        self.cmode = None
+        self.nonadmin = False
+
+
+class SettingsStore:
+    """
+    In-memory copy of the small settings collections.
+
+    ``load`` reads all of them in one pass at startup. From then on a chat
+    that has no record simply uses the defaults, so getters never query
+    Mongo. Until the load has finished, the first lookup of a chat reads
+    its documents and remembers the result, misses included. Setters
+    update memory and write through to Mongo.
+    """
+
+    # field: (collection, value key); None stores presence as a flag
+    fields = {
+        "playmode": (playmodedb, "mode"),
+        "playtype": (playtypedb, "mode"),
+        "lang": (langdb, "lang"),
+        "cmode": (channeldb, "mode"),
+        "nonadmin": (authdb, None),
+    }
+
+    def __init__(self):
+        self.chats = {}
+        self.onoff = set()
+        self.autoend = False
+        self.loaded = False
+
+    async def load(self):
+        chats = {}
+        for field, (collection, key) in self.fields.items():
+            async for doc in collection.find({"chat_id": {"$exists": True}}):
+                record = chats.setdefault(doc["chat_id"], ChatSettings())
+                if key is None:
+                    setattr(record, field, True)
+                elif key in doc:
+                    setattr(record, field, doc[key])
+        self.onoff = {doc["on_off"] async for doc in onoffdb.find({})}
+        self.autoend = bool(await autoenddb.find_one({"chat_id": 123}))
+        # Keep changes made while loading.
+        chats.update(self.chats)
+        self.chats = chats
+        self.loaded = True
+
+    async def get(self, chat_id: int) -> ChatSettings:
+        record = self.chats.get(chat_id)
+        if record is None:
+            record = ChatSettings()
+            if not self.loaded:
+                for field, (collection, key) in self.fields.items():
+                    doc = await collection.find_one({"chat_id": chat_id})
+                    if doc and key is None:
+                        setattr(record, field, True)
+                    elif doc and key in doc:
+                        setattr(record, field, doc[key])
+            record = self.chats.setdefault(chat_id, record)
+        return record
+
+    async def is_on(self, on_off: int) -> bool:
+        if self.loaded:
+            return on_off in self.onoff
+        return bool(await onoffdb.find_one({"on_off": on_off}))
+
+
 # Shifting to memory [ mongo sucks often]
 audio = {}
 video = {}
 loop = {}
-playtype = {}
-playmode = {}
-channelconnect = {}
-langm = {}
+settings = SettingsStore()
 pause = {}
+playclock = {}
 mute = {}
-active = []
-activevideo = []
-command = []
-cleanmode = []
-nonadmin = {}
+active = ChatRegistry()
+activevideo = ChatRegistry()
+command = ChatRegistry()
+cleanmode = ChatRegistry()
 vlimit = []
 maintenance = []
-autoend = {}
 greeting_message = {"welcome": {}, "goodbye": {}}
 
 
@@ -194,32 +299,23 @@ async def is_pnote_on(chat_id) -> bool:
 
 
 async def is_autoend() -> bool:
-    chat_id = 123
-    mode = autoend.get(chat_id)
-    if not mode:
-        user = await autoenddb.find_one({"chat_id": chat_id})
-        if not user:
-            autoend[chat_id] = False
-            return False
-        autoend[chat_id] = True
-        return True
-    return mode
+    if not settings.loaded:
+        settings.autoend = bool(await autoenddb.find_one({"chat_id": 123}))
+    return settings.autoend
 
 
 async def autoend_on():
     chat_id = 123
-    autoend[chat_id] = True
-    user = await autoenddb.find_one({"chat_id": chat_id})
-    if not user:
-        return await autoenddb.insert_one({"chat_id": chat_id})
+    settings.autoend = True
+    return await autoenddb.update_one(
+        {"chat_id": chat_id}, {"$set": {"chat_id": chat_id}}, upsert=True
+    )
 
 
 async def autoend_off():
     chat_id = 123
-    autoend[chat_id] = False
-    user = await autoenddb.find_one({"chat_id": chat_id})
-    if user:
-        return await autoenddb.delete_one({"chat_id": chat_id})
+    settings.autoend = False
+    return await autoenddb.delete_one({"chat_id": chat_id})
 
 
 # LOOP PLAY
@@ -236,18 +332,11 @@ async def set_loop(chat_id: int, mode: int):
 
 # Channel Play IDS
 async def get_cmode(chat_id: int) -> int:
-    mode = channelconnect.get(chat_id)
-    if not mode:
-        mode = await channeldb.find_one({"chat_id": chat_id})
-        if not mode:
-            return None
-        channelconnect[chat_id] = mode["mode"]
-        return mode["mode"]
-    return mode
+    return (await settings.get(chat_id)).cmode
 
 
 async def set_cmode(chat_id: int, mode: int):
-    channelconnect[chat_id] = mode
+    (await settings.get(chat_id)).cmode = mode
     await channeldb.update_one(
         {"chat_id": chat_id}, {"$set": {"mode": mode}}, upsert=True
     )
@@ -255,19 +344,11 @@ async def set_cmode(chat_id: int, mode: int):
 
 # PLAY TYPE WHETHER ADMINS ONLY OR EVERYONE
 async def get_playtype(chat_id: int) -> str:
-    mode = playtype.get(chat_id)
-    if not mode:
-        mode = await playtypedb.find_one({"chat_id": chat_id})
-        if not mode:
-            playtype[chat_id] = "Everyone"
-            return "Everyone"
-        playtype[chat_id] = mode["mode"]
-        return mode["mode"]
-    return mode
+    return (await settings.get(chat_id)).playtype
 
 
 async def set_playtype(chat_id: int, mode: str):
-    playtype[chat_id] = mode
+    (await settings.get(chat_id)).playtype = mode
     await playtypedb.update_one(
         {"chat_id": chat_id}, {"$set": {"mode": mode}}, upsert=True
     )
@@ -275,19 +356,11 @@ async def set_playtype(chat_id: int, mode: str):
 
 # play mode whether inline or direct query
 async def get_playmode(chat_id: int) -> str:
-    mode = playmode.get(chat_id)
-    if not mode:
-        mode = await playmodedb.find_one({"chat_id": chat_id})
-        if not mode:
-            playmode[chat_id] = "Direct"
-            return "Direct"
-        playmode[chat_id] = mode["mode"]
-        return mode["mode"]
-    return mode
+    return (await settings.get(chat_id)).playmode
 
 
 async def set_playmode(chat_id: int, mode: str):
-    playmode[chat_id] = mode
+    (await settings.get(chat_id)).playmode = mode
     await playmodedb.update_one(
         {"chat_id": chat_id}, {"$set": {"mode": mode}}, upsert=True
     )
@@ -295,19 +368,11 @@ async def set_playmode(chat_id: int, mode: str):
 
 # language
 async def get_lang(chat_id: int) -> str:
-    mode = langm.get(chat_id)
-    if not mode:
-        lang = await langdb.find_one({"chat_id": chat_id})
-        if not lang:
-            langm[chat_id] = "en"
-            return "en"
-        langm[chat_id] = lang["lang"]
-        return lang["lang"]
-    return mode
+    return (await settings.get(chat_id)).lang
 
 
 async def set_lang(chat_id: int, lang: str):
-    langm[chat_id] = lang
+    (await settings.get(chat_id)).lang = lang
     await langdb.update_one({"chat_id": chat_id}, {"$set": {"lang": lang}}, upsert=True)
 
 
@@ -343,48 +408,75 @@ async def music_off(chat_id: int):
     pause[chat_id] = False
 
 
+# Playback Clock
+# "played" is derived from a monotonic start timestamp instead of being
+# ticked every second; pausing freezes the clock until it is resumed.
+async def start_clock(chat_id: int, played: int = 0):
+    playclock[chat_id] = {
+        "started": time.monotonic() - played,
+        "paused_at": None,
+    }
+
+
+async def stop_clock(chat_id: int):
+    playclock.pop(chat_id, None)
+
+
+async def pause_clock(chat_id: int):
+    clock = playclock.get(chat_id)
+    if clock and clock["paused_at"] is None:
+        clock["paused_at"] = time.monotonic()
+
+
+async def resume_clock(chat_id: int):
+    clock = playclock.get(chat_id)
+    if clock and clock["paused_at"] is not None:
+        clock["started"] += time.monotonic() - clock["paused_at"]
+        clock["paused_at"] = None
+
+
+async def get_played(chat_id: int) -> int:
+    clock = playclock.get(chat_id)
+    if not clock:
+        return 0
+    now = clock["paused_at"]
+    if now is None:
+        now = time.monotonic()
+    return max(0, int(now - clock["started"]))
+
+
 # Active Voice Chats
 async def get_active_chats() -> list:
-    return active
+    return active.snapshot()
 
 
 async def is_active_chat(chat_id: int) -> bool:
-    if chat_id not in active:
-        return False
-    else:
-        return True
+    return chat_id in active
 
 
 async def add_active_chat(chat_id: int):
-    if chat_id not in active:
-        active.append(chat_id)
+    active.add(chat_id)
 
 
 async def remove_active_chat(chat_id: int):
-    if chat_id in active:
-        active.remove(chat_id)
+    active.discard(chat_id)
 
 
 # Active Video Chats
 async def get_active_video_chats() -> list:
-    return activevideo
+    return activevideo.snapshot()
 
 
 async def is_active_video_chat(chat_id: int) -> bool:
-    if chat_id not in activevideo:
-        return False
-    else:
-        return True
+    return chat_id in activevideo
 
 
 async def add_active_video_chat(chat_id: int):
-    if chat_id not in activevideo:
-        activevideo.append(chat_id)
+    activevideo.add(chat_id)
 
 
 async def remove_active_video_chat(chat_id: int):
-    if chat_id in activevideo:
-        activevideo.remove(chat_id)
+    activevideo.discard(chat_id)
 
 
 # Delete command mode
@@ -395,13 +487,11 @@ async def is_cleanmode_on(chat_id: int) -> bool:
 
 
 async def cleanmode_off(chat_id: int):
-    if chat_id not in cleanmode:
-        cleanmode.append(chat_id)
+    cleanmode.add(chat_id)
 
 
 async def cleanmode_on(chat_id: int):
-    if chat_id in cleanmode:
-        cleanmode.remove(chat_id)
+    cleanmode.discard(chat_id)
 
 
 async def is_commanddelete_on(chat_id: int) -> bool:
@@ -409,48 +499,31 @@ async def is_commanddelete_on(chat_id: int) -> bool:
 
 
 async def commanddelete_off(chat_id: int):
-    if chat_id not in command:
-        command.append(chat_id)
+    command.add(chat_id)
 
 
 async def commanddelete_on(chat_id: int):
-    if chat_id in command:
-        command.remove(chat_id)
+    command.discard(chat_id)
 
 
 # Non Admin Chat
 async def check_nonadmin_chat(chat_id: int) -> bool:
-    user = await authdb.find_one({"chat_id": chat_id})
-    if not user:
-        return False
-    return True
+    return (await settings.get(chat_id)).nonadmin
 
 
 async def is_nonadmin_chat(chat_id: int) -> bool:
-    mode = nonadmin.get(chat_id)
-    if not mode:
-        user = await authdb.find_one({"chat_id": chat_id})
-        if not user:
-            nonadmin[chat_id] = False
-            return False
-        nonadmin[chat_id] = True
-        return True
-    return mode
+    return (await settings.get(chat_id)).nonadmin
 
 
 async def add_nonadmin_chat(chat_id: int):
-    nonadmin[chat_id] = True
-    is_admin = await check_nonadmin_chat(chat_id)
-    if is_admin:
-        return
-    return await authdb.insert_one({"chat_id": chat_id})
+    (await settings.get(chat_id)).nonadmin = True
+    return await authdb.update_one(
+        {"chat_id": chat_id}, {"$set": {"chat_id": chat_id}}, upsert=True
+    )
 
 
 async def remove_nonadmin_chat(chat_id: int):
-    nonadmin[chat_id] = False
-    is_admin = await check_nonadmin_chat(chat_id)
-    if not is_admin:
-        return
+    (await settings.get(chat_id)).nonadmin = False
     return await authdb.delete_one({"chat_id": chat_id})
 
 
@@ -502,24 +575,19 @@ async def set_video_limit(limt: int):
 
 # On Off
 async def is_on_off(on_off: int) -> bool:
-    onoff = await onoffdb.find_one({"on_off": on_off})
-    if not onoff:
-        return False
-    return True
+    return await settings.is_on(on_off)
 
 
 async def add_on(on_off: int):
-    is_on = await is_on_off(on_off)
-    if is_on:
-        return
-    return await onoffdb.insert_one({"on_off": on_off})
+    settings.onoff.add(on_off)
+    return await onoffdb.update_one(
+        {"on_off": on_off}, {"$set": {"on_off": on_off}}, upsert=True
+    )
 
 
 async def add_off(on_off: int):
-    is_off = await is_on_off(on_off)
-    if not is_off:
-        return
-    return await onoffdb.delete_one({"on_off": on_off})
+    settings.onoff.discard(on_off)
+    return await onoffdb.delete_many({"on_off": on_off})
 
 
 # Maintenance
@@ -527,8 +595,7 @@ async def add_off(on_off: int):
 
 async def is_maintenance():
     if not maintenance:
-        get = await onoffdb.find_one({"on_off": 1})
-        if not get:
+        if not await is_on_off(1):
             maintenance.clear()
             maintenance.append(2)
             return True
@@ -546,19 +613,13 @@ async def is_maintenance():
 async def maintenance_off():
     maintenance.clear()
     maintenance.append(2)
-    is_off = await is_on_off(1)
-    if not is_off:
-        return
-    return await onoffdb.delete_one({"on_off": 1})
+    return await add_off(1)
 
 
 async def maintenance_on():
     maintenance.clear()
     maintenance.append(1)
-    is_on = await is_on_off(1)
-    if is_on:
-        return
-    return await onoffdb.insert_one({"on_off": 1})
+    return await add_on(1)
 
 
 async def save_audio_bitrate(chat_id: int, bitrate: str):
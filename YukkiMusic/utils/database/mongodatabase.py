@@ -166,17 +166,26 @@ async def get_private_served_chats() -> list:
     return chats_list
 
 
+# Checked on every update in private bot mode, so kept in memory.
+privatechats = None
+
+
+async def _private_chats() -> set:
+    global privatechats
+    if privatechats is None:
+        privatechats = {chat["chat_id"] async for chat in privatedb.find({})}
+    return privatechats
+
+
 async def is_served_private_chat(chat_id: int) -> bool:
-    chat = await privatedb.find_one({"chat_id": chat_id})
-    if not chat:
-        return False
-    return True
+    return chat_id in await _private_chats()
 
 
 async def add_private_chat(chat_id: int):
     is_served = await is_served_private_chat(chat_id)
     if is_served:
         return
+    privatechats.add(chat_id)
     return await privatedb.insert_one({"chat_id": chat_id})
 
 
@@ -184,6 +193,7 @@ async def remove_private_chat(chat_id: int):
     is_served = await is_served_private_chat(chat_id)
     if not is_served:
         return
+    privatechats.discard(chat_id)
     return await privatedb.delete_one({"chat_id": chat_id})
 
 
@@ -321,37 +331,6 @@ async def set_queries(mode: int):
 # Top Chats DB
 
 
-async def get_top_chats() -> dict:
-    results = {}
-    async for chat in chattopdb.find({"chat_id": {"$lt": 0}}):
-        chat_id = chat["chat_id"]
-        total = 0
-        for i in chat["vidid"]:
-            counts_ = chat["vidid"][i]["spot"]
-            if counts_ > 0:
-                total += counts_
-                results[chat_id] = total
-    return results
-
-
-async def get_global_tops() -> dict:
-    results = {}
-    async for chat in chattopdb.find({"chat_id": {"$lt": 0}}):
-        for i in chat["vidid"]:
-            counts_ = chat["vidid"][i]["spot"]
-            title_ = chat["vidid"][i]["title"]
-            if counts_ > 0:
-                if i not in results:
-                    results[i] = {}
-                    results[i]["spot"] = counts_
-                    results[i]["title"] = title_
-                else:
-                    spot = results[i]["spot"]
-                    count_ = spot + counts_
-                    results[i]["spot"] = count_
-    return results
-
-
 async def get_particulars(chat_id: int) -> dict[str, int]:
     ids = await chattopdb.find_one({"chat_id": chat_id})
     if not ids:
@@ -359,20 +338,6 @@ async def get_particulars(chat_id: int) -> dict[str, int]:
     return ids["vidid"]
 
 
-async def get_particular_top(chat_id: int, name: str) -> bool | dict:
-    ids = await get_particulars(chat_id)
-    if name in ids:
-        return ids[name]
-
-
-async def update_particular_top(chat_id: int, name: str, vidid: dict):
-    ids = await get_particulars(chat_id)
-    ids[name] = vidid
-    await chattopdb.update_one(
-        {"chat_id": chat_id}, {"$set": {"vidid": ids}}, upsert=True
-    )
-
-
 # Top User DB
 
 
@@ -388,31 +353,6 @@ async def delete_userss(chat_id: int) -> bool:
     return result.deleted_count > 0
 
 
-async def get_user_top(chat_id: int, name: str) -> bool | dict:
-    ids = await get_userss(chat_id)
-    if name in ids:
-        return ids[name]
-
-
-async def update_user_top(chat_id: int, name: str, vidid: dict):
-    ids = await get_userss(chat_id)
-    ids[name] = vidid
-    await userdb.update_one({"chat_id": chat_id}, {"$set": {"vidid": ids}}, upsert=True)
-
-
-async def get_topp_users() -> dict:
-    results = {}
-    async for chat in userdb.find({"chat_id": {"$gt": 0}}):
-        user_id = chat["chat_id"]
-        total = 0
-        for i in chat["vidid"]:
-            counts_ = chat["vidid"][i]["spot"]
-            if counts_ > 0:
-                total += counts_
-        results[user_id] = total
-    return results
-
-
 # Gban Users
 
 
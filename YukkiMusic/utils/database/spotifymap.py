@@ -0,0 +1,78 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+from pymongo import UpdateOne
+
+from YukkiMusic.core.mongo import mongodb
+
+spotifymapdb = mongodb.spotifymap
+
+MATCH_FIELDS = ("title", "link", "vidid", "duration_min", "duration_sec", "thumb")
+
+
+class SpotifyMap:
+    """
+    Persistent Spotify track -> YouTube video matches.
+
+    Documents are keyed by the Spotify track id and also indexed by ISRC,
+    so the same recording released on another album or single resolves
+    without a search. Values use the same fields as ``youtube.info``.
+    """
+
+    def __init__(self):
+        self._indexed = False
+        self.hits = 0
+        self.misses = 0
+
+    async def _index(self):
+        if not self._indexed:
+            await spotifymapdb.create_index("isrc", sparse=True)
+            self._indexed = True
+
+    async def lookup(self, tracks: list[dict]) -> dict:
+        """Stored matches for ``tracks``, keyed by track id and by ISRC."""
+        ids = [track["id"] for track in tracks if track["id"]]
+        isrcs = [track["isrc"] for track in tracks if track["isrc"]]
+        if not ids and not isrcs:
+            return {}
+        await self._index()
+        matches = {}
+        query = {"$or": [{"_id": {"$in": ids}}, {"isrc": {"$in": isrcs}}]}
+        async for doc in spotifymapdb.find(query):
+            info = {field: doc[field] for field in MATCH_FIELDS}
+            matches[doc["_id"]] = info
+            if doc.get("isrc"):
+                matches[doc["isrc"]] = info
+        found = sum(
+            1 for track in tracks if track["id"] in matches or track["isrc"] in matches
+        )
+        self.hits += found
+        self.misses += len(tracks) - found
+        return matches
+
+    async def save(self, matches: list[tuple]):
+        """Store ``(track, info, confidence)`` tuples."""
+        ops = []
+        for track, info, confidence in matches:
+            if not track["id"]:
+                continue
+            doc = {field: info[field] for field in MATCH_FIELDS}
+            doc["confidence"] = confidence
+            if track["isrc"]:
+                doc["isrc"] = track["isrc"]
+            ops.append(UpdateOne({"_id": track["id"]}, {"$set": doc}, upsert=True))
+        if ops:
+            await self._index()
+            await spotifymapdb.bulk_write(ops, ordered=False)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+spotifymap = SpotifyMap()
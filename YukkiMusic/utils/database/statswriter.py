@@ -0,0 +1,151 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import logging
+
+from pymongo import UpdateOne
+
+from YukkiMusic.utils.database.leaderboard import leaderboard, write_unordered
+from YukkiMusic.utils.database.mongodatabase import chattopdb, userdb
+
+logger = logging.getLogger(__name__)
+
+
+class StatsWriter:
+    """
+    Buffers play counts and writes them to Mongo in batches.
+
+    Plays are merged in memory per (scope, id, video id) and flushed every
+    ``interval`` seconds as one ``bulk_write`` of ``$inc`` upserts per
+    collection, so concurrent plays never overwrite each other. Once
+    ``max_pending`` distinct counters are buffered a flush is started
+    early; ``record`` never waits for Mongo. Writes that fail are kept for
+    the next flush, and while Mongo is down new plays stop being counted
+    once twice that many counters are buffered.
+    """
+
+    def __init__(self, interval: float = 5, max_pending: int = 5000):
+        self.interval = interval
+        self.max_pending = max_pending
+        self._pending = {}
+        self._board = ({}, {}, {})
+        self._lock = asyncio.Lock()
+        self._task = None
+        self._indexed = False
+        self._early = None
+        self.flushed = 0
+        self.failed = 0
+        self.dropped = 0
+
+    @staticmethod
+    def _valid(vidid: str) -> bool:
+        return bool(vidid) and "." not in vidid and not vidid.startswith("$")
+
+    async def record(self, chat_id: int, user_id: int, vidid: str, title: str):
+        if not self._valid(vidid):
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        if len(self._pending) >= 2 * self.max_pending:
+            self.dropped += 1
+            return
+        for key in (("chat", chat_id, vidid), ("user", user_id, vidid)):
+            count = self._pending.get(key, (0,))[0]
+            self._pending[key] = (count + 1, title)
+        if len(self._pending) >= self.max_pending and not self._lock.locked():
+            if self._early is None or self._early.done():
+                self._early = asyncio.create_task(self._safe_flush())
+
+    async def _safe_flush(self):
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush play stats: {e}")
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self._safe_flush()
+
+    @staticmethod
+    def _merge(into: dict, counts: dict):
+        for key, value in counts.items():
+            if isinstance(value, tuple):
+                count = into.get(key, (0,))[0]
+                into[key] = (count + value[0], value[1])
+            else:
+                into[key] = into.get(key, 0) + value
+
+    @staticmethod
+    def _op(key: tuple, value: tuple) -> UpdateOne:
+        (_, owner, vidid), (count, title) = key, value
+        return UpdateOne(
+            {"chat_id": owner},
+            {
+                "$inc": {f"vidid.{vidid}.spot": count},
+                "$set": {f"vidid.{vidid}.title": title},
+            },
+            upsert=True,
+        )
+
+    async def flush(self):
+        async with self._lock:
+            # Build the leaderboard from the old stats before adding to them.
+            await leaderboard.load()
+            if not self._indexed:
+                for collection in (chattopdb, userdb):
+                    await collection.create_index("chat_id")
+                self._indexed = True
+            pending, self._pending = self._pending, {}
+            tracks, chats, users = self._board
+            complete = True
+            for collection, scope in ((chattopdb, "chat"), (userdb, "user")):
+                part = {k: v for k, v in pending.items() if k[0] == scope}
+                if not part:
+                    continue
+                # Only writes Mongo reported as failed are retried, so
+                # applied increments are never counted twice.
+                failed, _ = await write_unordered(collection, part, self._op)
+                if failed:
+                    self._merge(self._pending, failed)
+                    complete = False
+                for key, (count, title) in part.items():
+                    if key in failed:
+                        continue
+                    _, owner, vidid = key
+                    if scope == "chat" and owner < 0:
+                        self._merge(tracks, {vidid: (count, title)})
+                        self._merge(chats, {owner: count})
+                    elif scope == "user" and owner > 0:
+                        self._merge(users, {owner: count})
+            if tracks or chats or users:
+                self._board = await leaderboard.add(tracks, chats, users)
+                complete = complete and not any(self._board)
+            if complete:
+                self.flushed += 1
+            else:
+                self.failed += 1
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "flushed": self.flushed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+        }
+
+
+stats_writer = StatsWriter()
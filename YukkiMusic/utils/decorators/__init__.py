@@ -10,4 +10,5 @@
 
 from .admins import *
 from .asyncify import asyncify
+from .context import ChatContext, context_load_avg
 from .language import *
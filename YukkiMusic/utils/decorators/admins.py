@@ -11,38 +11,27 @@
 from pyrogram.enums import ChatMemberStatus, ChatType
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
-from config import adminlist
-from strings import get_string
 from YukkiMusic import app
 from YukkiMusic.misc import SUDOERS
-from YukkiMusic.utils.database import (
-    get_authuser_names,
-    get_cmode,
-    get_lang,
-    is_active_chat,
-    is_commanddelete_on,
-    is_maintenance,
-    is_nonadmin_chat,
-)
+from YukkiMusic.utils.admincache import admincache
+from YukkiMusic.utils.database import get_authuser_names, is_active_chat
 
 from ..formatters import int_to_alpha
+from .context import ChatContext
 
 
 def AdminRightsCheck(mystic):
     async def wrapper(client, message):
-        if not await is_maintenance():
+        context = await ChatContext.of(message)
+        if not context.serving:
             if message.from_user.id not in SUDOERS:
                 return
-        if await is_commanddelete_on(message.chat.id):
+        if context.commanddelete:
             try:
                 await message.delete()
             except Exception:
                 pass
-        try:
-            language = await get_lang(message.chat.id)
-            _ = get_string(language)
-        except Exception:
-            _ = get_string("en")
+        _ = context._
         if message.sender_chat:
             upl = InlineKeyboardMarkup(
                 [
@@ -56,7 +45,7 @@ def AdminRightsCheck(mystic):
             )
             return await message.reply_text(_["general_4"], reply_markup=upl)
         if message.command[0][0] == "c":
-            chat_id = await get_cmode(message.chat.id)
+            chat_id = context.cmode
             if chat_id is None:
                 return await message.reply_text(_["setting_12"])
             try:
@@ -67,15 +56,13 @@ def AdminRightsCheck(mystic):
             chat_id = message.chat.id
         if not await is_active_chat(chat_id):
             return await message.reply_text(_["general_6"])
-        is_non_admin = await is_nonadmin_chat(message.chat.id)
-        if not is_non_admin:
+        if not context.nonadmin:
             if message.from_user.id not in SUDOERS:
-                admins = adminlist.get(message.chat.id)
-                if not admins:
+                allowed = await admincache.check(message.chat.id, message.from_user.id)
+                if allowed is None:
                     return await message.reply_text(_["admin_18"])
-                else:
-                    if message.from_user.id not in admins:
-                        return await message.reply_text(_["admin_19"])
+                if not allowed:
+                    return await message.reply_text(_["admin_19"])
         return await mystic(client, message, _, chat_id)
 
     return wrapper
@@ -83,21 +70,18 @@ def AdminRightsCheck(mystic):
 
 def AdminActual(mystic):
     async def wrapper(client, message):
-        if not await is_maintenance():
+        context = await ChatContext.of(message)
+        if not context.serving:
             if message.from_user.id not in SUDOERS:
                 return
 
-        if await is_commanddelete_on(message.chat.id):
+        if context.commanddelete:
             try:
                 await message.delete()
             except Exception:
                 pass
 
-        try:
-            language = await get_lang(message.chat.id)
-            _ = get_string(language)
-        except Exception:
-            _ = get_string("en")
+        _ = context._
 
         if message.sender_chat:
             upl = InlineKeyboardMarkup(
@@ -137,13 +121,10 @@ def AdminActual(mystic):
 
 def ActualAdminCB(mystic):
     async def wrapper(client, query):
-        try:
-            language = await get_lang(query.message.chat.id)
-            _ = get_string(language)
-        except Exception:
-            _ = get_string("en")
+        context = await ChatContext.of(query)
+        _ = context._
 
-        if not await is_maintenance():
+        if not context.serving:
             if query.from_user.id not in SUDOERS:
                 return await query.answer(
                     _["maint_4"],
@@ -153,8 +134,7 @@ def ActualAdminCB(mystic):
         if query.message.chat.type == ChatType.PRIVATE:
             return await mystic(client, query, _)
 
-        is_non_admin = await is_nonadmin_chat(query.message.chat.id)
-        if not is_non_admin:
+        if not context.nonadmin:
             try:
                 a = await app.get_chat_member(
                     query.message.chat.id,
@@ -0,0 +1,106 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import time
+
+from pyrogram.types import CallbackQuery
+
+from config import PRIVATE_BOT_MODE
+from strings import get_string
+from YukkiMusic.utils.database import (
+    get_cmode,
+    get_lang,
+    get_playmode,
+    get_playtype,
+    is_commanddelete_on,
+    is_maintenance,
+    is_nonadmin_chat,
+    is_served_private_chat,
+)
+
+# loads, total seconds
+timings = [0, 0.0]
+
+
+async def _true() -> bool:
+    return True
+
+
+class ChatContext:
+    """
+    Settings of the chat an update came from, loaded once per update.
+
+    All lookups run together in one ``gather`` and the result is kept on
+    the update, so every decorator and handler that asks for the context
+    of the same message or callback query shares a single load. Chat
+    state that changes while a handler runs, such as whether a call is
+    active, is not part of it.
+    """
+
+    __slots__ = (
+        "chat_id",
+        "lang",
+        "_",
+        "serving",
+        "commanddelete",
+        "cmode",
+        "playmode",
+        "playtype",
+        "nonadmin",
+        "private",
+    )
+
+    def __init__(self, chat_id: int):
+        self.chat_id = chat_id
+
+    @classmethod
+    async def of(cls, update) -> "ChatContext":
+        context = getattr(update, "_chat_context", None)
+        if context is None:
+            message = update.message if isinstance(update, CallbackQuery) else update
+            context = cls(message.chat.id)
+            await context.load()
+            update._chat_context = context
+        return context
+
+    async def load(self):
+        start = time.monotonic()
+        chat_id = self.chat_id
+        (
+            self.lang,
+            self.serving,
+            self.commanddelete,
+            self.cmode,
+            self.playmode,
+            self.playtype,
+            self.nonadmin,
+            self.private,
+        ) = await asyncio.gather(
+            get_lang(chat_id),
+            is_maintenance(),
+            is_commanddelete_on(chat_id),
+            get_cmode(chat_id),
+            get_playmode(chat_id),
+            get_playtype(chat_id),
+            is_nonadmin_chat(chat_id),
+            is_served_private_chat(chat_id) if PRIVATE_BOT_MODE else _true(),
+        )
+        try:
+            self._ = get_string(self.lang)
+        except Exception:
+            self._ = get_string("en")
+        timings[0] += 1
+        timings[1] += time.monotonic() - start
+
+
+def context_load_avg() -> float:
+    """Average context load time in milliseconds."""
+    loads, total = timings
+    return round(total / loads * 1000, 2) if loads else 0.0
@@ -9,28 +9,21 @@
 #
 from pyrogram.enums import ChatType
 
-from strings import get_string
 from YukkiMusic.misc import SUDOERS
-from YukkiMusic.utils.database import (
-    get_lang,
-    is_commanddelete_on,
-    is_maintenance,
-)
+
+from .context import ChatContext
 
 
 def language(mystic):
     async def wrapper(_, message, **kwargs):
-        try:
-            language = await get_lang(message.chat.id)
-            language = get_string(language)
-        except Exception:
-            language = get_string("en")
-        if not await is_maintenance():
+        context = await ChatContext.of(message)
+        language = context._
+        if not context.serving:
             if message.from_user.id not in SUDOERS:
                 if message.chat.type == ChatType.PRIVATE:
                     return await message.reply_text(language["maint_4"])
                 return
-        if await is_commanddelete_on(message.chat.id):
+        if context.commanddelete:
             try:
                 await message.delete()
             except Exception:
@@ -42,12 +35,9 @@ def language(mystic):
 
 def languageCB(mystic):
     async def wrapper(_, query, **kwargs):
-        try:
-            language = await get_lang(query.message.chat.id)
-            language = get_string(language)
-        except Exception:
-            language = get_string("en")
-        if not await is_maintenance():
+        context = await ChatContext.of(query)
+        language = context._
+        if not context.serving:
             if query.from_user.id not in SUDOERS:
                 if query.message.chat.type == ChatType.PRIVATE:
                     return await query.answer(
@@ -63,11 +53,7 @@ def languageCB(mystic):
 
 def LanguageStart(mystic):
     async def wrapper(_, message, **kwargs):
-        try:
-            language = await get_lang(message.chat.id)
-            language = get_string(language)
-        except Exception:
-            language = get_string("en")
-        return await mystic(_, message, language)
+        context = await ChatContext.of(message)
+        return await mystic(_, message, context._)
 
     return wrapper
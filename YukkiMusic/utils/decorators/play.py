@@ -11,32 +11,24 @@
 from pyrogram.errors import ChannelPrivate
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
-from config import PLAYLIST_IMG_URL, PRIVATE_BOT_MODE, adminlist
-from strings import get_string
+from config import PLAYLIST_IMG_URL
 from YukkiMusic import app
 from YukkiMusic.core.call import Yukki
 from YukkiMusic.misc import SUDOERS
 from YukkiMusic.platforms import youtube
-from YukkiMusic.utils.database import (
-    get_assistant,
-    get_cmode,
-    get_lang,
-    get_playmode,
-    get_playtype,
-    is_active_chat,
-    is_commanddelete_on,
-    is_maintenance,
-    is_served_private_chat,
-)
+from YukkiMusic.utils.admincache import admincache
+from YukkiMusic.utils.database import get_assistant, is_active_chat
 from YukkiMusic.utils.inline import botplaylist_markup
 
+from .context import ChatContext
+
 links = {}
 
 
 def PlayWrapper(command):
     async def wrapper(client, message):
-        language = await get_lang(message.chat.id)
-        _ = get_string(language)
+        context = await ChatContext.of(message)
+        _ = context._
         if message.sender_chat:
             upl = InlineKeyboardMarkup(
                 [
@@ -50,17 +42,16 @@ def PlayWrapper(command):
             )
             return await message.reply_text(_["general_4"], reply_markup=upl)
 
-        if await is_maintenance() is False:
+        if context.serving is False:
             if message.from_user.id not in SUDOERS:
                 return
 
-        if PRIVATE_BOT_MODE:
-            if not await is_served_private_chat(message.chat.id):
-                await message.reply_text(
-                    "**PRIVATE MUSIC BOT**\n\nOnly For Authorized chats from the owner ask my owner to allow your chat first."
-                )
-                return await app.leave_chat(message.chat.id)
-        if await is_commanddelete_on(message.chat.id):
+        if not context.private:
+            await message.reply_text(
+                "**PRIVATE MUSIC BOT**\n\nOnly For Authorized chats from the owner ask my owner to allow your chat first."
+            )
+            return await app.leave_chat(message.chat.id)
+        if context.commanddelete:
             try:
                 await message.delete()
             except Exception:
@@ -88,7 +79,7 @@ def PlayWrapper(command):
                     reply_markup=InlineKeyboardMarkup(buttons),
                 )
         if message.command[0][0] == "c":
-            chat_id = await get_cmode(message.chat.id)
+            chat_id = context.cmode
             if chat_id is None:
                 return await message.reply_text(_["setting_12"])
             try:
@@ -108,16 +99,14 @@ def PlayWrapper(command):
         except Exception:
             pass
 
-        playmode = await get_playmode(message.chat.id)
-        playty = await get_playtype(message.chat.id)
-        if playty != "Everyone":
+        playmode = context.playmode
+        if context.playtype != "Everyone":
             if message.from_user.id not in SUDOERS:
-                admins = adminlist.get(message.chat.id)
-                if not admins:
+                allowed = await admincache.check(message.chat.id, message.from_user.id)
+                if allowed is None:
                     return await message.reply_text(_["admin_18"])
-                else:
-                    if message.from_user.id not in admins:
-                        return await message.reply_text(_["play_4"])
+                if not allowed:
+                    return await message.reply_text(_["play_4"])
         if message.command[0][0] == "v":
             video = True
         else:
@@ -137,7 +126,7 @@ def PlayWrapper(command):
             try:
                 call_participants_id = [
                     member.chat.id
-                    async for member in userbot.get_call_members(chat_id)
+                    for member in await Yukki.members.get(chat_id)
                     if member.chat
                 ]
                 # Checking if assistant id not in list so clear queues and remove active voice chat and process
@@ -0,0 +1,186 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import glob
+import os
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+from YukkiMusic.utils.mediacache import mediacache
+
+
+class FairQueue:
+    """Round-robin queue: each chat gets one job served per turn."""
+
+    def __init__(self):
+        self._chats = OrderedDict()
+        self._size = 0
+        self._ready = asyncio.Event()
+
+    def __len__(self):
+        return self._size
+
+    def put(self, chat_id, item):
+        self._chats.setdefault(chat_id, deque()).append(item)
+        self._size += 1
+        self._ready.set()
+
+    async def get(self):
+        while not self._size:
+            self._ready.clear()
+            await self._ready.wait()
+        chat_id, items = next(iter(self._chats.items()))
+        item = items.popleft()
+        if items:
+            self._chats.move_to_end(chat_id)
+        else:
+            del self._chats[chat_id]
+        self._size -= 1
+        return item
+
+
+class DownloadManager:
+    """
+    Single-flight downloads keyed by (video id, kind).
+
+    Finished files are served from the media cache, and requests for a
+    track that is already being fetched wait on the running job instead of
+    starting their own. A queued job is dropped once every caller waiting
+    on it has been cancelled. New jobs are queued per kind and served
+    round-robin across chats by a fixed number of workers, which run
+    yt-dlp in their own thread pool. Jobs write to a hidden temporary path
+    and are renamed into place only once complete, so a partially written
+    file is never handed to a stream.
+    """
+
+    def __init__(self, path: str = "downloads", workers: dict = None):
+        self.path = path
+        self.workers = workers or {"audio": 4, "video": 2}
+        self.queues = {kind: FairQueue() for kind in self.workers}
+        self.executor = ThreadPoolExecutor(
+            max_workers=sum(self.workers.values()),
+            thread_name_prefix="downloader",
+        )
+        self._jobs = {}
+        self._waiters = {}
+        self._running = set()
+        self._tasks = []
+        self._waits = {kind: [0, 0.0] for kind in self.workers}
+        self.started = 0
+        self.joined = 0
+        self.reused = 0
+
+    def filepath(self, vidid: str, ext: str) -> str:
+        return os.path.join(self.path, f"{vidid}.{ext}")
+
+    def _start(self):
+        if self._tasks:
+            return
+        for kind, count in self.workers.items():
+            for _ in range(count):
+                self._tasks.append(asyncio.create_task(self._worker(kind)))
+
+    async def _worker(self, kind: str):
+        queue = self.queues[kind]
+        loop = asyncio.get_running_loop()
+        while True:
+            future, vidid, final, download, queued_at = await queue.get()
+            if future.done():
+                continue
+            self._running.add(future)
+            waits = self._waits[kind]
+            waits[0] += 1
+            waits[1] += time.monotonic() - queued_at
+            os.makedirs(self.path, exist_ok=True)
+            tmp = os.path.join(self.path, f".{uuid.uuid4().hex}")
+            try:
+                produced = await loop.run_in_executor(self.executor, download, tmp)
+                # Keep the container the download produced, e.g. native webm audio.
+                final = os.path.splitext(final)[0] + os.path.splitext(produced)[1]
+                os.replace(produced, final)
+                await asyncio.to_thread(mediacache.add, "youtube", vidid, kind, final)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(final)
+            finally:
+                self._running.discard(future)
+                for leftover in glob.glob(f"{tmp}*"):
+                    try:
+                        os.remove(leftover)
+                    except OSError:
+                        pass
+
+    async def fetch(
+        self,
+        vidid: str,
+        kind: str,
+        ext: str,
+        download,
+        chat_id: int = None,
+    ) -> str:
+        """
+        Return the path of ``vidid`` in the requested kind, downloading it
+        with ``download(tmp)`` if needed. ``download`` is a blocking callable
+        that receives a temporary path prefix and returns the file it wrote.
+        """
+        cached = await asyncio.to_thread(mediacache.get, "youtube", vidid, kind)
+        if cached:
+            self.reused += 1
+            return cached
+        final = self.filepath(vidid, ext)
+        key = (vidid, kind)
+        job = self._jobs.get(key)
+        if job is None:
+            self._start()
+            job = asyncio.get_running_loop().create_future()
+            self._jobs[key] = job
+            job.add_done_callback(lambda _: self._jobs.pop(key, None))
+            self.queues[kind].put(
+                chat_id, (job, vidid, final, download, time.monotonic())
+            )
+            self.started += 1
+        else:
+            self.joined += 1
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(job)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                # Nobody wants it any more; drop it if it is still queued.
+                if job not in self._running:
+                    job.cancel()
+
+    def stats(self) -> dict:
+        stats = {
+            "running": len(self._jobs),
+            "started": self.started,
+            "joined": self.joined,
+            "reused": self.reused,
+        }
+        for kind, (count, total) in self._waits.items():
+            stats[f"{kind}_queued"] = len(self.queues[kind])
+            stats[f"{kind}_wait"] = round(total / count, 2) if count else 0
+        return stats
+
+
+downloader = DownloadManager(
+    workers={
+        "audio": config.AUDIO_DOWNLOAD_WORKERS,
+        "video": config.VIDEO_DOWNLOAD_WORKERS,
+    }
+)
@@ -16,3 +16,7 @@ class AssistantErr(Exception):
 
 class UnableToFetchCarbon(Exception):
     pass
+
+
+class ExtractorError(Exception):
+    pass
@@ -0,0 +1,149 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import itertools
+import json
+import logging
+import os
+import sys
+
+import config
+from YukkiMusic.utils.exceptions import ExtractorError
+
+logger = logging.getLogger(__name__)
+
+WORKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")
+
+
+class _Worker:
+    __slots__ = ("proc", "pending", "reader", "lock")
+
+    def __init__(self):
+        self.proc = None
+        self.pending = {}
+        self.reader = None
+        self.lock = asyncio.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+
+class ExtractorPool:
+    """
+    Long-lived yt-dlp worker processes for stream-url and playlist lookups.
+
+    Each worker keeps its ``YoutubeDL`` instances warm and runs at most
+    ``per_worker`` requests at a time; a request goes to the least busy
+    worker. A request that takes longer than ``timeout`` seconds kills its
+    worker, and a worker that dies fails its pending requests and is
+    started again on the next request.
+    """
+
+    def __init__(self, workers: int = 2, per_worker: int = 4, timeout: float = 30):
+        self.per_worker = per_worker
+        self.timeout = timeout
+        self.workers = [_Worker() for _ in range(workers)]
+        self._slots = asyncio.Semaphore(workers * per_worker)
+        self._ids = itertools.count()
+        self.requests = 0
+        self.failed = 0
+        self.restarts = 0
+
+    async def _start(self, worker: _Worker):
+        async with worker.lock:
+            if worker.alive:
+                return
+            worker.proc = await asyncio.create_subprocess_exec(
+                sys.executable,
+                WORKER,
+                str(self.per_worker),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=2**20,
+            )
+            worker.reader = asyncio.create_task(self._read(worker, worker.proc))
+
+    async def _read(self, worker: _Worker, proc):
+        while line := await proc.stdout.readline():
+            try:
+                response = json.loads(line)
+            except ValueError:
+                continue
+            future = worker.pending.pop(response["id"], None)
+            if future is None or future.done():
+                continue
+            if response["ok"]:
+                future.set_result(response["result"])
+            else:
+                future.set_exception(ExtractorError(response["error"]))
+        await proc.wait()
+        if worker.proc is proc:
+            logger.warning(f"Extractor worker exited with code {proc.returncode}")
+            self._stop(worker, "Extractor worker exited")
+
+    def _stop(self, worker: _Worker, reason: str):
+        proc, worker.proc = worker.proc, None
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+        for future in worker.pending.values():
+            if not future.done():
+                future.set_exception(ExtractorError(reason))
+        worker.pending.clear()
+        self.restarts += 1
+
+    async def run(self, op: str, **args):
+        async with self._slots:
+            worker = min(self.workers, key=lambda w: len(w.pending))
+            if not worker.alive:
+                await self._start(worker)
+            request_id = next(self._ids)
+            future = asyncio.get_running_loop().create_future()
+            worker.pending[request_id] = future
+            self.requests += 1
+            request = {"id": request_id, "op": op, "args": args}
+            try:
+                worker.proc.stdin.write(json.dumps(request).encode() + b"\n")
+                await worker.proc.stdin.drain()
+                return await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                self.failed += 1
+                if worker.pending.get(request_id) is future:
+                    self._stop(worker, "Extractor worker was restarted")
+                raise ExtractorError(f"Extractor timed out after {self.timeout}s")
+            except Exception:
+                self.failed += 1
+                raise
+            finally:
+                worker.pending.pop(request_id, None)
+
+    async def stream_url(self, link: str, format: str = "best") -> str:
+        return await self.run("url", link=link, format=format)
+
+    async def playlist(self, link: str, limit: int) -> list[str]:
+        return await self.run("playlist", link=link, limit=limit)
+
+    async def close(self):
+        for worker in self.workers:
+            proc, worker.proc = worker.proc, None
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+
+    def stats(self) -> dict:
+        return {
+            "alive": sum(worker.alive for worker in self.workers),
+            "requests": self.requests,
+            "failed": self.failed,
+            "restarts": self.restarts,
+        }
+
+
+extractor = ExtractorPool(config.EXTRACTOR_WORKERS)
@@ -0,0 +1,102 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+"""
+yt-dlp extractor worker, run as a script by ``ExtractorPool``.
+
+Reads one JSON request per line from stdin and writes one JSON response
+per line to stdout. Requests run on a small thread pool; each thread keeps
+its ``YoutubeDL`` instances between requests so option parsing, cookie
+loading and extractor setup happen once per worker instead of per call.
+Instances are rebuilt after ``REBUILD_AFTER`` seconds so refreshed browser
+cookies are picked up. This file is executed by path and must not import
+the bot package.
+"""
+
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from yt_dlp import YoutubeDL
+
+BASE = {
+    "quiet": True,
+    "no_warnings": True,
+}
+COOKIES = ("firefox",)
+REBUILD_AFTER = 1800
+
+local = threading.local()
+write_lock = threading.Lock()
+# Responses go to the real stdout; anything yt-dlp prints goes to stderr.
+output, sys.stdout = sys.stdout, sys.stderr
+
+
+def ydl(**opts) -> YoutubeDL:
+    cache = getattr(local, "ydl", None)
+    if cache is None:
+        cache = local.ydl = {}
+    key = json.dumps(opts, sort_keys=True)
+    now = time.monotonic()
+    entry = cache.get(key)
+    if entry is None or now - entry[0] > REBUILD_AFTER:
+        if entry is not None:
+            entry[1].close()
+        entry = cache[key] = (now, YoutubeDL({**BASE, **opts}))
+    return entry[1]
+
+
+def stream_url(link: str, format: str) -> str:
+    client = ydl(format=format, noplaylist=True, cookiesfrombrowser=COOKIES)
+    info = client.extract_info(link, download=False)
+    if info.get("url"):
+        return info["url"]
+    return info["requested_formats"][0]["url"]
+
+
+def playlist(link: str, limit: int) -> list[str]:
+    info = ydl(
+        extract_flat=True,
+        playlistend=limit,
+        ignoreerrors=True,
+        compat_opts=["no-youtube-unavailable-videos"],
+    ).extract_info(link, download=False)
+    return [entry["id"] for entry in info.get("entries") or [] if entry]
+
+
+OPS = {"url": stream_url, "playlist": playlist}
+
+
+def reply(response: dict):
+    line = json.dumps(response) + "\n"
+    with write_lock:
+        output.write(line)
+        output.flush()
+
+
+def handle(request: dict):
+    try:
+        result = OPS[request["op"]](**request["args"])
+        reply({"id": request["id"], "ok": True, "result": result})
+    except BaseException as e:
+        reply({"id": request["id"], "ok": False, "error": str(e) or type(e).__name__})
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for line in sys.stdin:
+            if line.strip():
+                executor.submit(handle, json.loads(line))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+import aiohttp
+
+import config
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HTTPClient:
+    """
+    One ``aiohttp`` session shared by every platform module.
+
+    Connections are kept alive and pooled per host, DNS answers are cached,
+    and at most ``host_limit`` requests run against a single host at once.
+    Idempotent requests are retried ``retries`` times with jittered
+    exponential backoff on connection errors and 429/5xx responses.
+    The time to response headers is recorded per host for ``stats``; past
+    ``max_hosts`` distinct hosts, new ones are counted together as "other".
+    """
+
+    def __init__(
+        self,
+        timeout: float = 15,
+        retries: int = 2,
+        host_limit: int = 10,
+        max_hosts: int = 32,
+    ):
+        self.timeout = timeout
+        self.retries = retries
+        self.host_limit = host_limit
+        self.max_hosts = max_hosts
+        self._session = None
+        self._latency = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=self.host_limit,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                # No total limit so long downloads are not cut off.
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=self.timeout,
+                    sock_read=self.timeout,
+                ),
+            )
+        return self._session
+
+    def _record(self, host: str, elapsed: float, failed: bool = False):
+        if host not in self._latency and len(self._latency) >= self.max_hosts:
+            host = "other"
+        entry = self._latency.setdefault(host, [0, 0.0, 0.0, 0])
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] = max(entry[2], elapsed)
+        entry[3] += failed
+
+    async def _send(self, method: str, url: str, retries: int, **kwargs):
+        host = urlsplit(url).hostname or url
+        attempt = 0
+        while True:
+            start = time.monotonic()
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                self._record(host, time.monotonic() - start, failed=True)
+                if attempt >= retries:
+                    raise
+            else:
+                failed = response.status in RETRY_STATUSES
+                self._record(host, time.monotonic() - start, failed)
+                if not failed or attempt >= retries:
+                    return response
+                response.release()
+            attempt += 1
+            await asyncio.sleep(random.uniform(0, 0.5 * 2**attempt))
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, retries: int = None, **kwargs):
+        """``session.request`` with retries; only GET and HEAD retry by default."""
+        if retries is None:
+            retries = self.retries if method in ("GET", "HEAD") else 0
+        if isinstance(kwargs.get("timeout"), (int, float)):
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=kwargs["timeout"])
+        response = await self._send(method, url, retries, **kwargs)
+        try:
+            yield response
+        finally:
+            response.release()
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    def stats(self, limit: int = None) -> dict:
+        """
+        Requests, average and worst latency in ms and failures per host,
+        busiest first; only the ``limit`` busiest hosts when given.
+        """
+        busiest = sorted(self._latency.items(), key=lambda x: x[1][0], reverse=True)
+        return {
+            host: {
+                "requests": count,
+                "avg": int(total / count * 1000),
+                "max": int(worst * 1000),
+                "failed": failed,
+            }
+            for host, (count, total, worst, failed) in busiest[:limit]
+        }
+
+
+http = HTTPClient(config.HTTP_TIMEOUT, config.HTTP_RETRIES, config.HTTP_HOST_LIMIT)
@@ -0,0 +1,178 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import json
+import logging
+import os
+import threading
+import time
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class MediaCache:
+    """
+    Persistent index of downloaded media kept under a disk quota.
+
+    Entries are keyed by (source, id, format) and remember the file, its
+    size, the last time it was played and how often it was reused. The
+    index is stored next to the files so it survives restarts; changes
+    are written at most every ``save_delay`` seconds and on ``close``. When
+    the quota is exceeded the least recently used files that are not queued
+    anywhere are removed.
+    """
+
+    def __init__(
+        self,
+        path: str = "downloads",
+        quota: int = 2048 * 1024 * 1024,
+        save_delay: float = 30,
+    ):
+        self.path = path
+        self.quota = quota
+        self.save_delay = save_delay
+        self.index_path = os.path.join(path, ".index.json")
+        self._lock = threading.RLock()
+        self._index = {}
+        self._files = {}
+        self._used = 0
+        self._dirty = False
+        self._timer = None
+        self.hits = 0
+        self.evictions = 0
+        self._load()
+
+    @staticmethod
+    def _key(source: str, id: str, fmt: str) -> str:
+        return f"{source}|{id}|{fmt}"
+
+    def _load(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        for key, entry in index.items():
+            if os.path.exists(entry["file"]):
+                self._index[key] = entry
+                self._files[os.path.abspath(entry["file"])] = key
+                self._used += entry["size"]
+
+    def _save(self):
+        os.makedirs(self.path, exist_ok=True)
+        tmp = f"{self.index_path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            logger.warning(f"Failed to save media cache index: {e}")
+
+    def _changed(self):
+        self._dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(self.save_delay, self.save)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def save(self):
+        """Write the index now if it changed since the last save."""
+        with self._lock:
+            self._timer = None
+            if self._dirty:
+                self._dirty = False
+                self._save()
+
+    def close(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self.save()
+
+    def size(self) -> int:
+        return self._used
+
+    def owns(self, file: str) -> bool:
+        return os.path.abspath(file) in self._files
+
+    def get(self, source: str, id: str, fmt: str) -> str | None:
+        with self._lock:
+            key = self._key(source, id, fmt)
+            entry = self._index.get(key)
+            if not entry:
+                return None
+            if not os.path.exists(entry["file"]):
+                self._forget(key)
+                self._changed()
+                return None
+            entry["hits"] += 1
+            entry["last_access"] = time.time()
+            self.hits += 1
+            self._changed()
+            return entry["file"]
+
+    def add(self, source: str, id: str, fmt: str, file: str):
+        with self._lock:
+            key = self._key(source, id, fmt)
+            self._forget(key)
+            self._index[key] = {
+                "file": file,
+                "size": os.path.getsize(file),
+                "last_access": time.time(),
+                "hits": 0,
+            }
+            self._files[os.path.abspath(file)] = key
+            self._used += self._index[key]["size"]
+            self.evict(keep=key)
+            self._changed()
+
+    def _forget(self, key: str):
+        entry = self._index.pop(key, None)
+        if entry:
+            self._files.pop(os.path.abspath(entry["file"]), None)
+            self._used -= entry["size"]
+
+    def evict(self, keep: str = None):
+        with self._lock:
+            used = self.size()
+            if used <= self.quota:
+                return
+            in_use = {os.path.abspath(file) for file in config.autoclean}
+            queued = {file[4:] for file in config.autoclean if file.startswith("vid_")}
+            entries = sorted(self._index.items(), key=lambda x: x[1]["last_access"])
+            for key, entry in entries:
+                if used <= self.quota:
+                    break
+                if (
+                    key == keep
+                    or os.path.abspath(entry["file"]) in in_use
+                    or key.split("|")[1] in queued
+                ):
+                    continue
+                try:
+                    os.remove(entry["file"])
+                except OSError:
+                    pass
+                used -= entry["size"]
+                self._forget(key)
+                self.evictions += 1
+                self._changed()
+
+    def stats(self) -> dict:
+        return {
+            "files": len(self._index),
+            "size": self.size(),
+            "hits": self.hits,
+            "evictions": self.evictions,
+        }
+
+
+mediacache = MediaCache(quota=config.MEDIA_CACHE_SIZE * 1024 * 1024)
@@ -12,17 +12,21 @@ import os
 
 from config import autoclean
 from YukkiMusic.utils.decorators import asyncify
+from YukkiMusic.utils.mediacache import mediacache
+from YukkiMusic.utils.stream.models import ChatQueue, QueueItem
 
 
 @asyncify
 def auto_clean(popped):
     def _auto_clean(popped_item):
         try:
-            rem = popped_item["file"]
+            rem = popped_item.file
             autoclean.remove(rem)
             count = autoclean.count(rem)
             if count == 0:
-                if "vid_" not in rem and "live_" not in rem and "index_" not in rem:
+                if popped_item.local:
+                    if mediacache.owns(rem):
+                        return mediacache.evict()
                     try:
                         os.remove(rem)
                     except Exception:
@@ -30,10 +34,10 @@ def auto_clean(popped):
         except Exception:
             pass
 
-    if isinstance(popped, dict):
+    if isinstance(popped, QueueItem):
         _auto_clean(popped)
-    elif isinstance(popped, list):
+    elif isinstance(popped, (ChatQueue, list)):
         for pop in popped:
             _auto_clean(pop)
     else:
-        raise ValueError("Expected popped to be a dict or list.")
+        raise ValueError("Expected popped to be a QueueItem or ChatQueue.")
@@ -0,0 +1,124 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import random
+from collections import deque
+from enum import Enum
+
+
+class Source(Enum):
+    YOUTUBE = "youtube"  # queued as vid_<id>, downloaded when it starts
+    LIVE = "live"  # youtube live stream, resolved to a url when it starts
+    INDEX = "index"  # m3u8 / index link played as is
+    TELEGRAM = "telegram"
+    SOUNDCLOUD = "soundcloud"
+    SAAVN = "saavn"
+    FILE = "file"  # youtube track that was already downloaded
+
+    @classmethod
+    def detect(cls, file: str, vidid: str) -> "Source":
+        if "live_" in file:
+            return cls.LIVE
+        if "vid_" in file:
+            return cls.YOUTUBE
+        if "index_" in file:
+            return cls.INDEX
+        if vidid == "telegram":
+            return cls.TELEGRAM
+        if vidid == "soundcloud":
+            return cls.SOUNDCLOUD
+        if "saavn" in vidid:
+            return cls.SAAVN
+        return cls.FILE
+
+
+class QueueItem:
+    """A single track in a chat's queue."""
+
+    __slots__ = (
+        "title",
+        "dur",
+        "streamtype",
+        "by",
+        "chat_id",
+        "file",
+        "vidid",
+        "seconds",
+        "url",
+        "source",
+        "mystic",
+        "markup",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        dur: str,
+        streamtype: str,
+        by: str,
+        chat_id: int,
+        file: str,
+        vidid: str,
+        seconds: int = 0,
+        url: str = None,
+    ):
+        self.title = title
+        self.dur = dur
+        self.streamtype = streamtype
+        self.by = by
+        self.chat_id = chat_id
+        self.file = file
+        self.vidid = vidid
+        self.seconds = seconds
+        self.url = url
+        self.source = Source.detect(file, vidid)
+        self.mystic = None
+        self.markup = None
+
+    def __repr__(self):
+        return f"QueueItem({self.source.value}, {self.vidid!r}, {self.title!r})"
+
+    @property
+    def video(self) -> bool:
+        return str(self.streamtype) == "video"
+
+    @property
+    def local(self) -> bool:
+        """Whether ``file`` is a path on disk rather than a placeholder."""
+        return self.source not in (Source.YOUTUBE, Source.LIVE, Source.INDEX)
+
+    @property
+    def seekable(self) -> bool:
+        return self.seconds != 0 and self.source not in (Source.LIVE, Source.INDEX)
+
+
+class ChatQueue(deque):
+    """Queue of a chat; index 0 is the track that is playing."""
+
+    __slots__ = ()
+
+    def pop(self, index: int = -1) -> QueueItem:
+        if index == 0:
+            return self.popleft()
+        if index == -1:
+            return super().pop()
+        item = self[index]
+        del self[index]
+        return item
+
+    def shuffle(self):
+        """Shuffle the upcoming tracks, keeping the current one in place."""
+        if len(self) < 3:
+            return
+        current = self.popleft()
+        upcoming = list(self)
+        random.shuffle(upcoming)
+        self.clear()
+        self.append(current)
+        self.extend(upcoming)
@@ -0,0 +1,97 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import logging
+
+import config
+from YukkiMusic.misc import db
+from YukkiMusic.platforms import youtube
+from YukkiMusic.utils.database import is_on_off
+from YukkiMusic.utils.stream.models import Source
+
+logger = logging.getLogger(__name__)
+
+
+class Prefetcher:
+    """
+    Downloads the next queued YouTube track of a chat in the background.
+
+    Each chat has at most one prefetch task, tied to the entry at position
+    1 of its queue. Rescheduling after the queue changes cancels a task
+    whose target is no longer next, and ``limit`` bounds how many
+    prefetches run across all chats at once.
+    """
+
+    def __init__(self, limit: int = 3):
+        self.limit = limit
+        self.semaphore = asyncio.Semaphore(max(limit, 1))
+        self._tasks = {}
+        self.started = 0
+        self.done = 0
+        self.cancelled = 0
+
+    @staticmethod
+    def _target(chat_id: int):
+        check = db.get(chat_id)
+        if not check or len(check) < 2:
+            return None
+        entry = check[1]
+        if entry.source is not Source.YOUTUBE:
+            return None
+        return entry.vidid, entry.video
+
+    def schedule(self, chat_id: int):
+        if not self.limit or youtube.use_fallback:
+            return
+        target = self._target(chat_id)
+        running = self._tasks.get(chat_id)
+        if running:
+            if running[0] == target:
+                return
+            self.cancel(chat_id)
+        if target:
+            task = asyncio.create_task(self._prefetch(chat_id, *target))
+            self._tasks[chat_id] = (target, task)
+
+    def cancel(self, chat_id: int):
+        running = self._tasks.pop(chat_id, None)
+        if running and not running[1].done():
+            running[1].cancel()
+            self.cancelled += 1
+
+    async def _prefetch(self, chat_id: int, vidid: str, video: bool):
+        try:
+            if video and not await is_on_off(config.YTDOWNLOADER):
+                return
+            async with self.semaphore:
+                self.started += 1
+                await youtube.download(
+                    vidid, None, videoid=True, video=video, progressive=False
+                )
+                self.done += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"Prefetch of {vidid} for {chat_id} failed: {e}")
+        finally:
+            running = self._tasks.get(chat_id)
+            if running and running[1] is asyncio.current_task():
+                del self._tasks[chat_id]
+
+    def stats(self) -> dict:
+        return {
+            "running": len(self._tasks),
+            "started": self.started,
+            "done": self.done,
+            "cancelled": self.cancelled,
+        }
+
+
+prefetcher = Prefetcher(config.PREFETCH_LIMIT)
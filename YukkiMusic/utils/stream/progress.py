@@ -0,0 +1,148 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import heapq
+import logging
+import time
+
+from pyrogram.errors import FloodWait, MessageNotModified
+from pyrogram.types import InlineKeyboardMarkup
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Global limiter shared by every Telegram edit call."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def penalize(self, seconds: float):
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+
+class ProgressUpdater:
+    """
+    Schedules progress-bar edits for the stream messages of active chats.
+
+    Chats live in a heap keyed by the time their next edit is due, so each
+    wake-up only touches the chats that are actually due instead of
+    sweeping every active chat.
+    """
+
+    def __init__(
+        self,
+        interval: float = 5,
+        rate: float = 20,
+        burst: int = 20,
+        concurrency: int = 10,
+    ):
+        self.interval = interval
+        self.bucket = TokenBucket(rate, burst)
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self._heap = []
+        self._due = {}
+        self._last = {}
+        self._wakeup = asyncio.Event()
+        self.sent = 0
+        self.skipped = 0
+        self.flood_delayed = 0
+
+    def schedule(self, chat_id: int, delay: float = 0):
+        due = time.monotonic() + delay
+        self._due[chat_id] = due
+        heapq.heappush(self._heap, (due, chat_id))
+        self._wakeup.set()
+
+    def discard(self, chat_id: int):
+        self._due.pop(chat_id, None)
+        self._last.pop(chat_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "scheduled": len(self._due),
+            "sent": self.sent,
+            "skipped": self.skipped,
+            "flood_delayed": self.flood_delayed,
+        }
+
+    async def _update(self, chat_id: int, render):
+        delay = self.interval
+        async with self.semaphore:
+            try:
+                rendered = await render(chat_id)
+                if rendered:
+                    mystic, buttons = rendered
+                    key = (mystic.id, repr(buttons))
+                    if self._last.get(chat_id) == key:
+                        self.skipped += 1
+                    else:
+                        await self.bucket.acquire()
+                        await mystic.edit_reply_markup(
+                            reply_markup=InlineKeyboardMarkup(buttons)
+                        )
+                        self._last[chat_id] = key
+                        self.sent += 1
+            except FloodWait as e:
+                self.flood_delayed += 1
+                self.bucket.penalize(e.value)
+                delay = max(delay, e.value)
+            except MessageNotModified:
+                self.skipped += 1
+            except Exception:
+                pass
+        if chat_id in self._due:
+            self.schedule(chat_id, delay)
+
+    async def run(self, render):
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            due, chat_id = self._heap[0]
+            now = time.monotonic()
+            if due > now:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), due - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self._heap)
+            if self._due.get(chat_id) != due:
+                continue
+            asyncio.create_task(self._update(chat_id, render))
+
+
+progress = ProgressUpdater()
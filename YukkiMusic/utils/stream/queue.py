@@ -9,9 +9,12 @@
 #
 
 
-from config import autoclean, chatstats, userstats
+from config import autoclean
 from config.config import time_to_seconds
 from YukkiMusic.misc import db
+from YukkiMusic.utils.database import stats_writer
+from YukkiMusic.utils.stream.models import ChatQueue, QueueItem
+from YukkiMusic.utils.stream.prefetch import prefetcher
 
 
 async def put_queue(
@@ -32,37 +35,26 @@ async def put_queue(
         duration_in_seconds = time_to_seconds(duration) - 3
     except Exception:
         duration_in_seconds = 0
-    put = {
-        "title": title,
-        "dur": duration,
-        "streamtype": stream,
-        "by": user,
-        "chat_id": original_chat_id,
-        "file": file,
-        "vidid": vidid,
-        "seconds": duration_in_seconds,
-        "played": 0,
-        "url": url,
-    }
+    put = QueueItem(
+        title,
+        duration,
+        stream,
+        user,
+        original_chat_id,
+        file,
+        vidid,
+        seconds=duration_in_seconds,
+        url=url,
+    )
+    queue = db.setdefault(chat_id, ChatQueue())
     if forceplay:
-        if check := db.get(chat_id):
-            check.insert(0, put)
-        else:
-            db[chat_id] = []
-            db[chat_id].append(put)
+        queue.appendleft(put)
     else:
-        db[chat_id].append(put)
+        queue.append(put)
     autoclean.append(file)
+    prefetcher.schedule(chat_id)
     vidid = "telegram" if vidid == "soundcloud" or "saavn" in vidid else vidid
-
-    to_append = {"vidid": vidid, "title": title}
-    if chat_id not in chatstats:
-        chatstats[chat_id] = []
-    chatstats[chat_id].append(to_append)
-    if user_id not in userstats:
-        userstats[user_id] = []
-    userstats[user_id].append(to_append)
-    return
+    await stats_writer.record(chat_id, user_id, vidid, title)
 
 
 async def put_queue_index(
@@ -76,22 +68,9 @@ async def put_queue_index(
     stream,
     forceplay: bool | str = None,
 ):
-    put = {
-        "title": title,
-        "dur": duration,
-        "streamtype": stream,
-        "by": user,
-        "chat_id": original_chat_id,
-        "file": file,
-        "vidid": vidid,
-        "seconds": 0,
-        "played": 0,
-    }
+    put = QueueItem(title, duration, stream, user, original_chat_id, file, vidid)
+    queue = db.setdefault(chat_id, ChatQueue())
     if forceplay:
-        if check := db.get(chat_id):
-            check.insert(0, put)
-        else:
-            db[chat_id] = []
-            db[chat_id].append(put)
+        queue.appendleft(put)
     else:
-        db[chat_id].append(put)
+        queue.append(put)
@@ -8,8 +8,13 @@
 # All rights reserved.
 #
 
+import asyncio
 import os
+import time
 import traceback
+from collections import deque
+from contextlib import aclosing
+from itertools import islice
 from random import randint
 
 from pyrogram.types import InlineKeyboardMarkup
@@ -29,9 +34,44 @@ from YukkiMusic.utils.exceptions import AssistantErr
 from YukkiMusic.utils.inline.play import stream_markup, telegram_markup
 from YukkiMusic.utils.inline.playlist import close_markup
 from YukkiMusic.utils.pastebin import Yukkibin
+from YukkiMusic.utils.stream.models import ChatQueue
+from YukkiMusic.utils.stream.progress import progress
 from YukkiMusic.utils.stream.queue import put_queue, put_queue_index
 from YukkiMusic.utils.thumbnails import gen_qthumb, gen_thumb
 
+PLAYLIST_WORKERS = 5
+PLAYLIST_PROGRESS_INTERVAL = 3
+
+
+async def resolve_playlist(items: list, videoid: bool):
+    """
+    Yield ``youtube.details`` of each item in playlist order, or None for
+    items that fail. Up to ``PLAYLIST_WORKERS`` lookups run ahead of the
+    consumer, so the first track is ready after one round trip no matter
+    how long the playlist is.
+    """
+
+    async def resolve(search):
+        try:
+            return await youtube.details(search, videoid)
+        except Exception:
+            return None
+
+    items = iter(items)
+    window = deque(
+        asyncio.create_task(resolve(search))
+        for search in islice(items, PLAYLIST_WORKERS)
+    )
+    try:
+        while window:
+            detail = await window.popleft()
+            for search in islice(items, 1):
+                window.append(asyncio.create_task(resolve(search)))
+            yield detail
+    finally:
+        for task in window:
+            task.cancel()
+
 
 async def stream(
     _,
@@ -56,79 +96,96 @@ async def stream(
     if streamtype == "playlist":
         msg = f"{_['playlist_16']}\n\n"
         count = 0
-        for search in result:
-            if int(count) == config.PLAYLIST_FETCH_LIMIT:
-                continue
-            try:
-                (
-                    title,
-                    duration_min,
-                    duration_sec,
-                    thumbnail,
-                    vidid,
-                ) = await youtube.details(search, False if spotify else True)
-            except Exception:
-                continue
-            if str(duration_min) == "None":
-                continue
-            if duration_sec > config.DURATION_LIMIT:
-                continue
-            if await is_active_chat(chat_id):
-                await put_queue(
-                    chat_id,
-                    original_chat_id,
-                    f"vid_{vidid}",
-                    title,
-                    duration_min,
-                    user_name,
-                    vidid,
-                    user_id,
-                    "video" if video else "audio",
-                )
-                position = len(db.get(chat_id)) - 1
-                count += 1
-                msg += f"{count}- {title[:70]}\n"
-                msg += f"{_['playlist_17']} {position}\n\n"
-            else:
-                if not forceplay:
-                    db[chat_id] = []
-                status = True if video else None
-                try:
-                    file_path, direct = await youtube.download(
-                        vidid, mystic, video=status, videoid=True
+        total = min(len(result), config.PLAYLIST_FETCH_LIMIT)
+        edited = time.monotonic()
+        async with aclosing(
+            resolve_playlist(result, False if spotify else True)
+        ) as details:
+            async for detail in details:
+                if count == config.PLAYLIST_FETCH_LIMIT:
+                    break
+                if detail is None:
+                    continue
+                title, duration_min, duration_sec, thumbnail, vidid = detail
+                if str(duration_min) == "None":
+                    continue
+                if duration_sec > config.DURATION_LIMIT:
+                    continue
+                if await is_active_chat(chat_id):
+                    await put_queue(
+                        chat_id,
+                        original_chat_id,
+                        f"vid_{vidid}",
+                        title,
+                        duration_min,
+                        user_name,
+                        vidid,
+                        user_id,
+                        "video" if video else "audio",
                     )
-                except Exception:
-                    raise AssistantErr(_["play_16"])
-                await Yukki.join_call(
-                    chat_id, original_chat_id, file_path, video=status, image=thumbnail
-                )
-                await put_queue(
-                    chat_id,
-                    original_chat_id,
-                    file_path if direct else f"vid_{vidid}",
-                    title,
-                    duration_min,
-                    user_name,
-                    vidid,
-                    user_id,
-                    "video" if video else "audio",
-                    forceplay=forceplay,
-                )
-                img = await gen_thumb(vidid)
-                button = stream_markup(_, vidid, chat_id)
-                run = await app.send_photo(
-                    original_chat_id,
-                    photo=img,
-                    caption=_["stream_1"].format(
-                        title[:27],
-                        f"https://t.me/{app.username}?start=info_{vidid}",
+                    position = len(db.get(chat_id)) - 1
+                    count += 1
+                    msg += f"{count}- {title[:70]}\n"
+                    msg += f"{_['playlist_17']} {position}\n\n"
+                    if time.monotonic() - edited >= PLAYLIST_PROGRESS_INTERVAL:
+                        edited = time.monotonic()
+                        try:
+                            await progress.bucket.acquire()
+                            await mystic.edit_text(
+                                _["playlist_26"].format(count, total)
+                            )
+                        except Exception:
+                            pass
+                else:
+                    if not forceplay:
+                        db[chat_id] = ChatQueue()
+                    status = True if video else None
+                    try:
+                        file_path, direct = await youtube.download(
+                            vidid, mystic, video=status, videoid=True
+                        )
+                    except Exception:
+                        raise AssistantErr(_["play_16"])
+                    try:
+                        await Yukki.join_call(
+                            chat_id,
+                            original_chat_id,
+                            file_path,
+                            video=status,
+                            image=thumbnail,
+                        )
+                    except Exception:
+                        if not direct:
+                            # The direct link may have been rejected.
+                            youtube.invalidate_url(vidid, True)
+                        raise
+                    await put_queue(
+                        chat_id,
+                        original_chat_id,
+                        file_path if direct else f"vid_{vidid}",
+                        title,
                         duration_min,
                         user_name,
-                    ),
-                    reply_markup=InlineKeyboardMarkup(button),
-                )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "stream"
+                        vidid,
+                        user_id,
+                        "video" if video else "audio",
+                        forceplay=forceplay,
+                    )
+                    img = await gen_thumb(vidid)
+                    button = stream_markup(_, vidid, chat_id)
+                    run = await app.send_photo(
+                        original_chat_id,
+                        photo=img,
+                        caption=_["stream_1"].format(
+                            title[:27],
+                            f"https://t.me/{app.username}?start=info_{vidid}",
+                            duration_min,
+                            user_name,
+                        ),
+                        reply_markup=InlineKeyboardMarkup(button),
+                    )
+                    db[chat_id][0].mystic = run
+                    db[chat_id][0].markup = "stream"
         if count == 0:
             return
         else:
@@ -209,10 +266,16 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
-            await Yukki.join_call(
-                chat_id, original_chat_id, file_path, video=status, image=thumbnail
-            )
+                db[chat_id] = ChatQueue()
+            try:
+                await Yukki.join_call(
+                    chat_id, original_chat_id, file_path, video=status, image=thumbnail
+                )
+            except Exception:
+                if not direct:
+                    # The direct link may have been rejected.
+                    youtube.invalidate_url(vidid, True)
+                raise
             await put_queue(
                 chat_id,
                 original_chat_id,
@@ -238,8 +301,8 @@ async def stream(
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "stream"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "stream"
 
     elif "saavn" in streamtype:
         if streamtype == "saavn_track":
@@ -274,7 +337,7 @@ async def stream(
                 )
             else:
                 if not forceplay:
-                    db[chat_id] = []
+                    db[chat_id] = ChatQueue()
                 await Yukki.join_call(chat_id, original_chat_id, file_path, video=None)
                 await put_queue(
                     chat_id,
@@ -298,8 +361,8 @@ async def stream(
                     ),
                     reply_markup=InlineKeyboardMarkup(button),
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "tg"
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "tg"
 
         elif streamtype == "saavn_playlist":
             msg = f"{_['playlist_16']}\n\n"
@@ -333,7 +396,7 @@ async def stream(
 
                 else:
                     if not forceplay:
-                        db[chat_id] = []
+                        db[chat_id] = ChatQueue()
                     await Yukki.join_call(
                         chat_id, original_chat_id, file_path, video=None
                     )
@@ -359,8 +422,8 @@ async def stream(
                         ),
                         reply_markup=InlineKeyboardMarkup(button),
                     )
-                    db[chat_id][0]["mystic"] = run
-                    db[chat_id][0]["markup"] = "tg"
+                    db[chat_id][0].mystic = run
+                    db[chat_id][0].markup = "tg"
             if count == 0:
                 return
             else:
@@ -402,7 +465,7 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
+                db[chat_id] = ChatQueue()
             await Yukki.join_call(chat_id, original_chat_id, file_path, video=None)
             await put_queue(
                 chat_id,
@@ -425,8 +488,8 @@ async def stream(
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
     elif streamtype == "telegram":
         file_path = result["path"]
         link = result["link"]
@@ -452,7 +515,7 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
+                db[chat_id] = ChatQueue()
             await Yukki.join_call(chat_id, original_chat_id, file_path, video=status)
             await put_queue(
                 chat_id,
@@ -475,8 +538,8 @@ async def stream(
                 caption=_["stream_1"].format(title, link, duration_min, user_name),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
     elif streamtype == "live":
         link = result["link"]
         vidid = result["vidid"]
@@ -503,7 +566,7 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
+                db[chat_id] = ChatQueue()
             n, file_path = await youtube.video(link)
             if n == 0:
                 raise AssistantErr(_["str_3"])
@@ -539,8 +602,8 @@ async def stream(
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
     elif streamtype == "index":
         link = result
         title = "Index or M3u8 Link"
@@ -562,7 +625,7 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
+                db[chat_id] = ChatQueue()
             await Yukki.join_call(
                 chat_id,
                 original_chat_id,
@@ -587,6 +650,6 @@ async def stream(
                 caption=_["stream_2"].format(user_name),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
             await mystic.delete()
@@ -140,6 +140,28 @@ YOUTUBE_DOWNLOAD_EDIT_SLEEP = int(getenv("YOUTUBE_EDIT_SLEEP", "3"))
 # Time sleep duration For Telegram Downloader
 TELEGRAM_DOWNLOAD_EDIT_SLEEP = int(getenv("TELEGRAM_EDIT_SLEEP", "5"))
 
+# Number of youtube audio and video downloads allowed to run at the same time
+AUDIO_DOWNLOAD_WORKERS = int(getenv("AUDIO_DOWNLOAD_WORKERS", "4"))
+VIDEO_DOWNLOAD_WORKERS = int(getenv("VIDEO_DOWNLOAD_WORKERS", "2"))
+
+# Disk space in MB the downloaded youtube tracks may use before old ones are removed
+MEDIA_CACHE_SIZE = int(getenv("MEDIA_CACHE_SIZE", "2048"))
+
+# Number of upcoming youtube tracks downloaded ahead of time across all chats, 0 to disable
+PREFETCH_LIMIT = int(getenv("PREFETCH_LIMIT", "3"))
+
+# Start youtube audio from its direct link while the file downloads in the background
+PROGRESSIVE_AUDIO = is_bool(getenv("PROGRESSIVE_AUDIO", "True"))
+
+# Seconds to wait on a stalled http connection, retries for failed requests and
+# requests allowed to one host at the same time, used by every platform module
+HTTP_TIMEOUT = int(getenv("HTTP_TIMEOUT", "15"))
+HTTP_RETRIES = int(getenv("HTTP_RETRIES", "2"))
+HTTP_HOST_LIMIT = int(getenv("HTTP_HOST_LIMIT", "10"))
+
+# Number of background yt-dlp processes used to look up stream links and youtube playlists
+EXTRACTOR_WORKERS = int(getenv("EXTRACTOR_WORKERS", "2"))
+
 
 # Your Github Repo.. Will be shown on /start Command
 GITHUB_REPO = getenv("GITHUB_REPO", "https://github.com/TheTeamVivek/YukkiMusic")
@@ -198,10 +220,7 @@ BANNED_USERS = _flt.user()
 YTDOWNLOADER = 1
 LOG = 2
 LOG_FILE_NAME = "logs.txt"
-adminlist = {}
 lyrical = {}
-chatstats = {}
-userstats = {}
 clean = {}
 
 autoclean = []
@@ -0,0 +1,91 @@
+#
+# Copyright (C) 2024-2025 by TheTeamVivek@Github, < https://github.com/TheTeamVivek >.
+#
+# This file is part of < https://github.com/TheTeamVivek/YukkiMusic > project,
+# and is released under the MIT License.
+# Please see < https://github.com/TheTeamVivek/YukkiMusic/blob/master/LICENSE >
+#
+# All rights reserved.
+#
+import asyncio
+import importlib.util
+import time
+from pathlib import Path
+
+import pytest
+
+types = pytest.importorskip("pytgcalls.types")
+GroupCallParticipant = types.GroupCallParticipant
+UpdatedGroupCallParticipant = types.UpdatedGroupCallParticipant
+
+# Loaded by path: importing the YukkiMusic package starts the bot.
+_path = Path(__file__).parents[1] / "YukkiMusic" / "core" / "callmembers.py"
+_spec = importlib.util.spec_from_file_location("callmembers", _path)
+callmembers = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(callmembers)
+
+CHAT_ID = -1001
+
+
+def participant(user_id, muted=False, muted_by_admin=False):
+    return GroupCallParticipant(
+        user_id=user_id,
+        muted=muted,
+        muted_by_admin=muted_by_admin,
+        video=False,
+        screen_sharing=False,
+        video_camera=False,
+        raised_hand=False,
+        volume=100,
+        source=0,
+        video_info=None,
+        presentation_info=None,
+    )
+
+
+def send(cache, action, member):
+    update = UpdatedGroupCallParticipant(CHAT_ID, action, member)
+    asyncio.run(cache.on_participant(None, update))
+
+
+def snapshot(*user_ids):
+    cache = callmembers.CallMembersCache()
+    members = [callmembers._EventMember(participant(i)) for i in user_ids]
+    cache._members[CHAT_ID] = (time.monotonic(), members)
+    return cache
+
+
+def ids(cache):
+    return [member.chat.id for member in cache._members[CHAT_ID][1]]
+
+
+def test_joined_is_added():
+    cache = snapshot(1)
+    send(cache, GroupCallParticipant.Action.JOINED, participant(2))
+    assert ids(cache) == [1, 2]
+
+
+def test_left_and_kicked_are_removed():
+    cache = snapshot(1, 2, 3)
+    send(cache, GroupCallParticipant.Action.LEFT, participant(2))
+    send(cache, GroupCallParticipant.Action.KICKED, participant(3))
+    assert ids(cache) == [1]
+
+
+def test_updated_refreshes_mute_flags():
+    cache = snapshot(1)
+    send(
+        cache,
+        GroupCallParticipant.Action.UPDATED,
+        participant(1, muted=True, muted_by_admin=True),
+    )
+    (member,) = cache._members[CHAT_ID][1]
+    assert member.is_muted
+    assert not member.can_self_unmute
+
+
+def test_update_without_snapshot_only_bumps_generation():
+    cache = callmembers.CallMembersCache()
+    send(cache, GroupCallParticipant.Action.JOINED, participant(1))
+    assert CHAT_ID not in cache._members
+    assert cache._generation[CHAT_ID] == 1